@@ -1,4 +1,4 @@
-from redback import constants, get_data, redback_errors, priors, result, sampler, transient, transient_models, \
-    utils, photosphere, sed, interaction_processes, constraints, plotting
+from redback import constants, get_data, redback_errors, priors, profiling, result, sampler, transient, \
+    transient_models, utils, photosphere, sed, interaction_processes, constraints, plotting, simulate, filters
 from redback.transient import afterglow, kilonova, prompt, supernova, tde
 from redback.sampler import fit_model
@@ -0,0 +1,4 @@
+from redback.benchmarks import integration, models
+from redback.benchmarks.integration import benchmark_band_integration
+from redback.benchmarks.models import DEFAULT_THRESHOLD, benchmark_model, compare_to_baseline, \
+    get_benchmark_models, load_results, run_benchmarks, save_results
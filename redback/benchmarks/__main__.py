@@ -0,0 +1,46 @@
+import argparse
+import sys
+
+from redback.benchmarks.models import DEFAULT_THRESHOLD, compare_to_baseline, run_benchmarks
+
+
+def main(args: list = None) -> int:
+    """Runs the model benchmarks from the command line, e.g.
+    `python -m redback.benchmarks --output benchmarks.json --baseline baseline.json`.
+
+    :param args: Command line arguments. Default is `sys.argv[1:]`.
+    :type args: list, optional
+    :return: Exit code. 1 if any model regressed against the baseline, 0 otherwise.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog='python -m redback.benchmarks', description='Benchmark redback models.')
+    parser.add_argument('--models', nargs='+', default=None, help='Models to benchmark. Default is all models.')
+    parser.add_argument('--output', default=None, help='Save the results as JSON into this file.')
+    parser.add_argument('--baseline', default=None, help='Compare against the results in this JSON file.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed relative slowdown against the baseline.')
+    parser.add_argument('--n-times', type=int, default=50, help='Number of times per model call.')
+    parser.add_argument('--n-calls', type=int, default=20, help='Number of calls for the single-call latency.')
+    parser.add_argument('--batch-size', type=int, default=50, help='Number of parameter draws for the throughput.')
+    args = parser.parse_args(args)
+
+    benchmarks = run_benchmarks(models=args.models, filename=args.output, n_times=args.n_times,
+                                n_calls=args.n_calls, batch_size=args.batch_size)
+    print(f"{'model':45s} {'status':8s} {'latency [ms]':>13s} {'throughput [1/s]':>17s}")
+    for model, result in benchmarks['results'].items():
+        if result['status'] == 'ok':
+            print(f"{model:45s} {'ok':8s} {1e3 * result['latency_median']:13.3f} {result['throughput']:17.1f}")
+        else:
+            print(f"{model:45s} {result['status']:8s} {result['reason']}")
+    if args.baseline is None:
+        return 0
+
+    regressions = compare_to_baseline(benchmarks, baseline=args.baseline, threshold=args.threshold)
+    for regression in regressions:
+        print(f"Regression in {regression['model']}: {regression['metric']} went from {regression['baseline']:.4g} "
+              f"to {regression['current']:.4g} ({regression['slowdown']:.2f}x slower)")
+    return int(len(regressions) > 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
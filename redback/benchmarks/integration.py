@@ -0,0 +1,59 @@
+import time
+
+import numpy as np
+
+import redback.transient_models.integrated_flux_afterglow_models as integrated_flux_afterglow_models
+from redback.benchmarks.models import draw_parameters
+
+DEFAULT_SETTINGS = dict(simpson=dict(integration_method='simpson'),
+                        gauss_legendre=dict(integration_method='gauss_legendre'),
+                        gauss_legendre_1e_2=dict(integration_method='gauss_legendre', tolerance=1e-2),
+                        gauss_legendre_1e_3=dict(integration_method='gauss_legendre', tolerance=1e-3))
+
+
+def benchmark_band_integration(
+        base_model: str = 'tophat', frequency: list = None, settings: dict = None, n_draws: int = 20,
+        n_times: int = 20, reference_n_nodes: int = 256) -> dict:
+    """Measures the accuracy and cost of the integration methods of
+    `redback.transient_models.integrated_flux_afterglow_models.integrated_flux_afterglowpy_base_model`
+    for parameters drawn from the default priors of the base model.
+
+    :param base_model: Name of the afterglow base model.
+    :type base_model: str, optional
+    :param frequency: Lower and upper frequency of the band in Hz. Default is 0.3-10 keV.
+    :type frequency: list, optional
+    :param settings: Dictionary mapping a name to the keyword arguments that choose the integration method.
+                     Default is `DEFAULT_SETTINGS`.
+    :type settings: dict, optional
+    :param n_draws: Number of parameter draws.
+    :type n_draws: int, optional
+    :param n_times: Number of log-spaced times between 0.01 and 30 days.
+    :type n_times: int, optional
+    :param reference_n_nodes: Number of Gauss-Legendre nodes of the reference integral.
+    :type reference_n_nodes: int, optional
+    :return: Dictionary mapping the name of each setting to the 'median_error' and 'max_error' over the draws of
+             the largest relative error over the light curve, and the 'time' per call in seconds.
+    :rtype: dict
+    """
+    if frequency is None:
+        frequency = [7.25e16, 2.42e18]
+    if settings is None:
+        settings = DEFAULT_SETTINGS
+    function = integrated_flux_afterglow_models.integrated_flux_afterglowpy_base_model
+    times = np.geomspace(0.01, 30, n_times)
+    kwargs = dict(base_model=base_model, frequency=frequency, output_format='flux_density')
+    draws = draw_parameters(base_model, n=n_draws)
+    with np.errstate(all='ignore'):
+        references = [function(times, integration_method='gauss_legendre', n_nodes=reference_n_nodes,
+                               **kwargs, **draw) for draw in draws]
+    results = dict()
+    for name, setting in settings.items():
+        errors = []
+        start = time.perf_counter()
+        with np.errstate(all='ignore'):
+            for draw, reference in zip(draws, references):
+                integrated_flux = function(times, **setting, **kwargs, **draw)
+                errors.append(np.max(np.abs(integrated_flux / reference - 1)))
+        duration = (time.perf_counter() - start) / n_draws
+        results[name] = dict(median_error=float(np.median(errors)), max_error=float(np.max(errors)), time=duration)
+    return results
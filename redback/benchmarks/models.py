@@ -0,0 +1,213 @@
+import json
+import os
+import platform
+import time
+from typing import Union
+
+import bilby
+import numpy as np
+
+import redback.model_library
+from redback.utils import logger
+
+_priors_directory = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'priors')
+
+DEFAULT_THRESHOLD = 0.25
+
+_SECONDS_MODULES = ['fireball_models', 'magnetar_models', 'phenomenological_models', 'prompt_models']
+_MJD_MODULES = ['phase_models']
+_OPTICAL_FREQUENCIES = np.array([6.3e14, 4.8e14, 4.0e14])
+
+
+def get_benchmark_models() -> dict:
+    """
+    :return: All public model functions in `redback.model_library.all_models_dict` that are defined in
+             `redback.transient_models`, i.e. without the helper functions the model modules import.
+    :rtype: dict
+    """
+    return {name: function for name, function in redback.model_library.all_models_dict.items()
+            if not name.startswith('_') and function.__module__.startswith('redback.transient_models')}
+
+
+def draw_parameters(model: str, n: int = 1) -> list:
+    """Draws parameters from the default prior file of a model.
+
+    :param model: Name of the model.
+    :type model: str
+    :param n: Number of draws.
+    :type n: int, optional
+    :return: List of `n` parameter dictionaries.
+    :rtype: list
+    """
+    filename = os.path.join(_priors_directory, f'{model}.prior')
+    if not os.path.isfile(filename):
+        raise ValueError(f"No prior file for model {model}.")
+    priors = bilby.core.prior.PriorDict(filename=filename)
+    samples = priors.sample(n)
+    return [{key: value[i] for key, value in samples.items()} for i in range(n)]
+
+
+def get_times(function: callable, n_times: int = 50) -> np.ndarray:
+    """
+    :param function: The model function.
+    :type function: callable
+    :param n_times: Number of times.
+    :type n_times: int, optional
+    :return: Log-spaced times covering a typical light curve in the time units of the model module, i.e.
+             1 - 1e5 seconds, 0.1 - 100 days, or 0.1 - 100 days after MJD 55000.
+    :rtype: np.ndarray
+    """
+    module = function.__module__.split('.')[-1]
+    if module in _SECONDS_MODULES:
+        return np.geomspace(1, 1e5, n_times)
+    elif module in _MJD_MODULES:
+        return 55000 + np.geomspace(0.1, 100, n_times)
+    return np.geomspace(0.1, 100, n_times)
+
+
+def get_model_kwargs(n_times: int = 50) -> dict:
+    """
+    :param n_times: Number of times.
+    :type n_times: int, optional
+    :return: Keyword arguments for flux density output in three optical bands cycling through the times.
+    :rtype: dict
+    """
+    return dict(output_format='flux_density', frequency=np.resize(_OPTICAL_FREQUENCIES, n_times))
+
+
+def benchmark_model(model: str, n_times: int = 50, n_calls: int = 20, batch_size: int = 50) -> dict:
+    """Times a model on realistic times and frequencies with parameters drawn from its default priors.
+
+    :param model: Name of the model.
+    :type model: str
+    :param n_times: Number of times per call.
+    :type n_times: int, optional
+    :param n_calls: Number of repeated calls with the same parameters for the single-call latency.
+    :type n_calls: int, optional
+    :param batch_size: Number of different parameter draws for the throughput.
+    :type batch_size: int, optional
+    :return: Dictionary with the 'status' and, for successful runs, the 'first_call' time, the median and minimum
+             single-call latency 'latency_median' and 'latency_min' in seconds, the 'throughput' in calls per second,
+             and the fraction of 'failed_draws' in the batch. Skipped or failed runs give a 'reason' instead.
+    :rtype: dict
+    """
+    function = redback.model_library.all_models_dict[model]
+    try:
+        parameters = draw_parameters(model, n=batch_size + 1)
+    except ValueError as e:
+        return dict(status='skipped', reason=str(e))
+    except Exception as e:
+        return dict(status='failed', reason=f"Could not draw parameters: {e.__class__.__name__}: {e}")
+    times = get_times(function, n_times=n_times)
+    model_kwargs = get_model_kwargs(n_times=n_times)
+
+    try:
+        with np.errstate(all='ignore'):
+            start = time.perf_counter()
+            function(times, **parameters[0], **model_kwargs)
+            first_call = time.perf_counter() - start
+            latencies = []
+            for _ in range(n_calls):
+                start = time.perf_counter()
+                function(times, **parameters[0], **model_kwargs)
+                latencies.append(time.perf_counter() - start)
+    except Exception as e:
+        return dict(status='failed', reason=f"{e.__class__.__name__}: {e}")
+
+    failed_draws = 0
+    start = time.perf_counter()
+    with np.errstate(all='ignore'):
+        for draw in parameters[1:]:
+            try:
+                function(times, **draw, **model_kwargs)
+            except Exception:
+                failed_draws += 1
+    batch_time = time.perf_counter() - start
+    return dict(status='ok', n_times=n_times, first_call=first_call, latency_median=float(np.median(latencies)),
+                latency_min=float(np.min(latencies)), throughput=batch_size / batch_time,
+                failed_draws=failed_draws / batch_size)
+
+
+def run_benchmarks(models: list = None, filename: str = None, **kwargs: None) -> dict:
+    """Benchmarks models with `benchmark_model`.
+
+    :param models: Names of the models. Default is every model of `get_benchmark_models`.
+    :type models: list, optional
+    :param filename: If given, save the results as JSON into this file.
+    :type filename: str, optional
+    :param kwargs: Any keyword arguments passed into `benchmark_model`.
+    :type kwargs: None
+    :return: Dictionary with the 'environment' the benchmarks ran in and the 'results' per model.
+    :rtype: dict
+    """
+    if models is None:
+        models = list(get_benchmark_models())
+    results = dict()
+    for model in models:
+        results[model] = benchmark_model(model, **kwargs)
+        if results[model]['status'] == 'ok':
+            logger.info(f"{model}: {1e3 * results[model]['latency_median']:.3f} ms per call, "
+                        f"{results[model]['throughput']:.1f} calls per second")
+        else:
+            logger.info(f"{model}: {results[model]['status']} ({results[model]['reason']})")
+    environment = dict(python=platform.python_version(), numpy=np.__version__, machine=platform.machine(),
+                       processor=platform.processor(), system=platform.system(),
+                       time=time.strftime('%Y-%m-%dT%H:%M:%S'))
+    benchmarks = dict(environment=environment, results=results)
+    if filename is not None:
+        save_results(benchmarks, filename=filename)
+    return benchmarks
+
+
+def save_results(benchmarks: dict, filename: str) -> None:
+    """
+    :param benchmarks: The output of `run_benchmarks`.
+    :type benchmarks: dict
+    :param filename: The JSON file.
+    :type filename: str
+    """
+    with open(filename, 'w') as f:
+        json.dump(benchmarks, f, indent=2)
+
+
+def load_results(filename: str) -> dict:
+    """
+    :param filename: A JSON file written by `save_results`.
+    :type filename: str
+    :return: The benchmarks.
+    :rtype: dict
+    """
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
+def compare_to_baseline(
+        benchmarks: dict, baseline: Union[dict, str], threshold: float = DEFAULT_THRESHOLD) -> list:
+    """Finds models that got slower than the baseline. A model regressed if its median latency grew by more than
+    `threshold` or its throughput dropped by more than `threshold` relative to the baseline. Models that are not
+    in both benchmarks or did not run successfully in both are ignored.
+
+    :param benchmarks: The output of `run_benchmarks`.
+    :type benchmarks: dict
+    :param baseline: The baseline benchmarks or the JSON file they are saved in.
+    :type baseline: Union[dict, str]
+    :param threshold: Allowed relative slowdown, e.g. 0.25 for 25%.
+    :type threshold: float, optional
+    :return: One dictionary per regression with the 'model', 'metric', 'baseline' and 'current' value, and the
+             'slowdown' factor.
+    :rtype: list
+    """
+    if isinstance(baseline, str):
+        baseline = load_results(baseline)
+    regressions = []
+    for model, result in benchmarks['results'].items():
+        reference = baseline['results'].get(model)
+        if reference is None or result['status'] != 'ok' or reference['status'] != 'ok':
+            continue
+        slowdowns = dict(latency_median=result['latency_median'] / reference['latency_median'],
+                         throughput=reference['throughput'] / result['throughput'])
+        for metric, slowdown in slowdowns.items():
+            if slowdown > 1 + threshold:
+                regressions.append(dict(model=model, metric=metric, baseline=reference[metric],
+                                        current=result[metric], slowdown=slowdown))
+    return regressions
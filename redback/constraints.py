@@ -1,5 +1,12 @@
+import multiprocessing
+
 import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
 from redback.constants import *
+from redback.utils import logger
+
+_piecewise_polytrope_table = None
 
 def slsn_constraint(parameters):
     """
@@ -176,7 +183,8 @@ def csm_constraints(parameters):
 
 def piecewise_polytrope_eos_constraints(parameters):
     """
-    Constraint on piecewise-polytrope EOS to enforce causality and max mass
+    Constraint on piecewise-polytrope EOS to enforce causality and max mass.
+    Uses the lookup table set with `set_piecewise_polytrope_table` if there is one, otherwise solves every EOS.
 
     :param parameters: dictionary of parameters
     :return: converted_parameters dictionary where the violated samples are thrown out
@@ -186,23 +194,180 @@ def piecewise_polytrope_eos_constraints(parameters):
     gamma_1 = parameters['gamma_1']
     gamma_2 = parameters['gamma_2']
     gamma_3 = parameters['gamma_3']
-    maximum_eos_mass = calc_max_mass(log_p=log_p, gamma_1=gamma_1, gamma_2=gamma_2, gamma_3=gamma_3)
+    if _piecewise_polytrope_table is None:
+        maximum_eos_mass = calc_max_mass(log_p=log_p, gamma_1=gamma_1, gamma_2=gamma_2, gamma_3=gamma_3)
+        maximum_speed_of_sound = calc_speed_of_sound(log_p=log_p, gamma_1=gamma_1, gamma_2=gamma_2, gamma_3=gamma_3)
+    else:
+        maximum_eos_mass, maximum_speed_of_sound = _piecewise_polytrope_table(
+            log_p=log_p, gamma_1=gamma_1, gamma_2=gamma_2, gamma_3=gamma_3)
     converted_parameters['maximum_eos_mass'] = maximum_eos_mass
-
-    maximum_speed_of_sound = calc_speed_of_sound(log_p=log_p, gamma_1=gamma_1, gamma_2=gamma_2, gamma_3=gamma_3)
     converted_parameters['maximum_speed_of_sound'] = maximum_speed_of_sound
     return converted_parameters
 
-@np.vectorize
-def calc_max_mass(log_p, gamma_1, gamma_2, gamma_3, **kwargs):
+def _maximum_mass(log_p, gamma_1, gamma_2, gamma_3, **kwargs):
     import toast
     maximum_eos_mass = toast.piecewise_polytrope.maximum_mass(
         log_p=log_p, Gamma_1=gamma_1, Gamma_2=gamma_2, Gamma_3=gamma_3)
     return maximum_eos_mass
 
-@np.vectorize
-def calc_speed_of_sound(log_p, gamma_1, gamma_2, gamma_3, **kwargs):
+
+def _maximum_speed_of_sound(log_p, gamma_1, gamma_2, gamma_3, **kwargs):
     import toast
     maximum_speed_of_sound = toast.piecewise_polytrope.maximum_speed_of_sound(
         log_p=log_p, Gamma_1=gamma_1, Gamma_2=gamma_2, Gamma_3=gamma_3)
     return maximum_speed_of_sound
+
+
+calc_max_mass = np.vectorize(_maximum_mass)
+calc_speed_of_sound = np.vectorize(_maximum_speed_of_sound)
+
+
+def _solve_eos_properties(args):
+    maximum_mass_function, speed_of_sound_function, points = args
+    properties = np.full((len(points), 2), np.nan)
+    for ii, point in enumerate(points):
+        try:
+            properties[ii, 0] = maximum_mass_function(*point)
+            properties[ii, 1] = speed_of_sound_function(*point)
+        except Exception as e:
+            logger.debug(f"Could not solve the EOS at {point}: {e}")
+    return properties
+
+
+class PiecewisePolytropeTable(object):
+    parameter_names = ['log_p', 'gamma_1', 'gamma_2', 'gamma_3']
+
+    def __init__(self, log_p, gamma_1, gamma_2, gamma_3, maximum_eos_mass, maximum_speed_of_sound,
+                 maximum_mass_boundary=2.01, maximum_mass_tolerance=0.05,
+                 speed_of_sound_boundary=1., speed_of_sound_tolerance=0.05,
+                 maximum_mass_function=_maximum_mass, speed_of_sound_function=_maximum_speed_of_sound):
+        """
+        Lookup table of the maximum mass and maximum speed of sound over a regular grid of piecewise-polytrope
+        parameters. Queries are interpolated linearly. Points outside the grid, next to unsolvable grid points, or
+        within a tolerance of the constraint boundaries are solved exactly, so the constraints are applied exactly
+        where the interpolation error could change the outcome.
+
+        :param log_p: grid of the log pressure in SI units
+        :param gamma_1: grid of polytrope index 1
+        :param gamma_2: grid of polytrope index 2
+        :param gamma_3: grid of polytrope index 3
+        :param maximum_eos_mass: maximum mass in solar masses with shape (len(log_p), len(gamma_1), ...)
+        :param maximum_speed_of_sound: maximum speed of sound in units of c with the same shape
+        :param maximum_mass_boundary: maximum mass in solar masses around which queries are solved exactly
+        :param maximum_mass_tolerance: half width of the exactly solved region around maximum_mass_boundary
+        :param speed_of_sound_boundary: speed of sound in units of c around which queries are solved exactly
+        :param speed_of_sound_tolerance: half width of the exactly solved region around speed_of_sound_boundary
+        :param maximum_mass_function: exact solver of the maximum mass, called with the four parameters of one point
+        :param speed_of_sound_function: exact solver of the maximum speed of sound, called like maximum_mass_function
+        """
+        self.grid = tuple(np.asarray(array, dtype=float) for array in (log_p, gamma_1, gamma_2, gamma_3))
+        self.maximum_eos_mass = np.asarray(maximum_eos_mass, dtype=float)
+        self.maximum_speed_of_sound = np.asarray(maximum_speed_of_sound, dtype=float)
+        self.maximum_mass_boundary = maximum_mass_boundary
+        self.maximum_mass_tolerance = maximum_mass_tolerance
+        self.speed_of_sound_boundary = speed_of_sound_boundary
+        self.speed_of_sound_tolerance = speed_of_sound_tolerance
+        self.maximum_mass_function = maximum_mass_function
+        self.speed_of_sound_function = speed_of_sound_function
+        self._interpolator = RegularGridInterpolator(
+            self.grid, np.stack([self.maximum_eos_mass, self.maximum_speed_of_sound], axis=-1),
+            bounds_error=False, fill_value=np.nan)
+        self.n_exact = 0
+
+    @classmethod
+    def build(cls, log_p, gamma_1, gamma_2, gamma_3, npool=1, maximum_mass_function=_maximum_mass,
+              speed_of_sound_function=_maximum_speed_of_sound, **kwargs):
+        """
+        Solves the EOS on every point of the grid. Grid points that cannot be solved are stored as nan.
+
+        :param log_p: grid of the log pressure in SI units
+        :param gamma_1: grid of polytrope index 1
+        :param gamma_2: grid of polytrope index 2
+        :param gamma_3: grid of polytrope index 3
+        :param npool: number of processes used to solve the grid
+        :param maximum_mass_function: exact solver of the maximum mass, called with the four parameters of one
+                                      grid point. Must be picklable if npool > 1, i.e. a module-level function
+        :param speed_of_sound_function: exact solver of the maximum speed of sound, called like maximum_mass_function
+        :param kwargs: any other keyword arguments of `PiecewisePolytropeTable`
+        :return: the table
+        """
+        grid = [np.asarray(array, dtype=float) for array in (log_p, gamma_1, gamma_2, gamma_3)]
+        shape = tuple(len(array) for array in grid)
+        points = np.stack(np.meshgrid(*grid, indexing='ij'), axis=-1).reshape(-1, 4)
+        chunks = [(maximum_mass_function, speed_of_sound_function, chunk)
+                  for chunk in np.array_split(points, max(1, min(len(points), 16 * npool)))]
+        logger.info(f"Solving {len(points)} piecewise-polytrope EOS with {npool} processes")
+        if npool > 1:
+            with multiprocessing.Pool(processes=npool) as pool:
+                properties = pool.map(_solve_eos_properties, chunks)
+        else:
+            properties = [_solve_eos_properties(chunk) for chunk in chunks]
+        properties = np.concatenate(properties).reshape(shape + (2,))
+        return cls(*grid, maximum_eos_mass=properties[..., 0], maximum_speed_of_sound=properties[..., 1],
+                   maximum_mass_function=maximum_mass_function, speed_of_sound_function=speed_of_sound_function,
+                   **kwargs)
+
+    def save(self, filename):
+        """
+        :param filename: name of the npz file
+        """
+        np.savez(filename, **dict(zip(self.parameter_names, self.grid)), maximum_eos_mass=self.maximum_eos_mass,
+                 maximum_speed_of_sound=self.maximum_speed_of_sound)
+
+    @classmethod
+    def from_file(cls, filename, **kwargs):
+        """
+        :param filename: name of the npz file written by `save`
+        :param kwargs: any other keyword arguments of `PiecewisePolytropeTable`
+        :return: the table
+        """
+        with np.load(filename) as data:
+            arrays = {key: data[key] for key in data.files}
+        return cls(**arrays, **kwargs)
+
+    def __call__(self, log_p, gamma_1, gamma_2, gamma_3):
+        """
+        :param log_p: log pressure in SI units
+        :param gamma_1: polytrope index 1
+        :param gamma_2: polytrope index 2
+        :param gamma_3: polytrope index 3
+        :return: maximum mass in solar masses and maximum speed of sound in units of c, broadcast to the
+                 shape of the parameters
+        """
+        parameters = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (log_p, gamma_1, gamma_2, gamma_3)])
+        shape = parameters[0].shape
+        points = np.stack([x.ravel() for x in parameters], axis=-1)
+        properties = self._interpolator(points)
+        maximum_eos_mass = properties[:, 0]
+        maximum_speed_of_sound = properties[:, 1]
+        exact = np.isnan(maximum_eos_mass) | np.isnan(maximum_speed_of_sound) | \
+            (np.abs(maximum_eos_mass - self.maximum_mass_boundary) < self.maximum_mass_tolerance) | \
+            (np.abs(maximum_speed_of_sound - self.speed_of_sound_boundary) < self.speed_of_sound_tolerance)
+        if np.any(exact):
+            self.n_exact += int(np.sum(exact))
+            exact_points = points[exact].T
+            maximum_eos_mass[exact] = np.vectorize(self.maximum_mass_function)(*exact_points)
+            maximum_speed_of_sound[exact] = np.vectorize(self.speed_of_sound_function)(*exact_points)
+        if shape == ():
+            return float(maximum_eos_mass[0]), float(maximum_speed_of_sound[0])
+        return maximum_eos_mass.reshape(shape), maximum_speed_of_sound.reshape(shape)
+
+
+def set_piecewise_polytrope_table(table):
+    """
+    Sets the lookup table used by `piecewise_polytrope_eos_constraints`.
+
+    :param table: a `PiecewisePolytropeTable`, the name of a file written by `PiecewisePolytropeTable.save`,
+                  or None to solve every EOS again
+    """
+    global _piecewise_polytrope_table
+    if isinstance(table, str):
+        table = PiecewisePolytropeTable.from_file(table)
+    _piecewise_polytrope_table = table
+
+
+def get_piecewise_polytrope_table():
+    """
+    :return: the lookup table used by `piecewise_polytrope_eos_constraints` or None
+    """
+    return _piecewise_polytrope_table
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 from redback.constants import *
 from redback.utils import logger
@@ -12,9 +14,83 @@ except ModuleNotFoundError as e:
     logger.warning('lalsimulation is not installed. Some EOS based models will not work.'
                    'Either use bilby eos or pass your own EOS generation class to the model')
 
+
+@lru_cache(maxsize=128)
+def _polytrope(log_p, gamma_1, gamma_2, gamma_3):
+    return lalsim.SimNeutronStarEOS4ParameterPiecewisePolytrope(log_p, gamma_1, gamma_2, gamma_3)
+
+
+@lru_cache(maxsize=128)
+def _family(log_p, gamma_1, gamma_2, gamma_3):
+    return lalsim.CreateSimNeutronStarFamily(_polytrope(log_p, gamma_1, gamma_2, gamma_3))
+
+
+@lru_cache(maxsize=4096)
+def _tov_solution(log_p, gamma_1, gamma_2, gamma_3, central_pressure):
+    """
+    :return: mass in solar masses, radius in meters and dimensionless tidal deformability of the star
+             with the given central pressure in SI units
+    """
+    polytrope = _polytrope(log_p, gamma_1, gamma_2, gamma_3)
+    radius, mass, k2 = lalsim.SimNeutronStarTOVODEIntegrate(central_pressure, polytrope)
+    Lambda = (2 / 3) * k2 * (cc.c.si.value ** 2 * radius / (cc.G.si.value * mass)) ** 5
+    return mass / cc.M_sun.si.value, radius, Lambda
+
+
+@lru_cache(maxsize=128)
+def _mass_radius_lambda_curve(log_p, gamma_1, gamma_2, gamma_3, n_points):
+    """
+    :return: masses in solar masses, radii in meters and tidal deformabilities along the stable branch
+             of the neutron star family, as read-only arrays
+    """
+    family = _family(log_p, gamma_1, gamma_2, gamma_3)
+    minimum_mass = lalsim.SimNeutronStarFamMinimumMass(family)
+    maximum_mass = lalsim.SimNeutronStarMaximumMass(family)
+    mass = np.linspace(minimum_mass, maximum_mass, n_points)
+    # the radius changes fastest close to the maximum mass, so the last point is pulled just inside the family
+    mass[-1] = maximum_mass * (1 - 1e-6)
+    radius = np.array([lalsim.SimNeutronStarRadius(mm, family) for mm in mass])
+    k2 = np.array([lalsim.SimNeutronStarLoveNumberK2(mm, family) for mm in mass])
+    Lambda = (2 / 3) * k2 * (cc.c.si.value ** 2 * radius / (cc.G.si.value * mass)) ** 5
+    mass = mass / cc.M_sun.si.value
+    for array in (mass, radius, Lambda):
+        array.setflags(write=False)
+    return mass, radius, Lambda
+
+
+@lru_cache(maxsize=128)
+def _lambda_interpolant(log_p, gamma_1, gamma_2, gamma_3, central_pressure, maximum_mass_lower_limit):
+    mass, Lambda, max_mass = _lambda_array_of_central_pressure(log_p, gamma_1, gamma_2, gamma_3,
+                                                               central_pressure, maximum_mass_lower_limit)
+    return interp1d(mass, Lambda, fill_value='extrapolate'), max_mass
+
+
+def _lambda_array_of_central_pressure(log_p, gamma_1, gamma_2, gamma_3, central_pressure_array,
+                                      maximum_mass_lower_limit):
+    tmp = np.array([_tov_solution(log_p, gamma_1, gamma_2, gamma_3, pp) for pp in central_pressure_array])
+    mass = tmp[:, 0]
+    lambdas = tmp[:, 2]
+
+    arg_maximum_mass = np.argmax(mass)
+    max_mass = mass[arg_maximum_mass]
+
+    if max_mass < maximum_mass_lower_limit:
+        raise ValueError("Maximum mass for this EOS is lower than 2.01, please choose a more realistic EOS")
+
+    # Choose masses between 1. and maximum mass
+    args = np.argwhere((mass >= 1.)).flatten()
+    mass = mass[args[0]:arg_maximum_mass]
+    lambdas = lambdas[args[0]:arg_maximum_mass]
+
+    return mass, lambdas, max_mass
+
+
 class Piecewise_polytrope(object):
     def __init__(self, log_p, gamma_1, gamma_2, gamma_3):
         """
+        The polytrope, the neutron star family and the mass-radius-tidal deformability curve are built once
+        and shared by all instances with the same parameters.
+
         :param log_p: log central pressure in SI units
         :param gamma_1: polytrope index 1
         :param gamma_2: polytrope index 2
@@ -25,129 +101,103 @@ class Piecewise_polytrope(object):
         self.gamma_2 = gamma_2
         self.gamma_3 = gamma_3
 
+    @property
+    def _key(self):
+        return float(self.log_p), float(self.gamma_1), float(self.gamma_2), float(self.gamma_3)
+
+    @property
+    def polytrope(self):
+        """
+        :return: the lalsimulation piecewise polytrope
+        """
+        return _polytrope(*self._key)
+
+    @property
+    def family(self):
+        """
+        :return: the lalsimulation neutron star family of the polytrope
+        """
+        return _family(*self._key)
+
     def maximum_mass(self):
         """
         :return: maximum non-rotating mass in solar masses (Mtov) for the equation of state
         """
-        polytrope = lalsim.SimNeutronStarEOS4ParameterPiecewisePolytrope(self.log_p, self.gamma_1,
-                                                                         self.gamma_2, self.gamma_3)
-        polytrope = lalsim.CreateSimNeutronStarFamily(polytrope)
-        maximum_mass = lalsim.SimNeutronStarMaximumMass(polytrope)/cc.M_sun.si.value
-        return maximum_mass
+        return lalsim.SimNeutronStarMaximumMass(self.family)/cc.M_sun.si.value
 
     def maximum_speed_of_sound(self):
         """
         :return: maximum speed of sound in units of c
         """
-        polytrope = lalsim.SimNeutronStarEOS4ParameterPiecewisePolytrope(self.log_p, self.gamma_1,
-                                                                         self.gamma_2, self.gamma_3)
-        max_enthalpy = lalsim.SimNeutronStarEOSMaxPseudoEnthalpy(polytrope)
+        max_enthalpy = lalsim.SimNeutronStarEOSMaxPseudoEnthalpy(self.polytrope)
         max_speed_of_sound = lalsim.SimNeutronStarEOSSpeedOfSound(
-            max_enthalpy, polytrope)
+            max_enthalpy, self.polytrope)
         return max_speed_of_sound/cc.c.si.value
 
+    def mass_radius_lambda_curve(self, n_points=500):
+        """
+        :param n_points: number of masses on the curve
+        :return: masses in solar masses, radii in meters and dimensionless tidal deformabilities
+                 along the stable branch of the neutron star family. The arrays are cached and read-only.
+        """
+        return _mass_radius_lambda_curve(*self._key, int(n_points))
+
     def radius_of_mass(self, mass):
         """
         :param mass: mass array in solar masses
-        :return: return radius in meters
+        :return: return radius in meters. Masses outside the neutron star family are dropped.
         """
-
-        m1 = mass * cc.M_sun.si.value
-        polytrope = lalsim.SimNeutronStarEOS4ParameterPiecewisePolytrope(self.log_p, self.gamma_1,
-                                                                         self.gamma_2, self.gamma_3)
-        polytrope = lalsim.CreateSimNeutronStarFamily(polytrope)
-
-        m_tmp = []
-        r_tmp = []
-        for mm in m1:
+        radius = []
+        for mm in np.atleast_1d(mass) * cc.M_sun.si.value:
             try:
-                r_tmp.append(lalsim.SimNeutronStarRadius(mm, polytrope))
-                m_tmp.append(mm)
+                radius.append(lalsim.SimNeutronStarRadius(mm, self.family))
             except RuntimeError:
                 pass
-        return np.array(r_tmp)
+        return np.array(radius)
 
+    def lambda_of_mass_from_curve(self, mass, n_points=500):
+        """
+        Linear interpolation of the cached mass-tidal deformability curve, see `mass_radius_lambda_curve`.
+        Use `lambda_of_mass` for the tidal deformability from the TOV solutions.
+
+        :param mass: neutron star masses in solar masses, any shape
+        :param n_points: number of masses on the curve
+        :return: dimensionless tidal deformability with the shape of mass,
+                 NaN for masses outside the stable branch of the neutron star family
+        """
+        mass_curve, _, lambda_curve = self.mass_radius_lambda_curve(n_points=n_points)
+        return np.interp(mass, mass_curve, lambda_curve, left=np.nan, right=np.nan)
 
     def lambda_of_central_pressure(self, central_pressure):
         """
-        :param central_pressure:
+        :param central_pressure: central pressure in SI units
         :return: dimensionless tidal deformability
         """
-        polytrope = lalsim.SimNeutronStarEOS4ParameterPiecewisePolytrope(self.log_p, self.gamma_1,
-                                                                         self.gamma_2, self.gamma_3)
-        radius, mass, k2 = lalsim.SimNeutronStarTOVODEIntegrate(central_pressure, polytrope)
-
-        Lambda = (2 / 3) * k2 * (cc.c.si.value ** 2 * radius / (cc.G.si.value * mass)) ** 5
-        return Lambda
+        return _tov_solution(*self._key, float(central_pressure))[2]
 
     def lambda_array_of_central_pressure(self, central_pressure_array, maximum_mass_lower_limit=2.01):
         """
         :param central_pressure_array: array of central pressure in SI units
         :param maximum_mass_lower_limit: 2.01 solar masses, Throw out EOS's that are below this value.
         Users should enforce this at the prior level.
-        :return: dimensionless tidal deformability
+        :return: masses in solar masses, dimensionless tidal deformability and the maximum mass
         """
-
-        tmp = np.array([self.lambda_of_central_pressure(pp) for pp in central_pressure_array])
-        mass = tmp[:, 0]
-        lambdas = tmp[:, 1]
-
-        arg_maximum_mass = np.argmax(mass)
-        max_mass = mass[arg_maximum_mass]
-
-        if max_mass < maximum_mass_lower_limit:
-            raise ValueError("Maximum mass for this EOS is lower than 2.01, please choose a more realistic EOS")
-
-        # Choose masses between 1. and maximum mass
-        args = np.argwhere((mass >= 1.)).flatten()
-        mass = mass[args[0]:arg_maximum_mass]
-        lambdas = lambdas[args[0]:arg_maximum_mass]
-
-        return mass, lambdas, max_mass
+        return _lambda_array_of_central_pressure(*self._key, tuple(np.asarray(central_pressure_array, dtype=float)),
+                                                 maximum_mass_lower_limit)
 
     def lambda_of_mass(self, central_pressure, mass, maximum_mass_lower_limit=2.01):
         """
         :param central_pressure: central pressure in SI units
-        :param mass: neutron star masses in solar masses
-        :param maximum_mass_limit:
-        :return: lambda for the given mass array
+        :param mass: neutron star masses in solar masses, e.g. a float, np.array([mass_1]) or
+                     np.array([mass_1, mass_2])
+        :param maximum_mass_lower_limit: 2.01 solar masses, Throw out EOS's that are below this value.
+        :return: lambda for the given mass array and the maximum mass
         """
-        mass_tmp, Lambda_tmp, max_mass = self.lambda_array_of_central_pressure(central_pressure, maximum_mass_lower_limit)
-
-        if hasattr(mass, '__len__'):
-            if mass.shape == (len(mass),):  # i.e. np.array([mass_1])
-                interpolated_Lambda = interp1d(
-                    mass_tmp, Lambda_tmp, fill_value='extrapolate')
-
-                Lambda = interpolated_Lambda(mass)
-                args = np.argwhere(Lambda >= 0).flatten()
-                args_2 = np.argwhere(Lambda < 0).flatten()
-
-                # We append zeros after a NS collapses, i.e, for masses > M_tov
-                Lambda = np.append(Lambda[args], np.zeros(len(args_2)))
-
-            elif mass.shape == (2, len(mass[0])):  # i.e. np.array([mass_1,mass_2])
-                interpolated_Lambda = interp1d(
-                    mass_tmp, Lambda_tmp, fill_value='extrapolate')
-                Lambda = np.zeros([2, len(mass[0])])
-                for ii in range(2):
-                    Lambda_tmp_2 = interpolated_Lambda(mass[ii])
-                    args = np.argwhere(Lambda_tmp_2 >= 0).flatten()
-                    args_2 = np.argwhere(Lambda_tmp_2 < 0).flatten()
-
-                    # We append zeros after a NS collapses, i.e, for masses > M_tov
-                    Lambda[ii] = np.append(Lambda_tmp_2[args], np.zeros(len(args_2)))
-
-        else:
-            # if mass is a float
-            interpolated_Lambda = interp1d(
-                mass_tmp, Lambda_tmp, fill_value='extrapolate')
-            Lambda = interpolated_Lambda(mass)
-            if Lambda < 0:
-                Lambda = 0
-
-
+        interpolated_Lambda, max_mass = _lambda_interpolant(
+            *self._key, tuple(np.asarray(central_pressure, dtype=float)), maximum_mass_lower_limit)
+        Lambda = interpolated_Lambda(mass)
+        # We return zeros after a NS collapses, i.e, for masses > M_tov
+        Lambda = np.where(Lambda < 0, 0., Lambda)
+        if not hasattr(mass, '__len__'):
+            Lambda = float(Lambda)
         return Lambda, max_mass
-
-
-
@@ -0,0 +1,192 @@
+from functools import lru_cache
+from typing import Union
+
+import numpy as np
+import scipy.sparse
+
+from redback.constants import speed_of_light
+from redback.utils import logger
+
+_filters = dict()
+
+
+class Filter(object):
+
+    def __init__(self, name: str, wavelength: np.ndarray, transmission: np.ndarray) -> None:
+        """
+        Transmission curve of a band
+
+        :param name: name of the band
+        :param wavelength: wavelength in Angstrom, increasing
+        :param transmission: transmission at each wavelength
+        """
+        wavelength = np.asarray(wavelength, dtype=float)
+        transmission = np.asarray(transmission, dtype=float)
+        if wavelength.shape != transmission.shape or wavelength.ndim != 1 or len(wavelength) < 2:
+            raise ValueError("Wavelength and transmission must be one dimensional arrays of the same length.")
+        if np.any(np.diff(wavelength) <= 0):
+            raise ValueError("Wavelength must be strictly increasing.")
+        if np.any(transmission < 0) or not np.any(transmission > 0):
+            raise ValueError("Transmission must be non-negative and not zero everywhere.")
+        self.name = name
+        self.wavelength = wavelength
+        self.transmission = transmission
+
+    @classmethod
+    def from_file(cls, name: str, filename: str, **kwargs: None) -> "Filter":
+        """
+        :param name: name of the band
+        :param filename: text file with the wavelength in Angstrom and the transmission in the first two columns
+        :param kwargs: any keyword arguments passed into np.loadtxt
+        :return: the filter
+        """
+        wavelength, transmission = np.loadtxt(filename, usecols=(0, 1), unpack=True, **kwargs)
+        return cls(name=name, wavelength=wavelength, transmission=transmission)
+
+    @classmethod
+    def top_hat(cls, name: str, wavelength_min: float, wavelength_max: float) -> "Filter":
+        """
+        :param name: name of the band
+        :param wavelength_min: blue edge in Angstrom
+        :param wavelength_max: red edge in Angstrom
+        :return: a filter with full transmission between the edges
+        """
+        edge = 1e-6 * (wavelength_max - wavelength_min)
+        wavelength = np.array([wavelength_min - edge, wavelength_min, wavelength_max, wavelength_max + edge])
+        return cls(name=name, wavelength=wavelength, transmission=np.array([0., 1., 1., 0.]))
+
+    @property
+    def effective_wavelength(self) -> float:
+        """
+        :return: transmission weighted mean wavelength in Angstrom
+        """
+        return np.trapz(self.wavelength * self.transmission, self.wavelength) / \
+            np.trapz(self.transmission, self.wavelength)
+
+    @property
+    def effective_frequency(self) -> float:
+        """
+        :return: frequency of the effective wavelength in Hz
+        """
+        return speed_of_light / (self.effective_wavelength * 1e-8)
+
+    def __repr__(self) -> str:
+        return f"Filter(name={self.name}, wavelength={self.wavelength[0]:.0f}-{self.wavelength[-1]:.0f} Angstrom)"
+
+
+class FilterSet(object):
+
+    def __init__(self, filters: list, resolution: float = 500.) -> None:
+        """
+        Filters on a shared, logarithmically spaced wavelength grid. The weights of each band on the grid are stored
+        in a sparse matrix, so that the synthetic AB flux densities of an SED evaluated on the grid are a single
+        matrix product, i.e. for each band the photon-counting average of the flux density
+        int f_nu T dlambda / lambda / int T dlambda / lambda.
+
+        :param filters: list of `Filter`
+        :param resolution: lambda / delta lambda of the wavelength grid
+        """
+        self.filters = list(filters)
+        self.names = [f.name for f in self.filters]
+        self._index = {name: ii for ii, name in enumerate(self.names)}
+        wavelength_min = min(f.wavelength[0] for f in self.filters)
+        wavelength_max = max(f.wavelength[-1] for f in self.filters)
+        n_wavelength = int(np.ceil(resolution * np.log(wavelength_max / wavelength_min))) + 1
+        self.wavelength = np.geomspace(wavelength_min, wavelength_max, max(n_wavelength, 2))
+        self.frequency = speed_of_light / (self.wavelength * 1e-8)
+
+        # trapezoidal weights of int g dln(lambda) on the grid
+        dlnlambda = np.diff(np.log(self.wavelength))
+        quadrature = np.zeros(len(self.wavelength))
+        quadrature[:-1] += dlnlambda / 2
+        quadrature[1:] += dlnlambda / 2
+        weights = np.array([np.interp(self.wavelength, f.wavelength, f.transmission, left=0., right=0.)
+                            for f in self.filters]) * quadrature
+        norms = weights.sum(axis=1)
+        if np.any(norms <= 0):
+            narrow = [name for name, norm in zip(self.names, norms) if norm <= 0]
+            raise ValueError(f"The filters {narrow} are not resolved by the wavelength grid. Increase the resolution.")
+        self.weights = scipy.sparse.csr_matrix(weights / norms[:, None])
+
+    def band_index(self, bands: Union[list, np.ndarray]) -> np.ndarray:
+        """
+        :param bands: names of the bands
+        :return: row of each band in `weights`
+        """
+        try:
+            return np.array([self._index[band] for band in np.atleast_1d(bands)], dtype=int)
+        except KeyError as e:
+            raise ValueError(f"Band {e} is not in this filter set.")
+
+    def synthetic_flux_density(self, flux_density: np.ndarray) -> np.ndarray:
+        """
+        :param flux_density: flux density evaluated on `wavelength` along the first axis, shape (n_wavelength, ...)
+        :return: band averaged flux density in the same units, shape (n_bands, ...)
+        """
+        flux_density = np.asarray(flux_density)
+        shape = flux_density.shape
+        return np.asarray(self.weights @ flux_density.reshape(shape[0], -1)).reshape((len(self.filters),) + shape[1:])
+
+    def observation_weights(self, bands: Union[list, np.ndarray]) -> tuple:
+        """
+        Sparse weights for observations with one band each. Only the wavelengths inside each band are kept,
+        so an SED evaluated on the returned observation and wavelength indices is reduced by one sparse product.
+
+        :param bands: band of each observation
+        :return: observation index and wavelength index of each evaluation point, and the sparse matrix of shape
+                 (n_observations, n_evaluations) that maps the SED at these points to the band averaged flux densities
+        """
+        band_index = self.band_index(bands)
+        counts = np.diff(self.weights.indptr)[band_index]
+        observation_index = np.repeat(np.arange(len(band_index)), counts)
+        # position of every evaluation point in the data of the sparse band weights
+        offsets = self.weights.indptr[band_index] - np.concatenate([[0], np.cumsum(counts)[:-1]])
+        positions = np.repeat(offsets, counts) + np.arange(len(observation_index))
+        wavelength_index = self.weights.indices[positions]
+        matrix = scipy.sparse.csr_matrix((self.weights.data[positions], np.arange(len(positions)),
+                                          np.concatenate([[0], np.cumsum(counts)])),
+                                         shape=(len(band_index), len(positions)))
+        return observation_index, wavelength_index, matrix
+
+    def __repr__(self) -> str:
+        return f"FilterSet(bands={self.names}, n_wavelength={len(self.wavelength)})"
+
+
+def register_filter(filter_: Filter) -> None:
+    """
+    Makes a filter available by name to `get_filter` and `get_filter_set`
+
+    :param filter_: the filter
+    """
+    _filters[filter_.name] = filter_
+    get_filter_set.cache_clear()
+
+
+def get_filter(name: str) -> Filter:
+    """
+    :param name: name of a band registered with `register_filter` or known to sncosmo
+    :return: the filter
+    """
+    if name in _filters:
+        return _filters[name]
+    try:
+        import sncosmo
+    except ImportError:
+        raise ValueError(f"No transmission curve for band {name}. Register it with redback.filters.register_filter "
+                         f"or install sncosmo.")
+    try:
+        bandpass = sncosmo.get_bandpass(name)
+    except Exception as e:
+        raise ValueError(f"No transmission curve for band {name}: {e}")
+    logger.info(f"Using the sncosmo transmission curve of band {name}")
+    return Filter(name=name, wavelength=bandpass.wave, transmission=bandpass.trans)
+
+
+@lru_cache(maxsize=32)
+def get_filter_set(bands: tuple, resolution: float = 500.) -> FilterSet:
+    """
+    :param bands: names of the bands
+    :param resolution: lambda / delta lambda of the wavelength grid
+    :return: the cached filter set of the bands
+    """
+    return FilterSet([get_filter(band) for band in bands], resolution=resolution)
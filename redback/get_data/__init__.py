@@ -1,17 +1,17 @@
 from __future__ import annotations
 
-from typing import Union
-import urllib
+import asyncio
+from typing import Callable, Union
 
 import pandas as pd
 
-from redback.get_data import batse, directory, fermi, getter, konus, lasair, open_data, swift, utils
+from redback.get_data import batse, directory, download, fermi, getter, konus, lasair, open_data, swift, utils
 from redback.get_data.swift import SwiftDataGetter
 from redback.get_data.open_data import OpenDataGetter
 from redback.get_data.batse import BATSEDataGetter
 from redback.get_data.fermi import FermiDataGetter
 from redback.get_data.konus import KonusDataGetter
-from redback.get_data.lasair import LasairDataGetter
+from redback.get_data.lasair import LasairDataGetter, LasairAlertStream
 from redback.utils import logger
 
 SWIFT_PROMPT_BIN_SIZES = ['1s', '2ms', '8ms', '16ms', '64ms', '256ms']
@@ -73,7 +73,7 @@ def get_prompt_data_from_swift(grb: str, bin_size: str = "1s", **kwargs: None) -
 
 def get_swift_data(
         grb: str, transient_type: str, data_mode: str = 'flux', instrument: str = 'BAT+XRT',
-        bin_size: str = None, **kwargs: None) -> pd.DataFrame:
+        bin_size: str = None, use_browser: bool = True, **kwargs: None) -> pd.DataFrame:
     """Catch all data getting function for Swift.  Creates a directory structure and saves the data.
     Returns the data, though no further action needs to be taken by the user.
 
@@ -89,6 +89,9 @@ def get_swift_data(
     :param bin_size: Bin size. Must be from `redback.get_data.swift.SwiftDataGetter.SWIFT_PROMPT_BIN_SIZES`.
                      (Default value = None)
     :type bin_size: str, optional
+    :param use_browser: Whether to download burst analyser data by clicking through the website with PhantomJS.
+                        See `redback.get_data.swift.SwiftDataGetter`. (Default value = True)
+    :type use_browser: bool, optional
     :param kwargs: Placeholder to prevent TypeErrors.
     :type kwargs: None
 
@@ -97,10 +100,46 @@ def get_swift_data(
     """
     getter = SwiftDataGetter(
         grb=grb, transient_type=transient_type, data_mode=data_mode,
-        bin_size=bin_size, instrument=instrument)
+        bin_size=bin_size, instrument=instrument, use_browser=use_browser)
     return getter.get_data()
 
 
+def get_swift_data_in_bulk(
+        grbs: list, transient_type: str, data_mode: str = 'flux', instrument: str = 'BAT+XRT',
+        bin_size: str = None, max_workers: int = 8, use_browser: bool = True, **kwargs: None) -> dict:
+    """Downloads Swift data for many GRBs concurrently. Creates a directory structure and saves the data.
+    GRBs that fail are logged and left out of the returned dictionary.
+
+    :param grbs: Telephone numbers of the GRBs, e.g., ['GRB140903A', '050202'].
+    :type grbs: list
+    :param transient_type: Type of the transient. Should be 'prompt' or 'afterglow'.
+    :type transient_type: str
+    :param data_mode: Data mode must be from `redback.get_data.swift.SwiftDataGetter.VALID_DATA_MODES`.
+                      (Default value = 'flux')
+    :type data_mode: str
+    :param instrument: Instrument(s) to use. Must be from `redback.get_data.swift.SwiftDataGetter.VALID_INSTRUMENTS`.
+                       (Default value = 'BAT+XRT')
+    :type instrument: str
+    :param bin_size: Bin size. Must be from `redback.get_data.swift.SwiftDataGetter.SWIFT_PROMPT_BIN_SIZES`.
+                     (Default value = None)
+    :type bin_size: str, optional
+    :param max_workers: Maximum number of concurrent downloads. (Default value = 8)
+    :type max_workers: int, optional
+    :param use_browser: Whether to download burst analyser data by clicking through the website with PhantomJS.
+                        See `redback.get_data.swift.SwiftDataGetter`. (Default value = True)
+    :type use_browser: bool, optional
+    :param kwargs: Placeholder to prevent TypeErrors.
+    :type kwargs: None
+
+    :return: Dictionary mapping the GRB name to the processed data.
+    :rtype: dict
+    """
+    getters = [SwiftDataGetter(grb=grb, transient_type=transient_type, data_mode=data_mode,
+                               bin_size=bin_size, instrument=instrument, use_browser=use_browser)
+               for grb in grbs]
+    return download.get_data_in_bulk(getters=getters, max_workers=max_workers)
+
+
 def get_prompt_data_from_batse(grb: str, **kwargs: None) -> pd.DataFrame:
     """Get prompt emission data from BATSE. Creates a directory structure and saves the data.
     Returns the data, though no further action needs to be taken by the user.
@@ -212,6 +251,31 @@ def get_lasair_data(
         transient_type=transient_type, transient=transient)
     return getter.get_data()
 
+
+def stream_lasair_data(
+        transients: list, callback: Callable, transient_type: str = "unknown", poll_interval: float = 300,
+        n_polls: int = None, **kwargs: None) -> None:
+    """Polls Lasair for a watch-list of transients and passes updated transients to `callback` whenever new candidates
+    arrive. Blocks until `n_polls` polls are done. Use `redback.get_data.lasair.LasairAlertStream` directly to run
+    the stream inside an existing event loop.
+
+    :param transients: The names of the transients, e.g. ['ZTF19aagqkrq'].
+    :type transients: list
+    :param callback: Called with each updated transient. Coroutine functions are awaited.
+    :type callback: Callable
+    :param transient_type: Type of the transient. Must be from `redback.get_data.lasair.LasairDataGetter.VALID_TRANSIENT_TYPES`.
+    :type transient_type: str, optional
+    :param poll_interval: Time in seconds between the start of two polls. (Default value = 300)
+    :type poll_interval: float, optional
+    :param n_polls: Number of polls. Poll until interrupted if not given.
+    :type n_polls: int, optional
+    :param kwargs: Any other keyword arguments passed into `redback.get_data.lasair.LasairAlertStream`.
+    :type kwargs: None
+    """
+    stream = LasairAlertStream(
+        transients=transients, callback=callback, transient_type=transient_type, poll_interval=poll_interval, **kwargs)
+    asyncio.run(stream.run(n_polls=n_polls))
+
 def get_open_transient_catalog_data(
         transient: str, transient_type: str, **kwargs: None) -> pd.DataFrame:
     """Catch all data getting function for the Open Access Catalog. Creates a directory structure and saves the data.
@@ -236,7 +300,7 @@ def get_open_transient_catalog_data(
 def get_oac_metadata() -> None:
     """Retrieves Open Access Catalog metadata table."""
     url = 'https://api.astrocats.space/catalog?format=CSV'
-    urllib.request.urlretrieve(url, 'metadata.csv')
+    download.write(response=download.fetch(url), filename='metadata.csv')
     logger.info('Downloaded metadata for open access catalog transients.')
 
 
@@ -1,6 +1,4 @@
 import os
-import urllib
-import urllib.request
 
 import astropy.io.fits.hdu
 import numpy as np
@@ -8,6 +6,7 @@ import pandas as pd
 from astropy.io import fits
 
 import redback
+import redback.get_data.download
 from redback.get_data.getter import GRBDataGetter
 from redback.get_data.utils import get_batse_trigger_from_grb
 
@@ -83,7 +82,9 @@ class BATSEDataGetter(GRBDataGetter):
 
     def collect_data(self) -> None:
         """Downloads the data from HEASARC and saves it into the raw file path."""
-        urllib.request.urlretrieve(self.url, self.raw_file_path)
+        response = redback.get_data.download.fetch(self.url)
+        response.raise_for_status()
+        redback.get_data.download.write(response=response, filename=self.raw_file_path)
 
     def convert_raw_data_to_csv(self) -> pd.DataFrame:
         """Converts the raw data into processed data and saves it into the processed file path.
@@ -0,0 +1,312 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Union
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from redback.utils import logger
+
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+_session = None
+_session_lock = threading.Lock()
+_cache = None
+_revalidation = threading.local()
+
+
+class HTTPCache(object):
+
+    def __init__(self, directory: str = None, ttl: float = 86400, max_size: int = 1024 ** 3) -> None:
+        """Content-addressed on-disk cache for raw downloads. Responses younger than `ttl` are served from disk
+        without a request. Older responses are revalidated with a conditional request using their ETag and
+        Last-Modified headers, so unchanged data is not downloaded again. If the cache grows beyond `max_size`,
+        the least recently used responses are evicted.
+
+        :param directory: Cache directory. Default is '~/.cache/redback/http'.
+        :type directory: str, optional
+        :param ttl: Time in seconds for which a cached response is used without revalidation. Default is one day.
+        :type ttl: float, optional
+        :param max_size: Maximum total size of the cached content in bytes. Default is 1 GiB.
+        :type max_size: int, optional
+        """
+        self.directory = directory or os.path.join(os.path.expanduser("~"), ".cache", "redback", "http")
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.RLock()
+        os.makedirs(os.path.join(self.directory, "objects"), exist_ok=True)
+        try:
+            with open(self._index_path, "r") as f:
+                self._index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._index = dict()
+
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self.directory, "index.json")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "objects", digest)
+
+    @property
+    def size(self) -> int:
+        """
+        :return: Total size of the cached content in bytes. Identical content is only counted once.
+        :rtype: int
+        """
+        with self._lock:
+            return sum({entry["digest"]: entry["size"] for entry in self._index.values()}.values())
+
+    def get(self, url: str, session: requests.Session, **kwargs: None) -> requests.Response:
+        """Gets a url through the cache.
+
+        :param url: The url.
+        :type url: str
+        :param session: The session used for requests.
+        :type session: requests.Session
+        :param kwargs: Any other keyword arguments passed into `requests.Session.get`.
+        :type kwargs: None
+        :return: Either the cached or the new response.
+        :rtype: requests.Response
+        """
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is not None and not os.path.isfile(self._object_path(entry["digest"])):
+                entry = None
+        if entry is not None and time.time() - entry["fetched"] < self.ttl and not revalidating():
+            return self._load(url, entry)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            if entry["headers"].get("ETag") is not None:
+                headers["If-None-Match"] = entry["headers"]["ETag"]
+            if entry["headers"].get("Last-Modified") is not None:
+                headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        response = session.get(url, headers=headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                entry["fetched"] = time.time()
+                self._save_index()
+            return self._load(url, entry)
+        if response.status_code == 200:
+            self._store(url, response)
+        return response
+
+    def _load(self, url: str, entry: dict) -> requests.Response:
+        with open(self._object_path(entry["digest"]), "rb") as f:
+            content = f.read()
+        with self._lock:
+            entry["accessed"] = time.time()
+            self._save_index()
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = content
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = entry["encoding"]
+        return response
+
+    def _store(self, url: str, response: requests.Response) -> None:
+        digest = hashlib.sha256(response.content).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.isfile(path):
+            write(response=response, filename=path)
+        headers = {key: response.headers[key] for key in ["ETag", "Last-Modified", "Content-Type"]
+                   if key in response.headers}
+        now = time.time()
+        with self._lock:
+            self._index[url] = dict(digest=digest, size=len(response.content), headers=headers,
+                                    encoding=response.encoding, fetched=now, accessed=now)
+            self._evict()
+            self._save_index()
+
+    def _evict(self) -> None:
+        """Evicts the least recently used entries until the cache is smaller than `max_size`."""
+        for url in sorted(self._index, key=lambda key: self._index[key]["accessed"]):
+            if self.size <= self.max_size:
+                break
+            digest = self._index.pop(url)["digest"]
+            if all(entry["digest"] != digest for entry in self._index.values()):
+                os.remove(self._object_path(digest))
+
+    def _save_index(self) -> None:
+        temporary_path = f"{self._index_path}.{os.getpid()}.{threading.get_ident()}.part"
+        with open(temporary_path, "w") as f:
+            json.dump(self._index, f)
+        os.replace(temporary_path, self._index_path)
+
+    def clear(self) -> None:
+        """Removes all cached responses."""
+        with self._lock:
+            for entry in self._index.values():
+                if os.path.isfile(self._object_path(entry["digest"])):
+                    os.remove(self._object_path(entry["digest"]))
+            self._index = dict()
+            self._save_index()
+
+
+def enable_cache(directory: str = None, ttl: float = 86400, max_size: int = 1024 ** 3) -> HTTPCache:
+    """Enables the on-disk cache for all downloads of the data getters. See `HTTPCache` for the arguments.
+
+    :return: The cache.
+    :rtype: HTTPCache
+    """
+    global _cache
+    _cache = HTTPCache(directory=directory, ttl=ttl, max_size=max_size)
+    return _cache
+
+
+def disable_cache() -> None:
+    """Disables the on-disk cache. Cached files are kept."""
+    global _cache
+    _cache = None
+
+
+def get_cache() -> Union[HTTPCache, None]:
+    """
+    :return: The active cache or None if caching is disabled.
+    :rtype: Union[HTTPCache, None]
+    """
+    return _cache
+
+
+@contextmanager
+def revalidate() -> None:
+    """Within this context, cached responses requested by the current thread are revalidated with the server
+    regardless of their age, so that only unchanged data is served from the cache.
+    """
+    previous = revalidating()
+    _revalidation.active = True
+    try:
+        yield
+    finally:
+        _revalidation.active = previous
+
+
+def revalidating() -> bool:
+    """
+    :return: Whether the current thread is inside a `revalidate` context.
+    :rtype: bool
+    """
+    return getattr(_revalidation, "active", False)
+
+
+def get_session(pool_maxsize: int = 16) -> requests.Session:
+    """Gets the process-wide session used by the data getters so that connections to the same host are reused.
+
+    :param pool_maxsize: Maximum number of pooled connections per host. Only used when the session is created.
+    :type pool_maxsize: int, optional
+    :return: The shared session.
+    :rtype: requests.Session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def fetch(
+        url: str, session: requests.Session = None, retries: int = 3, backoff_factor: float = 0.5,
+        timeout: float = 60, cache: bool = True, raise_for_status: bool = True, **kwargs: None) -> requests.Response:
+    """Sends a GET request, retrying with exponential backoff on connection errors, timeouts, and on the status codes
+    in `RETRY_STATUS_CODES`. Goes through the on-disk cache if it has been enabled with `enable_cache`.
+
+    :param url: The url to fetch.
+    :type url: str
+    :param session: Session to use. Use the shared session from `get_session` if not given.
+    :type session: requests.Session, optional
+    :param retries: Number of retries after the first attempt.
+    :type retries: int, optional
+    :param backoff_factor: The n-th retry waits `backoff_factor * 2 ** n` seconds.
+    :type backoff_factor: float, optional
+    :param timeout: Timeout of each attempt in seconds.
+    :type timeout: float, optional
+    :param cache: Whether to go through the on-disk cache if it is enabled. Set this to False for data that changes
+                  faster than the time to live of the cache.
+    :type cache: bool, optional
+    :param raise_for_status: Whether to raise a `requests.HTTPError` if the last attempt returned an error status.
+                             Set this to False to inspect error responses, e.g. when polling.
+    :type raise_for_status: bool, optional
+    :param kwargs: Any other keyword arguments passed into `requests.Session.get`.
+    :type kwargs: None
+    :return: The response of the last attempt.
+    :rtype: requests.Response
+    """
+    session = session or get_session()
+    for attempt in range(retries + 1):
+        try:
+            if _cache is None or not cache:
+                response = session.get(url, timeout=timeout, **kwargs)
+            else:
+                response = _cache.get(url, session=session, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == retries:
+                raise
+            logger.warning(f"Request to {url} failed with {e}. Retrying.")
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt == retries:
+                if raise_for_status:
+                    response.raise_for_status()
+                return response
+            logger.warning(f"Request to {url} returned status {response.status_code}. Retrying.")
+        time.sleep(backoff_factor * 2 ** attempt)
+
+
+def write(response: requests.Response, filename: str) -> None:
+    """Writes the content of a response into a file. The content is written to a temporary file first, so that
+    interrupted downloads never leave a partial file at `filename`.
+
+    :param response: The response.
+    :type response: requests.Response
+    :param filename: The file to write into.
+    :type filename: str
+    """
+    temporary_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.part"
+    with open(temporary_filename, "wb") as f:
+        f.write(response.content)
+    os.replace(temporary_filename, filename)
+
+
+def get_data_in_bulk(getters: list, max_workers: int = 8, refresh: bool = False) -> dict:
+    """Runs `get_data` of many data getters with a bounded number of concurrent downloads.
+    Failed transients are logged and left out of the returned dictionary.
+
+    :param getters: The data getters, e.g. a list of `LasairDataGetter`.
+    :type getters: list
+    :param max_workers: Maximum number of concurrent downloads.
+    :type max_workers: int, optional
+    :param refresh: Whether to get the data again even if the files already exist. See `DataGetter.get_data`.
+    :type refresh: bool, optional
+    :return: Dictionary mapping the transient name to the processed data.
+    :rtype: dict
+    """
+    get_session(pool_maxsize=max(max_workers, 16))
+
+    def _get_data(getter) -> Union[pd.DataFrame, Exception]:
+        try:
+            return getter.get_data(refresh=refresh)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_get_data, getters))
+
+    data = dict()
+    for getter, result in zip(getters, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Could not get data for {getter.transient}: {result}")
+        else:
+            data[getter.transient] = result
+    return data
@@ -1,5 +1,9 @@
+import os
+
 import pandas as pd
 
+import redback.get_data.download
+
 
 class DataGetter(object):
     """ """
@@ -8,14 +12,39 @@ class DataGetter(object):
         self.transient = transient
         self.transient_type = transient_type
 
-    def get_data(self) -> pd.DataFrame:
+    def get_data(self, refresh: bool = False) -> pd.DataFrame:
         """Downloads the raw data and produces a processed .csv file.
 
+        :param refresh: Whether to get the data again even if the raw and processed files exist. The existing files
+                        are only replaced if the new data could be downloaded and processed. Cached responses of
+                        `redback.get_data.download.enable_cache` are revalidated, so only data that has changed is
+                        downloaded.
+        :type refresh: bool, optional
         :return: The processed data
         :rtype: pandas.DataFrame
         """
-        self.collect_data()
-        return self.convert_raw_data_to_csv()
+        if not refresh:
+            self.collect_data()
+            return self.convert_raw_data_to_csv()
+
+        backups = dict()
+        for path in [self.raw_file_path, self.processed_file_path]:
+            if os.path.isfile(path):
+                backups[path] = f"{path}.bak"
+                os.replace(path, backups[path])
+        try:
+            with redback.get_data.download.revalidate():
+                self.collect_data()
+            if not os.path.isfile(self.raw_file_path):
+                raise ValueError(f"Could not get the data for {self.transient}. The existing files were kept.")
+            data = self.convert_raw_data_to_csv()
+        except Exception:
+            for path, backup in backups.items():
+                os.replace(backup, path)
+            raise
+        for backup in backups.values():
+            os.remove(backup)
+        return data
 
     @property
     def transient_type(self) -> str:
@@ -1,17 +1,17 @@
+import asyncio
+import functools
 import json
 import os
-from typing import Union
-import urllib
-import urllib.request
+from typing import Callable, Union
 
 import astropy.units as uu
 import numpy as np
 import pandas as pd
-import requests
 from astropy.time import Time
 
 import redback
 import redback.get_data.directory
+import redback.get_data.download
 import redback.get_data.utils
 import redback.redback_errors
 from redback.get_data.getter import DataGetter
@@ -19,10 +19,13 @@ from redback.utils import logger, calc_flux_density_from_ABmag, calc_flux_densit
 
 dirname = os.path.dirname(__file__)
 
+LASAIR_TO_GENERAL_BANDS = {1: "g", 2: "r"}
+
 
 class LasairDataGetter(DataGetter):
 
     VALID_TRANSIENT_TYPES = ["afterglow", "kilonova", "supernova", "tidal_disruption_event", "unknown"]
+    base_url = "https://lasair.roe.ac.uk"
 
     def __init__(self, transient: str, transient_type: str) -> None:
         """
@@ -45,7 +48,7 @@ class LasairDataGetter(DataGetter):
         :return: The lasair raw data url.
         :rtype: str
         """
-        return f"https://lasair.roe.ac.uk/object/{self.transient}/json/"
+        return f"{self.base_url}/object/{self.transient}/json/"
 
     def collect_data(self) -> None:
         """Downloads the data from astrocats and saves it into the raw file path."""
@@ -53,11 +56,12 @@ class LasairDataGetter(DataGetter):
             logger.warning('The raw data file already exists.')
             return None
 
-        if 'does not exist' in requests.get(self.url).text:
+        response = redback.get_data.download.fetch(self.url)
+        if 'does not exist' in response.text:
             raise ValueError(
                 f"Transient {self.transient} does not exist in the catalog. "
                 f"Are you sure you are using the right alias?")
-        urllib.request.urlretrieve(url=self.url, filename=self.raw_file_path)
+        redback.get_data.download.write(response=response, filename=self.raw_file_path)
         logger.info(f"Retrieved data for {self.transient}.")
 
     def convert_raw_data_to_csv(self) -> Union[pd.DataFrame, None]:
@@ -74,27 +78,228 @@ class LasairDataGetter(DataGetter):
         with open(self.raw_file_path, "r") as f:
             raw_data = json.load(f)
 
-        lasair_to_general_bands = {1: "g", 2: "r"}
-        processed_data = pd.DataFrame()
+        processed_data = process_candidates(raw_data["candidates"])
+        processed_data.to_csv(self.processed_file_path, sep=',', index=False)
+        logger.info(f'Congratulations, you now have a nice data file: {self.processed_file_path}')
+        return processed_data
 
-        processed_data["time"] = [d["mjd"] for d in raw_data["candidates"] if "candid" in d]
-        processed_data["magnitude"] = [d["dc_mag"] for d in raw_data["candidates"] if "candid" in d]
-        processed_data["e_magnitude"] = [d["dc_sigmag"] for d in raw_data["candidates"] if "candid" in d]
-        processed_data["band"] = [lasair_to_general_bands[d["fid"]] for d in raw_data["candidates"] if "candid" in d]
 
-        processed_data["flux_density(mjy)"] = calc_flux_density_from_ABmag(processed_data["magnitude"].values).value
-        processed_data["flux_density_error"] = calc_flux_density_error(
-            magnitude=processed_data["magnitude"].values,
-            magnitude_error=processed_data["e_magnitude"].values,
-            reference_flux=3631,
-            magnitude_system="AB")
-        processed_data = processed_data.sort_values(by="time")
+def process_candidates(candidates: list) -> pd.DataFrame:
+    """Converts Lasair candidates into processed data sorted by time. Entries without a 'candid', i.e. non-detections,
+    are ignored.
 
-        time_of_event = min(processed_data["time"])
-        time_of_event = Time(time_of_event, format='mjd')
+    :param candidates: The candidates from the Lasair object json.
+    :type candidates: list
+    :return: The processed data.
+    :rtype: pandas.DataFrame
+    """
+    candidates = [d for d in candidates if "candid" in d]
+    processed_data = pd.DataFrame()
+    processed_data["time"] = [d["mjd"] for d in candidates]
+    processed_data["magnitude"] = [d["dc_mag"] for d in candidates]
+    processed_data["e_magnitude"] = [d["dc_sigmag"] for d in candidates]
+    processed_data["band"] = [LASAIR_TO_GENERAL_BANDS[d["fid"]] for d in candidates]
 
-        tt = Time(np.asarray(processed_data["time"], dtype=float), format='mjd')
-        processed_data['time (days)'] = ((tt - time_of_event).to(uu.day)).value
-        processed_data.to_csv(self.processed_file_path, sep=',', index=False)
-        logger.info(f'Congratulations, you now have a nice data file: {self.processed_file_path}')
-        return processed_data
+    processed_data["flux_density(mjy)"] = calc_flux_density_from_ABmag(processed_data["magnitude"].values).value
+    processed_data["flux_density_error"] = calc_flux_density_error(
+        magnitude=processed_data["magnitude"].values,
+        magnitude_error=processed_data["e_magnitude"].values,
+        reference_flux=3631,
+        magnitude_system="AB")
+    processed_data = processed_data.sort_values(by="time")
+    _set_time_since_first_detection(processed_data)
+    return processed_data
+
+
+def _set_time_since_first_detection(processed_data: pd.DataFrame) -> None:
+    time_of_event = min(processed_data["time"])
+    time_of_event = Time(time_of_event, format='mjd')
+
+    tt = Time(np.asarray(processed_data["time"], dtype=float), format='mjd')
+    processed_data['time (days)'] = ((tt - time_of_event).to(uu.day)).value
+
+
+class LasairAlertStream(object):
+
+    def __init__(
+            self, transients: list, callback: Callable, transient_type: str = "unknown", transient_class: type = None,
+            poll_interval: float = 300, max_concurrency: int = 8, base_url: str = None, **transient_kwargs: None) -> None:
+        """Polls Lasair for a watch-list of objects. Only candidates that have not been seen before are added to the
+        stored data of each object, and an updated transient is passed to `callback` whenever an object has new
+        candidates. Previously stored raw data is picked up on the first poll, so a restarted stream only emits
+        objects that changed in the meantime.
+
+        :param transients: Names of the objects to watch, e.g. ['ZTF19aagqkrq'].
+        :type transients: list
+        :param callback: Called with each updated transient. Coroutine functions are awaited.
+        :type callback: Callable
+        :param transient_type: Type of the transients. Must be from `LasairDataGetter.VALID_TRANSIENT_TYPES`.
+        :type transient_type: str, optional
+        :param transient_class: Class of the emitted transients. Default is `redback.transient.OpticalTransient`.
+        :type transient_class: type, optional
+        :param poll_interval: Time in seconds between the start of two polls.
+        :type poll_interval: float, optional
+        :param max_concurrency: Maximum number of concurrent requests.
+        :type max_concurrency: int, optional
+        :param base_url: Url of the Lasair server. Default is `LasairDataGetter.base_url`.
+        :type base_url: str, optional
+        :param transient_kwargs: Any other keyword arguments passed into `transient_class.from_lasair_data`,
+                                 e.g. data_mode.
+        :type transient_kwargs: None
+        """
+        self.callback = callback
+        self.transient_type = transient_type
+        self.transient_class = transient_class or redback.transient.transient.OpticalTransient
+        self.poll_interval = poll_interval
+        self.max_concurrency = max_concurrency
+        self.base_url = base_url or LasairDataGetter.base_url
+        self.transient_kwargs = transient_kwargs
+        self.getters = dict()
+        self._raw_data = dict()
+        self._processed_data = dict()
+        self._stop_event = None
+        for transient in transients:
+            self.add(transient)
+
+    @property
+    def transients(self) -> list:
+        """
+        :return: Names of the watched objects.
+        :rtype: list
+        """
+        return list(self.getters)
+
+    def add(self, transient: str) -> None:
+        """Adds an object to the watch-list.
+
+        :param transient: Name of the object.
+        :type transient: str
+        """
+        if transient in self.getters:
+            return
+        getter = LasairDataGetter(transient=transient, transient_type=self.transient_type)
+        getter.base_url = self.base_url
+        self.getters[transient] = getter
+
+    def remove(self, transient: str) -> None:
+        """Removes an object from the watch-list. The stored data is kept.
+
+        :param transient: Name of the object.
+        :type transient: str
+        """
+        self.getters.pop(transient, None)
+        self._raw_data.pop(transient, None)
+        self._processed_data.pop(transient, None)
+
+    def update(self, transient: str, raw_data: dict) -> pd.DataFrame:
+        """Adds the candidates in `raw_data` that are not stored yet to the raw and processed files of an object.
+
+        :param transient: Name of the object.
+        :type transient: str
+        :param raw_data: The Lasair object json.
+        :type raw_data: dict
+        :return: The processed data of the new candidates. Empty if there are none.
+        :rtype: pandas.DataFrame
+        """
+        getter = self.getters[transient]
+        if transient not in self._raw_data:
+            self._load(getter)
+        stored = self._raw_data[transient]
+        known = {d["candid"] for d in stored["candidates"] if "candid" in d}
+        new_candidates = []
+        for candidate in raw_data.get("candidates", []):
+            if "candid" in candidate and candidate["candid"] not in known:
+                known.add(candidate["candid"])
+                new_candidates.append(candidate)
+        if len(new_candidates) == 0:
+            return pd.DataFrame()
+
+        stored["candidates"].extend(new_candidates)
+        temporary_path = f"{getter.raw_file_path}.part"
+        with open(temporary_path, "w") as f:
+            json.dump(stored, f)
+        os.replace(temporary_path, getter.raw_file_path)
+
+        new_data = process_candidates(new_candidates)
+        processed_data = pd.concat([self._processed_data.get(transient), new_data], ignore_index=True)
+        processed_data = processed_data.sort_values(by="time", kind="stable", ignore_index=True)
+        _set_time_since_first_detection(processed_data)
+        processed_data.to_csv(getter.processed_file_path, sep=',', index=False)
+        self._processed_data[transient] = processed_data
+        logger.info(f"Added {len(new_candidates)} new candidates for {transient}.")
+        return new_data
+
+    def _load(self, getter: LasairDataGetter) -> None:
+        if os.path.isfile(getter.raw_file_path):
+            with open(getter.raw_file_path, "r") as f:
+                raw_data = json.load(f)
+        else:
+            raw_data = dict()
+        raw_data.setdefault("candidates", [])
+        self._raw_data[getter.transient] = raw_data
+        if any("candid" in d for d in raw_data["candidates"]):
+            self._processed_data[getter.transient] = process_candidates(raw_data["candidates"])
+
+    async def poll(self) -> dict:
+        """Polls all objects on the watch-list once and passes the updated transients to the callback.
+
+        :return: Dictionary mapping the object name to the updated transient for all objects with new candidates.
+        :rtype: dict
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        transients = self.transients
+        results = await asyncio.gather(*[self._poll_transient(transient, semaphore) for transient in transients])
+        return {transient: result for transient, result in zip(transients, results) if result is not None}
+
+    async def _poll_transient(self, transient: str, semaphore: asyncio.Semaphore):
+        getter = self.getters[transient]
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            try:
+                response = await loop.run_in_executor(None, functools.partial(
+                    redback.get_data.download.fetch, getter.url, cache=False, raise_for_status=False))
+            except Exception as e:
+                logger.warning(f"Could not poll {transient}: {e}")
+                return None
+        if response.status_code != 200 or 'does not exist' in response.text:
+            logger.warning(f"Could not poll {transient}: status {response.status_code}.")
+            return None
+        try:
+            raw_data = response.json()
+        except ValueError as e:
+            logger.warning(f"Could not poll {transient}: {e}")
+            return None
+        if transient not in self.getters or len(self.update(transient, raw_data)) == 0:
+            return None
+        updated_transient = self.transient_class.from_lasair_data(
+            name=transient, data=self._processed_data[transient], **self.transient_kwargs)
+        result = self.callback(updated_transient)
+        if asyncio.iscoroutine(result):
+            await result
+        return updated_transient
+
+    async def run(self, n_polls: int = None) -> None:
+        """Polls the watch-list every `poll_interval` seconds until `stop` is called.
+
+        :param n_polls: Stop after this many polls. Run until `stop` is called if not given.
+        :type n_polls: int, optional
+        """
+        loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        n = 0
+        while not self._stop_event.is_set():
+            start = loop.time()
+            await self.poll()
+            n += 1
+            if n_polls is not None and n >= n_polls:
+                break
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(), timeout=max(self.poll_interval - (loop.time() - start), 0))
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        """Stops `run` after the current poll."""
+        if self._stop_event is not None:
+            self._stop_event.set()
@@ -2,17 +2,15 @@ import os
 import re
 import sqlite3
 from typing import Union
-import urllib
-import urllib.request
 
 import astropy.units as uu
 import numpy as np
 import pandas as pd
-import requests
 from astropy.time import Time
 
 import redback
 import redback.get_data.directory
+import redback.get_data.download
 import redback.get_data.utils
 from redback.get_data.getter import DataGetter
 import redback.redback_errors
@@ -72,13 +70,15 @@ class OpenDataGetter(DataGetter):
             logger.warning('The raw data file already exists.')
             return None
 
-        if 'not found' in requests.get(self.url).text:
+        response = redback.get_data.download.fetch(self.url)
+        if 'not found' in response.text:
             raise ValueError(
                 f"Transient {self.transient} does not exist in the catalog. "
                 f"Are you sure you are using the right alias?")
-        urllib.request.urlretrieve(url=self.url, filename=self.raw_file_path)
+        redback.get_data.download.write(response=response, filename=self.raw_file_path)
         logger.info(f"Retrieved data for {self.transient}.")
-        urllib.request.urlretrieve(url=self.metadata_url, filename=self.metadata_path)
+        redback.get_data.download.write(
+            response=redback.get_data.download.fetch(self.metadata_url), filename=self.metadata_path)
         logger.info(f"Metadata for {self.transient} added.")
 
     def convert_raw_data_to_csv(self) -> Union[pd.DataFrame, None]:
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import io
 import os
+import re
 import time
 from typing import Union
-import urllib
-import urllib.request
+from urllib.parse import urljoin
 
 import astropy.io.ascii
 import numpy as np
@@ -12,6 +13,7 @@ import pandas as pd
 import requests
 
 import redback.get_data.directory
+import redback.get_data.download
 import redback.get_data.utils
 import redback.redback_errors
 from redback.get_data.getter import GRBDataGetter
@@ -40,9 +42,13 @@ class SwiftDataGetter(GRBDataGetter):
                         "flux_15_350_err [counts/s/det]"]
     SWIFT_PROMPT_BIN_SIZES = ['1s', '2ms', '8ms', '16ms', '64ms', '256ms']
 
+    POLL_INTERVAL = 1
+    MAX_POLL_INTERVAL = 16
+    POLL_TIMEOUT = 300
+
     def __init__(
             self, grb: str, transient_type: str, data_mode: str,
-            instrument: str = 'BAT+XRT', bin_size: str = None) -> None:
+            instrument: str = 'BAT+XRT', bin_size: str = None, use_browser: bool = True) -> None:
         """Constructor class for a data getter. The instance will be able to download the specified Swift data.
 
         :param grb: Telephone number of GRB, e.g., 'GRB140903A' or '140903A' are valid inputs.
@@ -56,12 +62,18 @@ class SwiftDataGetter(GRBDataGetter):
         :type instrument: str
         :param bin_size: Bin size. Must be from `redback.get_data.swift.SwiftDataGetter.SWIFT_PROMPT_BIN_SIZES`.
         :type bin_size: str
+        :param use_browser: Whether to download burst analyser data by clicking through the website with PhantomJS,
+                            which sets the same options as earlier versions of redback. Otherwise, the product is
+                            requested over HTTP with the default options of the website, see
+                            `SwiftDataGetter.download_burst_analyser_product`.
+        :type use_browser: bool, optional
         """
         super().__init__(grb=grb, transient_type=transient_type)
         self.grb = grb
         self.instrument = instrument
         self.data_mode = data_mode
         self.bin_size = bin_size
+        self.use_browser = use_browser
         self.directory_path, self.raw_file_path, self.processed_file_path = self.create_directory_structure()
 
     @property
@@ -143,10 +155,13 @@ class SwiftDataGetter(GRBDataGetter):
         elif self.instrument == 'XRT':
             return f'https://www.swift.ac.uk/xrt_curves/00{self.trigger}/flux.qdp'
 
-    def get_data(self) -> pd.DataFrame:
+    def get_data(self, refresh: bool = False) -> pd.DataFrame:
         """
         Downloads the raw data and produces a processed .csv file.
 
+        :param refresh: Whether to get the data again even if the raw and processed files exist.
+                        See `DataGetter.get_data`.
+        :type refresh: bool, optional
         :return: The processed data
         :rtype: pandas.DataFrame
         """
@@ -158,7 +173,7 @@ class SwiftDataGetter(GRBDataGetter):
             logger.warning(
                 "You are only downloading XRT data, you may not capture"
                 " the tail of the prompt emission.")
-        return super(SwiftDataGetter, self).get_data()
+        return super(SwiftDataGetter, self).get_data(refresh=refresh)
 
     def create_directory_structure(self) -> redback.get_data.directory.DirectoryStructure:
         """
@@ -178,20 +193,42 @@ class SwiftDataGetter(GRBDataGetter):
             logger.warning('The raw data file already exists. Returning.')
             return
 
-        response = requests.get(self.grb_website)
+        response = redback.get_data.download.fetch(self.grb_website)
         if 'No Light curve available' in response.text:
             raise redback.redback_errors.WebsiteExist(
                 f'Problem loading the website for GRB{self.stripped_grb}. '
                 f'Are you sure GRB {self.stripped_grb} has Swift data?')
         if self.instrument == 'XRT' or self.transient_type == "prompt":
-            self.download_directly()
+            self.download_directly(response=response)
         elif self.transient_type == 'afterglow':
             if self.data_mode == 'flux':
-                self.download_integrated_flux_data()
+                self.download_integrated_flux_data(page=response.text)
             elif self.data_mode == 'flux_density':
-                self.download_flux_density_data()
+                self.download_flux_density_data(page=response.text)
+
+    def download_flux_density_data(self, page: str = None) -> None:
+        """Downloads flux density data from the Swift burst analyser.
+
+        :param page: The burst analyser page of the GRB. Only used if `use_browser` is False, fetched if not given.
+        :type page: str, optional
+        """
+        if self.use_browser:
+            self.download_flux_density_data_with_browser()
+        else:
+            self.download_burst_analyser_product(product='xrt_DENSITY', page=page)
+
+    def download_integrated_flux_data(self, page: str = None) -> None:
+        """Downloads integrated flux data from the Swift burst analyser.
 
-    def download_flux_density_data(self) -> None:
+        :param page: The burst analyser page of the GRB. Only used if `use_browser` is False, fetched if not given.
+        :type page: str, optional
+        """
+        if self.use_browser:
+            self.download_integrated_flux_data_with_browser()
+        else:
+            self.download_burst_analyser_product(product='batxrt_XRTBAND', page=page)
+
+    def download_flux_density_data_with_browser(self) -> None:
         """Downloads flux density data from the Swift website.
         Uses the PhantomJS headless browser to click through the website.
         Properly quits the driver.
@@ -203,10 +240,7 @@ class SwiftDataGetter(GRBDataGetter):
             time.sleep(20)
             driver.find_element_by_id("xrt_DENSITY_makeDownload").click()
             time.sleep(20)
-            grb_url = driver.current_url
-            # scrape the data
-            urllib.request.urlretrieve(url=grb_url, filename=self.raw_file_path)
-            logger.info(f'Congratulations, you now have raw data for {self.grb}')
+            self._download_current_url(driver=driver)
         except Exception as e:
             logger.warning(f'Cannot load the website for {self.grb} \n'
                            f'Failed with exception: \n'
@@ -214,9 +248,8 @@ class SwiftDataGetter(GRBDataGetter):
         finally:
             # Close the driver and all opened windows
             driver.quit()
-            urllib.request.urlcleanup()
 
-    def download_integrated_flux_data(self) -> None:
+    def download_integrated_flux_data_with_browser(self) -> None:
         """Downloads integrated flux density data from the Swift website.
         Uses the PhantomJS headless browser to click through the website.
         Properly quits the driver.
@@ -235,16 +268,14 @@ class SwiftDataGetter(GRBDataGetter):
             # Select option for flux density
             flux_density1 = "batxrtband1"
             flux_density0 = "batxrtband0"
-            if (check_element(driver, flux_density1)) and (check_element(driver, flux_density0)):
+            if check_element(driver, flux_density1) and \
+                    check_element(driver, flux_density0):
                 driver.find_element_by_xpath(".//*[@id='batxrtband1']").click()
                 driver.find_element_by_xpath(".//*[@id='batxrtband0']").click()
             # Generate data file
             driver.find_element_by_xpath(".//*[@id='batxrt_XRTBAND_makeDownload']").click()
             time.sleep(20)
-            grb_url = driver.current_url
-            driver.quit()
-            urllib.request.urlretrieve(grb_url, self.raw_file_path)
-            logger.info(f'Congratulations, you now have raw data for {self.grb}')
+            self._download_current_url(driver=driver)
         except Exception as e:
             logger.warning(f'Cannot load the website for {self.grb} \n'
                            f'Failed with exception: \n'
@@ -252,20 +283,84 @@ class SwiftDataGetter(GRBDataGetter):
         finally:
             # Close the driver and all opened windows
             driver.quit()
-            urllib.request.urlcleanup()
 
-    def download_directly(self) -> None:
-        """Downloads prompt or XRT data directly without using PhantomJS if possible."""
+    def _download_current_url(self, driver) -> None:
+        """Downloads the page the browser is on into the raw file path.
+
+        :param driver: The web driver.
+        """
+        response = redback.get_data.download.fetch(driver.current_url)
+        redback.get_data.download.write(response=response, filename=self.raw_file_path)
+        logger.info(f'Congratulations, you now have raw data for {self.grb}')
+
+    def download_burst_analyser_product(self, product: str, page: str = None) -> None:
+        """Finds the link to a data product on the burst analyser page and downloads it once it has been generated.
+        The product is generated with the default options of the burst analyser. The browser based download
+        changes some of them: it turns off the subplot for both products, and for the integrated flux it selects
+        SNR 4 binning of the BAT data and toggles the two band options. Binning and bands of the downloaded data can
+        therefore differ from data downloaded with `use_browser`.
+
+        :param product: Name of the product as it appears in the link, e.g. 'xrt_DENSITY'.
+        :type product: str
+        :param page: The burst analyser page of the GRB. Fetched if not given.
+        :type page: str, optional
+        """
+        if page is None:
+            page = redback.get_data.download.fetch(self.grb_website).text
+        links = sorted(set(re.findall(r'href=[\'"]([^\'"]*{}[^\'"]*)[\'"]'.format(re.escape(product)), page)))
+        if len(links) != 1:
+            raise ValueError(f"Expected one {product} product on {self.grb_website}, found {links}")
+        response = self.poll_for_product(urljoin(self.grb_website, links[0]))
+        redback.get_data.download.write(response=response, filename=self.raw_file_path)
+        logger.info(f'Congratulations, you now have raw data for {self.grb}')
+
+    def poll_for_product(self, url: str) -> requests.Response:
+        """Polls a product url until the product has been generated. The waiting time between attempts starts at
+        `POLL_INTERVAL` seconds and doubles up to `MAX_POLL_INTERVAL` seconds.
+
+        :param url: The product url.
+        :type url: str
+        :return: The response containing the product.
+        :rtype: requests.Response
+        """
+        interval = self.POLL_INTERVAL
+        deadline = time.monotonic() + self.POLL_TIMEOUT
+        while True:
+            response = redback.get_data.download.fetch(url, raise_for_status=False)
+            if response.status_code == 200 and self._is_product_ready(response.text):
+                return response
+            if time.monotonic() + interval > deadline:
+                raise TimeoutError(f"{url} was not ready after {self.POLL_TIMEOUT} seconds.")
+            time.sleep(interval)
+            interval = min(2 * interval, self.MAX_POLL_INTERVAL)
+
+    @staticmethod
+    def _is_product_ready(text: str) -> bool:
+        """
+        :param text: The content of the product url.
+        :type text: str
+        :return: Whether the content contains at least one line of data.
+        :rtype: bool
+        """
+        return any(line[:1].isnumeric() or line[:1] == '-' for line in text.splitlines())
+
+    def download_directly(self, response: requests.Response = None) -> None:
+        """Downloads prompt or XRT data directly.
+
+        :param response: The response of the GRB website if it has already been fetched.
+        :type response: requests.Response, optional
+        """
         try:
-            urllib.request.urlretrieve(self.grb_website, self.raw_file_path)
+            if response is None:
+                response = redback.get_data.download.fetch(self.grb_website)
+            response.raise_for_status()
+            redback.get_data.download.write(response=response, filename=self.raw_file_path)
             logger.info(f'Congratulations, you now have raw {self.instrument} {self.transient_type} '
                         f'data for {self.grb}')
         except Exception as e:
             logger.warning(f'Cannot load the website for {self.grb} \n'
                            f'Failed with exception: \n'
                            f'{e}')
-        finally:
-            urllib.request.urlcleanup()
 
     def convert_raw_data_to_csv(self) -> Union[pd.DataFrame, None]:
         """Converts the raw data into processed data and saves it into the processed file path.
@@ -328,22 +423,9 @@ class SwiftDataGetter(GRBDataGetter):
         :return: The processed data.
         :rtype: pandas.DataFrame
         """
-        data = {key: [] for key in self.INTEGRATED_FLUX_KEYS}
-        with open(self.raw_file_path) as f:
-            started = False
-            for num, line in enumerate(f.readlines()):
-                if line.startswith('NO NO NO'):
-                    started = True
-                if not started:
-                    continue
-                if line.startswith('!'):
-                    instrument = line[2:].replace('\n', '')
-                if line[0].isnumeric() or line[0] == '-':
-                    line_items = line.split('\t')
-                    data['Instrument'] = instrument
-                    for key, item in zip(self.INTEGRATED_FLUX_KEYS, line_items):
-                        data[key].append(item.replace('\n', ''))
-        df = pd.DataFrame(data=data)
+        data, labels = _read_qdp_blocks(self.raw_file_path, n_columns=len(self.INTEGRATED_FLUX_KEYS) - 1)
+        df = pd.DataFrame(data=data, columns=self.INTEGRATED_FLUX_KEYS[:-1])
+        df['Instrument'] = labels
         df.to_csv(self.processed_file_path, index=False, sep=',')
         return df
 
@@ -354,21 +436,41 @@ class SwiftDataGetter(GRBDataGetter):
         :return: The processed data.
         :rtype: pandas.DataFrame
         """
-        data = {key: [] for key in self.FLUX_DENSITY_KEYS}
-        with open(self.raw_file_path) as f:
-            started = False
-            for num, line in enumerate(f.readlines()):
-                if line.startswith('NO NO NO'):
-                    started = True
-                if not started:
-                    continue
-                if line[0].isnumeric() or line[0] == '-':
-                    line_items = line.split('\t')
-                    for key, item in zip(self.FLUX_DENSITY_KEYS, line_items):
-                        data[key].append(item.replace('\n', ''))
-        data['Flux [mJy]'] = [float(x) * 1000 for x in data['Flux [mJy]']]
-        data['Pos. flux err [mJy]'] = [float(x) * 1000 for x in data['Pos. flux err [mJy]']]
-        data['Neg. flux err [mJy]'] = [float(x) * 1000 for x in data['Neg. flux err [mJy]']]
-        df = pd.DataFrame(data=data)
+        data, _ = _read_qdp_blocks(self.raw_file_path, n_columns=len(self.FLUX_DENSITY_KEYS))
+        data[:, 3:] *= 1000
+        df = pd.DataFrame(data=data, columns=self.FLUX_DENSITY_KEYS)
         df.to_csv(self.processed_file_path, index=False, sep=',')
         return df
+
+
+def _read_qdp_blocks(filename: str, n_columns: int) -> tuple:
+    """Reads the data section of a burst analyser QDP file, which starts at the first 'NO NO NO' line.
+    The section is split once at the 'NO' and '!' marker lines and each block is loaded with a single NumPy call.
+
+    :param filename: The QDP file.
+    :type filename: str
+    :param n_columns: Number of leading columns to load.
+    :type n_columns: int
+    :return: Array of shape (n_rows, n_columns) and the label of the '!' line preceding the block of each row.
+    :rtype: tuple
+    """
+    with open(filename) as f:
+        text = f.read()
+    start = re.search(r'^NO NO NO', text, flags=re.M)
+    if start is None:
+        return np.empty((0, n_columns)), np.empty(0, dtype=str)
+    parts = re.split(r'\n[ \t]*((?:!|NO|READ)[^\n]*)', '\n' + text[start.start():])
+    label = ''
+    blocks = []
+    labels = []
+    for marker, block in zip(parts[1::2], parts[2::2]):
+        if marker.startswith('!'):
+            label = marker[1:].strip()
+        if block.strip() == '':
+            continue
+        block = np.loadtxt(io.StringIO(block), delimiter='\t', usecols=range(n_columns), comments='!', ndmin=2)
+        blocks.append(block)
+        labels.append(label)
+    if len(blocks) == 0:
+        return np.empty((0, n_columns)), np.empty(0, dtype=str)
+    return np.concatenate(blocks), np.repeat(labels, [len(block) for block in blocks])
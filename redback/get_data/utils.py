@@ -1,9 +1,19 @@
 import os
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Union
+
+import numpy as np
 import pandas as pd
 
 import astropy.io.ascii
 
 _dirname = os.path.dirname(__file__)
+_short_table = os.path.abspath(os.path.join(_dirname, '../tables/SGRB_table.txt'))
+_long_table = os.path.abspath(os.path.join(_dirname, '../tables/LGRB_table.txt'))
+_batse_table = os.path.abspath(os.path.join(_dirname, '../tables/BATSE_trigger_table.txt'))
+_photon_index_column = 'BAT Photon Index (15-150 keV) (PL = simple power-law, CPL = cutoff power-law)'
 
 
 def get_trigger_number(grb: str) -> str:
@@ -15,12 +25,11 @@ def get_trigger_number(grb: str) -> str:
     :rtype: str
     """
     grb = grb.lstrip('GRB')
-    grb_table = get_grb_table()
-    trigger = grb_table.query('GRB == @grb')['Trigger Number']
-    if len(trigger) == 0:
-        raise TriggerNotFoundError(f"The trigger for {grb} does not exist in the table.")
-    else:
-        return trigger.values[0]
+    for table in [_long_table, _short_table]:
+        row = get_grb_catalogue_row(grb=grb, table=table)
+        if row is not None:
+            return row['Trigger Number']
+    raise TriggerNotFoundError(f"The trigger for {grb} does not exist in the table.")
 
 
 def get_grb_table() -> pd.DataFrame:
@@ -28,13 +37,57 @@ def get_grb_table() -> pd.DataFrame:
     :return: The combined long and short GRB table.
     :rtype: pandas.DataFrame
     """
-    short_table = os.path.join(_dirname, '../tables/SGRB_table.txt')
-    long_table = os.path.join(_dirname, '../tables/LGRB_table.txt')
-    sgrb = pd.read_csv(
-        short_table, header=0, error_bad_lines=False, delimiter='\t', dtype='str')
-    lgrb = pd.read_csv(
-        long_table, header=0, error_bad_lines=False, delimiter='\t', dtype='str')
-    return pd.concat([lgrb, sgrb], ignore_index=True)
+    return pd.concat([_read_grb_table(_long_table), _read_grb_table(_short_table)], ignore_index=True)
+
+
+@lru_cache(maxsize=None)
+def _read_grb_table(table: str) -> pd.DataFrame:
+    """Reads a Swift GRB table once per process. Callers must not modify the returned data frame.
+
+    :param table: Path to the table.
+    :type table: str
+    :return: The GRB table.
+    :rtype: pandas.DataFrame
+    """
+    return pd.read_csv(table, header=0, error_bad_lines=False, delimiter='\t', dtype='str')
+
+
+def get_grb_catalogue(table: str) -> MappingProxyType:
+    """Loads a Swift GRB table once per process and indexes it by GRB name.
+    Missing photon indices are set to 0. If a GRB is listed multiple times, the first row is used.
+
+    :param table: Path to the table, e.g. the `event_table` of an `Afterglow`.
+    :type table: str
+    :return: Read-only mapping from GRB name without the 'GRB' prefix to a read-only row mapping column to value.
+    :rtype: MappingProxyType
+    """
+    return _index_grb_table(os.path.abspath(table))
+
+
+@lru_cache(maxsize=None)
+def _index_grb_table(table: str) -> MappingProxyType:
+    data_frame = _read_grb_table(table)
+    photon_index = data_frame[_photon_index_column].fillna(0)
+    catalogue = dict()
+    for row in data_frame.assign(**{_photon_index_column: photon_index}).to_dict(orient='records'):
+        catalogue.setdefault(row['GRB'], MappingProxyType(row))
+    return MappingProxyType(catalogue)
+
+
+def get_grb_catalogue_row(grb: str, table: str) -> Union[dict, None]:
+    """Looks up a single GRB in the indexed catalogue.
+
+    :param grb: Telephone number of GRB, e.g., 'GRB140903A' or '140903A' are valid inputs.
+    :type grb: str
+    :param table: Path to the table, e.g. the `event_table` of an `Afterglow`.
+    :type table: str
+    :return: Copy of the row mapping column to value or None if the GRB is not in the table.
+    :rtype: Union[dict, None]
+    """
+    row = get_grb_catalogue(table=table).get(grb.lstrip('GRB'))
+    if row is None:
+        return None
+    return dict(row)
 
 
 def get_batse_trigger_from_grb(grb: str) -> int:
@@ -48,26 +101,69 @@ def get_batse_trigger_from_grb(grb: str) -> int:
     :rtype: int
     """
     grb = "GRB" + grb.lstrip("GRB")
+    try:
+        return get_batse_trigger_index()[grb]
+    except KeyError:
+        raise ValueError(f"{grb} is not in the BATSE trigger table.")
 
-    ALPHABET = "ABCDEFGHIJKLMNOP"
-    dat = astropy.io.ascii.read(f"{_dirname}/../tables/BATSE_trigger_table.txt")
-    batse_triggers = list(dat['col1'])
-    object_labels = list(dat['col2'])
 
-    label_locations = dict()
-    for i, label in enumerate(object_labels):
-        if label in label_locations:
-            label_locations[label].append(i)
-        else:
-            label_locations[label] = [i]
+def get_batse_triggers_from_grbs(grbs: Union[list, np.ndarray]) -> np.ndarray:
+    """Gets the BATSE triggers for many GRBs at once. See `get_batse_trigger_from_grb` for the naming convention.
 
-    for label, location in label_locations.items():
-        if len(location) != 1:
-            for i, loc in enumerate(location):
-                object_labels[loc] = object_labels[loc] + ALPHABET[i]
+    :param grbs: Telephone numbers of the GRBs.
+    :type grbs: Union[list, np.ndarray]
+    :return: The BATSE trigger numbers in the same order as the input.
+    :rtype: np.ndarray
+    """
+    index = get_batse_trigger_index()
+    grbs = ["GRB" + grb.lstrip("GRB") for grb in grbs]
+    missing = [grb for grb in grbs if grb not in index]
+    if len(missing) != 0:
+        raise ValueError(f"{missing} are not in the BATSE trigger table.")
+    return np.array([index[grb] for grb in grbs], dtype=int)
+
+
+def get_batse_trigger_index(cache_file: str = None) -> MappingProxyType:
+    """Builds the index from GRB name to BATSE trigger once per process. Labels that appear multiple times in the
+    table get successive alphabetical letters appended.
+
+    :param cache_file: Optional `.npz` file to persist the index in. The index is read from this file if it exists
+                       and is newer than the trigger table, otherwise it is built from the table and saved.
+                       The `.npz` extension is appended if it is missing.
+    :type cache_file: str, optional
+    :return: Read-only mapping from GRB name to BATSE trigger number.
+    :rtype: MappingProxyType
+    """
+    if cache_file is not None and not cache_file.endswith('.npz'):
+        cache_file = f"{cache_file}.npz"
+    return _build_batse_trigger_index(cache_file)
+
+
+@lru_cache(maxsize=None)
+def _build_batse_trigger_index(cache_file: str = None) -> MappingProxyType:
+    if cache_file is not None and os.path.isfile(cache_file) and \
+            os.path.getmtime(cache_file) >= os.path.getmtime(_batse_table):
+        with np.load(cache_file) as data:
+            return MappingProxyType(dict(zip(data['labels'].tolist(), data['triggers'].tolist())))
+
+    ALPHABET = "ABCDEFGHIJKLMNOP"
+    dat = astropy.io.ascii.read(_batse_table)
+    batse_triggers = np.array(dat['col1'], dtype=int)
+    object_labels = list(dat['col2'])
 
-    index = object_labels.index(grb)
-    return int(batse_triggers[index])
+    counts = Counter(object_labels)
+    seen = Counter()
+    index = dict()
+    for trigger, label in zip(batse_triggers.tolist(), object_labels):
+        if counts[label] != 1:
+            suffix = ALPHABET[seen[label]]
+            seen[label] += 1
+            label = label + suffix
+        index.setdefault(label, trigger)
+
+    if cache_file is not None:
+        np.savez(cache_file, labels=np.array(list(index.keys())), triggers=np.array(list(index.values())))
+    return MappingProxyType(index)
 
 
 class TriggerNotFoundError(Exception):
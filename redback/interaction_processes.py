@@ -7,7 +7,7 @@ from redback.constants import *
 class Diffusion(object):
     def __init__(self, time, luminosity, kappa, kappa_gamma, mej, vej, **kwargs):
         """
-        :param time: source frame time in days
+        :param time: source frame time in days, sorted in ascending order
         :param luminosity: luminosity
         :param kappa: opacity
         :param kappa_gamma: gamma-ray opacity
@@ -64,7 +64,7 @@ class Diffusion(object):
 class AsphericalDiffusion(object):
     def __init__(self, time, luminosity, kappa, kappa_gamma, mej, vej, area_projection, area_reference, **kwargs):
         """
-        :param time: source frame time in days
+        :param time: source frame time in days, sorted in ascending order
         :param luminosity: luminosity
         :param kappa: opacity
         :param kappa_gamma: gamma-ray opacity
@@ -128,7 +128,7 @@ class AsphericalDiffusion(object):
 class CSMDiffusion(object):
     def __init__(self, time, luminosity, kappa, r_photosphere, mass_csm_threshold, csm_mass, **kwargs):
         """
-        :param time: source frame time in days
+        :param time: source frame time in days, sorted in ascending order
         :param luminosity: luminosity
         :param kappa: opacity
         :param csm_mass: csm mass in solar masses
@@ -192,7 +192,7 @@ class CSMDiffusion(object):
 class Viscous(object):
     def __init__(self, time, luminosity, t_viscous, **kwargs):
         """
-        :param time: source frame time in days
+        :param time: source frame time in days, sorted in ascending order
         :param luminosity: luminosity
         :param t_viscous: viscous timescale
         Adds new attribute for luminosity accounting for the interaction process
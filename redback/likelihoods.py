@@ -2,7 +2,9 @@ import numpy as np
 from typing import Any, Union
 
 import bilby
-from scipy.special import gammaln
+from scipy.special import gammaln, log_ndtr
+
+import redback.profiling
 
 
 class _RedbackLikelihood(bilby.Likelihood):
@@ -27,6 +29,26 @@ class _RedbackLikelihood(bilby.Likelihood):
         parameters = bilby.core.utils.introspection.infer_parameters_from_function(func=function)
         super().__init__(parameters=dict.fromkeys(parameters))
 
+    def __init_subclass__(cls, **kwargs: None) -> None:
+        super().__init_subclass__(**kwargs)
+        if 'log_likelihood' in cls.__dict__:
+            cls.log_likelihood = redback.profiling.profile_likelihood(cls.__dict__['log_likelihood'])
+
+    @property
+    def function(self) -> callable:
+        """
+        :return: The model. Wrapped by the active profiler, if there is one.
+        :rtype: callable
+        """
+        profiler = redback.profiling.get_profiler()
+        if profiler is None:
+            return self._function
+        return profiler.wrap_model(self._function)
+
+    @function.setter
+    def function(self, function: callable) -> None:
+        self._function = function
+
     @property
     def kwargs(self) -> dict:
         return self._kwargs
@@ -225,9 +247,13 @@ class GaussianLikelihoodQuadratureNoise(GaussianLikelihood):
 class GaussianLikelihoodQuadratureNoiseNonDetections(GaussianLikelihoodQuadratureNoise):
     def __init__(
             self, x: np.ndarray, y: np.ndarray, sigma_i: Union[float, np.ndarray], function: callable,
-            kwargs: dict = None, upperlimit_kwargs: dict = None) -> None:
+            kwargs: dict = None, upperlimit_kwargs: dict = None, upperlimit_x: np.ndarray = None) -> None:
         """A general Gaussian likelihood - the parameters are inferred from the
-        arguments of function. Takes into account non-detections with a Uniform likelihood for those points
+        arguments of function. Takes into account non-detections with a censored Gaussian likelihood,
+        i.e., the probability that the observed flux lies below the upper limit.
+
+        Whenever the detection and upper limit kwargs can be concatenated, the model is evaluated
+        only once per likelihood call on the combined detection and non-detection times.
 
         :type x: np.ndarray
         :param y: The y values.
@@ -243,10 +269,34 @@ class GaussianLikelihoodQuadratureNoiseNonDetections(GaussianLikelihoodQuadratur
         :type function: callable
         :param kwargs: Any additional keywords for 'function'.
         :type kwargs: dict
+        :param upperlimit_kwargs:
+            Must contain 'flux', the upper limits. Optionally contains 'sigma_i', the noise on the upper limits
+            (Default 0), and any keywords for 'function' that differ for the non-detections e.g., 'frequency'.
+        :type upperlimit_kwargs: dict
+        :param upperlimit_x: The x values of the non-detections. Uses `x` if not given.
+        :type upperlimit_x: Union[np.ndarray, None]
         """
         super().__init__(x=x, y=y, sigma_i=sigma_i, function=function, kwargs=kwargs)
+        self._upperlimit_x = upperlimit_x
         self.upperlimit_kwargs = upperlimit_kwargs
 
+    @property
+    def upperlimit_kwargs(self) -> dict:
+        return self._upperlimit_kwargs
+
+    @upperlimit_kwargs.setter
+    def upperlimit_kwargs(self, upperlimit_kwargs: dict) -> None:
+        if upperlimit_kwargs is None:
+            self._upperlimit_kwargs = dict()
+        else:
+            self._upperlimit_kwargs = upperlimit_kwargs
+
+    @property
+    def upperlimit_x(self) -> np.ndarray:
+        if self._upperlimit_x is None:
+            return self.x
+        return self._upperlimit_x
+
     @property
     def upperlimit_flux(self) -> float:
         """
@@ -255,6 +305,79 @@ class GaussianLikelihoodQuadratureNoiseNonDetections(GaussianLikelihoodQuadratur
         """
         return self.upperlimit_kwargs['flux']
 
+    @property
+    def upperlimit_sigma(self) -> Union[float, np.ndarray]:
+        """
+        :return: The standard deviation of the full noise on the upper limits.
+        :rtype: Union[float, np.ndarray]
+        """
+        return np.sqrt(self.upperlimit_kwargs.get('sigma_i', 0) ** 2. + self.sigma ** 2.)
+
+    @property
+    def _upperlimit_model_kwargs(self) -> dict:
+        model_kwargs = dict(self.kwargs)
+        model_kwargs.update({k: v for k, v in self.upperlimit_kwargs.items() if k not in ['flux', 'sigma_i']})
+        return model_kwargs
+
+    def _combine_detections_and_upper_limits(self) -> tuple:
+        """
+        Concatenates the detection and non-detection x values and per-point kwargs so that the model
+        can be evaluated once for both. A kwarg is per-point if it is one-dimensional with the length of
+        the respective x values. Kwargs that are not per-point must be equal for detections and non-detections.
+        The combined x values and per-point kwargs are sorted by x, as many models assume sorted times.
+        This is evaluated on every call, so that changes to `x`, `kwargs`, or `upperlimit_kwargs` are picked up.
+
+        :return: The sorted combined x values and kwargs, and the order that sorts the concatenated x values,
+                 or (None, None, None) if the kwargs can not be combined.
+        :rtype: tuple
+        """
+        n_upper_limits = len(self.upperlimit_x)
+        combined_x = np.concatenate((self.x, self.upperlimit_x))
+        order = np.argsort(combined_x, kind='stable')
+        combined_kwargs = dict()
+        for key, upperlimit_value in self._upperlimit_model_kwargs.items():
+            value = self.kwargs.get(key, upperlimit_value)
+            per_point = np.ndim(value) == 1 and len(value) == self.n
+            upperlimit_per_point = np.ndim(upperlimit_value) == 1 and len(upperlimit_value) == n_upper_limits
+            if not per_point and not upperlimit_per_point:
+                if not self._is_equal(value, upperlimit_value):
+                    return None, None, None
+                combined_kwargs[key] = value
+            elif (per_point or np.ndim(value) == 0) and (upperlimit_per_point or np.ndim(upperlimit_value) == 0):
+                combined_kwargs[key] = np.concatenate((np.broadcast_to(value, self.n),
+                                                       np.broadcast_to(upperlimit_value, n_upper_limits)))[order]
+            else:
+                return None, None, None
+        return combined_x[order], combined_kwargs, order
+
+    @staticmethod
+    def _is_equal(value: Any, other: Any) -> bool:
+        if value is other:
+            return True
+        try:
+            return np.shape(value) == np.shape(other) and bool(np.all(value == other))
+        except (TypeError, ValueError):
+            return False
+
+    def _evaluate_model(self) -> tuple:
+        """
+        Evaluates the model once at the sorted detections and non-detections if possible. Falls back to separate
+        calls if the kwargs can not be combined or the model does not return one value per x value.
+
+        :return: The model at the detections and at the non-detections.
+        :rtype: tuple
+        """
+        combined_x, combined_kwargs, order = self._combine_detections_and_upper_limits()
+        if combined_kwargs is not None:
+            sorted_model = self.function(combined_x, **self.parameters, **combined_kwargs)
+            if np.ndim(sorted_model) > 0 and len(sorted_model) == len(combined_x):
+                combined_model = np.empty_like(sorted_model)
+                combined_model[order] = sorted_model
+                return combined_model[:self.n], combined_model[self.n:]
+        model = self.function(self.x, **self.parameters, **self.kwargs)
+        upperlimit_model = self.function(self.upperlimit_x, **self.parameters, **self._upperlimit_model_kwargs)
+        return model, upperlimit_model
+
     def log_likelihood_y(self) -> float:
         """
         :return: The log-likelihood due to y-errors.
@@ -267,17 +390,20 @@ class GaussianLikelihoodQuadratureNoiseNonDetections(GaussianLikelihoodQuadratur
         :return: The log-likelihood due to the upper limit.
         :rtype: float
         """
-        flux = self.function(self.x, **self.parameters, **self.upperlimit_kwargs)
-        log_l = -np.ones(len(flux)) * np.log(self.upperlimit_flux)
-        log_l[flux >= self.upperlimit_flux] = np.nan_to_num(-np.inf)
-        return np.nan_to_num(np.sum(log_l))
+        flux = self.function(self.upperlimit_x, **self.parameters, **self._upperlimit_model_kwargs)
+        return self._censored_log_likelihood(flux=flux)
+
+    def _censored_log_likelihood(self, flux: np.ndarray) -> float:
+        return np.nan_to_num(np.sum(log_ndtr((self.upperlimit_flux - flux) / self.upperlimit_sigma)))
 
     def log_likelihood(self) -> float:
         """
         :return: The log-likelihood.
         :rtype: float
         """
-        return self.log_likelihood_y() + self.log_likelihood_upper_limit()
+        model, upperlimit_model = self._evaluate_model()
+        log_l_y = self._gaussian_log_likelihood(res=self.y - model, sigma=self.full_sigma)
+        return log_l_y + self._censored_log_likelihood(flux=upperlimit_model)
 
 
 class GRBGaussianLikelihood(GaussianLikelihood):
@@ -0,0 +1,290 @@
+import contextlib
+import functools
+import time
+import tracemalloc
+
+import numpy as np
+
+from redback.utils import logger
+
+_profiler = None
+
+
+class _ComponentStatistics(object):
+
+    def __init__(self, max_samples: int = 10000) -> None:
+        """Call count, total time, allocations, and a reservoir sample of the latencies of one component.
+
+        :param max_samples: Maximum number of latencies kept for the percentiles.
+        :type max_samples: int, optional
+        """
+        self.calls = 0
+        self.total_time = 0.
+        self.allocated = 0
+        self.max_samples = max_samples
+        self._latencies = []
+        self._rng = np.random.default_rng(0)
+
+    def record(self, elapsed: float, allocated: int = 0) -> None:
+        self.calls += 1
+        self.total_time += elapsed
+        self.allocated += allocated
+        if len(self._latencies) < self.max_samples:
+            self._latencies.append(elapsed)
+        else:
+            index = self._rng.integers(self.calls)
+            if index < self.max_samples:
+                self._latencies[index] = elapsed
+
+    def summary(self) -> dict:
+        if self.calls == 0:
+            return dict(calls=0, total_time=0., mean=np.nan, p50=np.nan, p90=np.nan, p99=np.nan, allocated=0)
+        p50, p90, p99 = np.percentile(self._latencies, [50, 90, 99])
+        return dict(calls=self.calls, total_time=self.total_time, mean=self.total_time / self.calls,
+                    p50=p50, p90=p90, p99=p99, allocated=self.allocated)
+
+
+class Profiler(object):
+
+    def __init__(self, track_allocations: bool = False, log_interval: float = 60., max_samples: int = 10000) -> None:
+        """Records the time spent in the likelihoods and models. Use it through the `profile` context manager.
+
+        :param track_allocations: Whether to record the memory allocated per component with `tracemalloc`.
+                                  This slows down every call considerably.
+        :type track_allocations: bool, optional
+        :param log_interval: Log the number of likelihood evaluations per second every `log_interval` seconds.
+                             Never log if None.
+        :type log_interval: float, optional
+        :param max_samples: Maximum number of latencies kept per component for the percentiles.
+        :type max_samples: int, optional
+        """
+        self.track_allocations = track_allocations
+        self.log_interval = log_interval
+        self.max_samples = max_samples
+        self.components = dict()
+        self.start_time = time.perf_counter()
+        self.stop_time = None
+        self._wrapped_models = dict()
+        self._runs = []
+        self._depth = 0
+        self._model_time = 0.
+        self._last_log_time = self.start_time
+        self._last_log_calls = 0
+
+    @property
+    def wall_time(self) -> float:
+        """
+        :return: Time in seconds since the profiler started, or until it stopped.
+        :rtype: float
+        """
+        return (self.stop_time or time.perf_counter()) - self.start_time
+
+    def stop(self) -> None:
+        self.stop_time = time.perf_counter()
+
+    def record(self, component: str, elapsed: float, allocated: int = 0) -> None:
+        """Records a single call of a component.
+
+        :param component: Name of the component.
+        :type component: str
+        :param elapsed: Duration of the call in seconds.
+        :type elapsed: float
+        :param allocated: Bytes allocated during the call.
+        :type allocated: int, optional
+        """
+        if component not in self.components:
+            self.components[component] = _ComponentStatistics(max_samples=self.max_samples)
+        self.components[component].record(elapsed=elapsed, allocated=allocated)
+        for run in self._runs:
+            run.record(component, elapsed=elapsed, allocated=allocated)
+
+    def start_run(self) -> 'Profiler':
+        """Starts recording the calls of a single run, e.g. a fit, separately from the rest of the context.
+
+        :return: A profiler that records every call made until `stop_run`, in addition to this profiler.
+        :rtype: Profiler
+        """
+        run = Profiler(track_allocations=self.track_allocations, log_interval=None, max_samples=self.max_samples)
+        self._runs.append(run)
+        return run
+
+    def stop_run(self, run: 'Profiler') -> None:
+        """
+        :param run: A profiler returned by `start_run`.
+        :type run: Profiler
+        """
+        run.stop()
+        self._runs.remove(run)
+
+    def _start_allocations(self) -> int:
+        if not self.track_allocations:
+            return 0
+        current, _ = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        return current
+
+    def _allocated_since(self, current: int) -> int:
+        if not self.track_allocations:
+            return 0
+        _, peak = tracemalloc.get_traced_memory()
+        return max(peak - current, 0)
+
+    def call_likelihood(self, log_likelihood: callable, likelihood: object) -> float:
+        """Calls and times a `log_likelihood` method. Nested calls are timed as part of the outermost call.
+
+        :param log_likelihood: The unbound `log_likelihood` method.
+        :type log_likelihood: callable
+        :param likelihood: The likelihood instance.
+        :type likelihood: object
+        :return: The log likelihood.
+        :rtype: float
+        """
+        if self._depth > 0:
+            return log_likelihood(likelihood)
+        self._depth += 1
+        self._model_time = 0.
+        memory = self._start_allocations()
+        start = time.perf_counter()
+        try:
+            return log_likelihood(likelihood)
+        finally:
+            elapsed = time.perf_counter() - start
+            allocated = self._allocated_since(memory)
+            self._depth -= 1
+            self.record('likelihood', elapsed=elapsed, allocated=allocated)
+            self.record('likelihood_arithmetic', elapsed=max(elapsed - self._model_time, 0.))
+            self._log_rate()
+
+    def wrap_model(self, function: callable) -> callable:
+        """
+        :param function: A model function.
+        :type function: callable
+        :return: The function wrapped so that each call is recorded as the component 'model:<name>'.
+        :rtype: callable
+        """
+        wrapped = self._wrapped_models.get(function)
+        if wrapped is not None:
+            return wrapped
+        component = f"model:{getattr(function, '__name__', repr(function))}"
+
+        @functools.wraps(function)
+        def wrapped(*args, **kwargs):
+            memory = self._start_allocations()
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._model_time += elapsed
+                self.record(component, elapsed=elapsed, allocated=self._allocated_since(memory))
+
+        self._wrapped_models[function] = wrapped
+        return wrapped
+
+    def _log_rate(self) -> None:
+        if self.log_interval is None:
+            return
+        now = time.perf_counter()
+        if now - self._last_log_time < self.log_interval:
+            return
+        calls = self.components['likelihood'].calls
+        rate = (calls - self._last_log_calls) / (now - self._last_log_time)
+        logger.info(f"{calls} likelihood evaluations, currently {rate:.1f} per second.")
+        self._last_log_time = now
+        self._last_log_calls = calls
+
+    def summary(self) -> dict:
+        """
+        :return: Dictionary with the statistics of each component, i.e. the call count, total time, mean time,
+                 50th, 90th, and 99th percentile latency in seconds, and bytes allocated. Also contains the
+                 wall time, the likelihood evaluations per second, and the time outside the likelihood, which
+                 is the sampler overhead during a run.
+        :rtype: dict
+        """
+        wall_time = self.wall_time
+        likelihood = self.components.get('likelihood', _ComponentStatistics())
+        return dict(components={name: statistics.summary() for name, statistics in self.components.items()},
+                    wall_time=wall_time, likelihood_evaluations_per_second=likelihood.calls / wall_time,
+                    sampler_overhead=max(wall_time - likelihood.total_time, 0.))
+
+
+def get_profiler():
+    """
+    :return: The active profiler or None if profiling is disabled.
+    :rtype: Union[Profiler, None]
+    """
+    return _profiler
+
+
+@contextlib.contextmanager
+def profile(track_allocations: bool = False, log_interval: float = 60., max_samples: int = 10000):
+    """Profiles all likelihood and model calls inside the context. `fit_model` attaches the summary of the calls
+    during its own run to `RedbackResult.meta_data['profile']`. Outside the context, the instrumentation
+    only costs one global lookup per call. Each process records its own profile, so the calls in sampler pools
+    are not included.
+
+    Example::
+
+        with redback.profiling.profile() as profiler:
+            result = redback.fit_model(...)
+        print(profiler.summary())
+
+    :param track_allocations: Whether to record the memory allocated per component with `tracemalloc`.
+    :type track_allocations: bool, optional
+    :param log_interval: Log the number of likelihood evaluations per second every `log_interval` seconds.
+                         Never log if None.
+    :type log_interval: float, optional
+    :param max_samples: Maximum number of latencies kept per component for the percentiles.
+    :type max_samples: int, optional
+    :return: The profiler.
+    :rtype: Profiler
+    """
+    global _profiler
+    previous = _profiler
+    profiler = Profiler(track_allocations=track_allocations, log_interval=log_interval, max_samples=max_samples)
+    started_tracing = track_allocations and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    _profiler = profiler
+    try:
+        yield profiler
+    finally:
+        _profiler = previous
+        profiler.stop()
+        if started_tracing:
+            tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def profile_run():
+    """Records the calls inside the context separately with `Profiler.start_run` if profiling is enabled.
+
+    :return: The profiler of the run or None if profiling is disabled.
+    :rtype: Union[Profiler, None]
+    """
+    profiler = _profiler
+    if profiler is None:
+        yield None
+        return
+    run = profiler.start_run()
+    try:
+        yield run
+    finally:
+        profiler.stop_run(run)
+
+
+def profile_likelihood(log_likelihood: callable) -> callable:
+    """Decorates a `log_likelihood` method so that its calls are recorded by the active profiler.
+
+    :param log_likelihood: The method.
+    :type log_likelihood: callable
+    :return: The decorated method.
+    :rtype: callable
+    """
+    @functools.wraps(log_likelihood)
+    def wrapper(self):
+        if _profiler is None:
+            return log_likelihood(self)
+        return _profiler.call_likelihood(log_likelihood, self)
+    return wrapper
@@ -1,17 +1,22 @@
+from __future__ import annotations
+
 import bilby.core.prior
+import copy
+import inspect
 import numpy as np
 import os
 from typing import Union
 import warnings
 
 import pandas as pd
-from bilby.core.result import Result
+from bilby.core.result import Result, rejection_sample
 from bilby.core.result import _determine_file_name # noqa
+from scipy.special import logsumexp
 
 import redback.transient.transient
 from redback import model_library
 from redback.transient import TRANSIENT_DICT
-from redback.utils import MetaDataAccessor
+from redback.utils import MetaDataAccessor, logger
 
 warnings.simplefilter(action='ignore')
 
@@ -121,11 +126,148 @@ class RedbackResult(Result):
     @property
     def transient(self) -> redback.transient.transient.Transient:
         """Reconstruct the transient used during sampling time using the metadata information.
+        The transient is only built on first access and reused afterwards.
 
         :return: The reconstructed Transient.
         :rtype: redback.transient.transient.Transient
         """
-        return TRANSIENT_DICT[self.transient_type](**self.meta_data)
+        if getattr(self, '_transient', None) is None:
+            self._transient = self._reconstruct_transient()
+        return self._transient
+
+    def _reconstruct_transient(self) -> redback.transient.transient.Transient:
+        """Builds the `Transient` from the metadata. Results written before the compact schema stored the full
+        transient `__dict__` in the metadata, so we fall back to passing everything into the constructor.
+
+        :return: The reconstructed Transient.
+        :rtype: redback.transient.transient.Transient
+        """
+        if 'transient_kwargs' not in self.meta_data:
+            return TRANSIENT_DICT[self.transient_type](**self.meta_data)
+        transient_kwargs = dict(self.meta_data['transient_kwargs'])
+        transient_kwargs.update(self._load_transient_data())
+        return TRANSIENT_DICT[self.transient_type](**transient_kwargs)
+
+    def _load_transient_data(self) -> dict:
+        """Loads the data arrays of the transient either from the binary sidecar file or from the metadata itself.
+
+        :return: Dictionary of data arrays.
+        :rtype: dict
+        """
+        transient_data = self.meta_data['transient_data']
+        if not isinstance(transient_data, str):
+            return {k: np.asarray(v) for k, v in transient_data.items()}
+        directories = [getattr(self, '_result_directory', None), self.outdir, '.']
+        for directory in directories:
+            if directory is None:
+                continue
+            filename = os.path.join(directory, transient_data)
+            if os.path.isfile(filename):
+                with np.load(filename) as data:
+                    return {k: data[k] for k in data.files}
+        raise FileNotFoundError(f"Could not find transient data file {transient_data}.")
+
+    def update_with_data(
+            self, new_transient: redback.transient.transient.Transient, model: Union[callable, str] = None,
+            likelihood: bilby.core.likelihood.Likelihood = None, min_ess_fraction: float = 0.1, rerun: bool = True,
+            **kwargs: None) -> RedbackResult:
+        """Updates the posterior to new data by importance reweighting the existing samples with the likelihood ratio
+        of the new and the old data. The reweighted posterior is drawn with rejection sampling. If the effective
+        sample size of the weights drops below `min_ess_fraction` times the number of samples, the samples no longer
+        cover the new posterior and the fit is rerun with `fit_model` instead, using the priors, sampler, and
+        model keyword arguments of this result. The rerun is a new fit from the priors that does not use the existing
+        samples, so it costs as much as the original fit.
+
+        :param new_transient: The transient with the updated data, usually the old data plus new points.
+        :type new_transient: redback.transient.transient.Transient
+        :param model: The model used during sampling. Use the model stored in the metadata if not given.
+        :type model: Union[callable, str], optional
+        :param likelihood: Likelihood of the new data. Use the likelihood `fit_model` builds if not given.
+        :type likelihood: bilby.core.likelihood.Likelihood, optional
+        :param min_ess_fraction: Minimum effective sample size as a fraction of the number of posterior samples.
+        :type min_ess_fraction: float, optional
+        :param rerun: Whether to rerun the fit if the effective sample size is too small. Otherwise, a warning is
+                      logged and the reweighted result is returned anyway.
+        :type rerun: bool, optional
+        :param kwargs: Any keyword arguments passed into `fit_model` for a rerun. The default outdir is the 'updated'
+                       subdirectory of this result's outdir.
+        :type kwargs: None
+        :return: The updated result. The effective sample size is stored in `meta_data['effective_sample_size']`.
+        :rtype: RedbackResult
+        """
+        if model is None:
+            model = self.model
+        if isinstance(model, str):
+            model = model_library.all_models_dict[model]
+        if likelihood is None:
+            likelihood = redback.sampler._get_likelihood(
+                transient=new_transient, model=model, model_kwargs=self.model_kwargs)
+
+        samples = self._likelihood_parameters()
+        new_log_likelihood = np.zeros(len(samples))
+        for i, sample in enumerate(samples):
+            likelihood.parameters.update(sample)
+            new_log_likelihood[i] = likelihood.log_likelihood()
+        if 'log_likelihood' in self.posterior:
+            old_log_likelihood = self.posterior['log_likelihood'].to_numpy()
+        else:
+            old_likelihood = redback.sampler._get_likelihood(
+                transient=self.transient, model=model, model_kwargs=self.model_kwargs)
+            old_log_likelihood = np.zeros(len(samples))
+            for i, sample in enumerate(samples):
+                old_likelihood.parameters.update(sample)
+                old_log_likelihood[i] = old_likelihood.log_likelihood()
+
+        ln_weights = np.nan_to_num(new_log_likelihood - old_log_likelihood, nan=-np.inf)
+        weights = np.exp(ln_weights - np.max(ln_weights))
+        effective_sample_size = np.sum(weights) ** 2 / np.sum(weights ** 2)
+        logger.info(f"Reweighting to the new data gives an effective sample size of "
+                    f"{effective_sample_size:.1f} out of {len(samples)} samples.")
+
+        if effective_sample_size < min_ess_fraction * len(samples):
+            if rerun:
+                logger.info("The effective sample size is too small. Rerunning the fit.")
+                return self._rerun(new_transient=new_transient, model=model, **kwargs)
+            logger.warning("The effective sample size is too small. The reweighted posterior is unreliable.")
+
+        result = copy.copy(self)
+        posterior = self.posterior.copy()
+        posterior['log_likelihood'] = new_log_likelihood
+        result.posterior = rejection_sample(posterior, weights=weights).reset_index(drop=True)
+        result.log_evidence = self.log_evidence + logsumexp(ln_weights) - np.log(len(samples))
+        result.log_noise_evidence = likelihood.noise_log_likelihood()
+        result.log_bayes_factor = result.log_evidence - result.log_noise_evidence
+        result.meta_data = build_meta_data(transient=new_transient, model=model, model_kwargs=self.model_kwargs,
+                                           transient_type=self.transient_type)
+        result.meta_data['effective_sample_size'] = effective_sample_size
+        result.meta_data['reweighted_using_rejection_sampling'] = True
+        result._transient = new_transient
+        return result
+
+    def _likelihood_parameters(self) -> list:
+        """
+        :return: One dictionary of likelihood parameters per posterior sample with the search parameters and the
+                 fixed parameters of the priors, but without derived quantities such as the log likelihood.
+        :rtype: list
+        """
+        priors = bilby.core.prior.PriorDict(dict(self.priors or dict()))
+        fixed_parameters = {key: prior.peak for key, prior in priors.items()
+                            if isinstance(prior, bilby.core.prior.DeltaFunction)}
+        search_parameter_keys = [key for key in self.search_parameter_keys or [] if key in self.posterior]
+        return [dict(fixed_parameters, **sample) for sample in self.posterior[search_parameter_keys].to_dict('records')]
+
+    def _rerun(self, new_transient: redback.transient.transient.Transient, model: callable,
+               **kwargs: None) -> RedbackResult:
+        kwargs.setdefault('outdir', os.path.join(self.outdir, 'updated'))
+        kwargs.setdefault('prior', self.priors)
+        kwargs.setdefault('model_kwargs', self.model_kwargs)
+        kwargs.setdefault('clean', True)
+        if self.sampler is not None:
+            kwargs.setdefault('sampler', self.sampler)
+        for key in ['nlive', 'walks']:
+            if key in (self.sampler_kwargs or dict()):
+                kwargs.setdefault(key, self.sampler_kwargs[key])
+        return redback.sampler.fit_model(transient=new_transient, model=model, **kwargs)
 
     def plot_lightcurve(self, model: Union[callable, str] = None, **kwargs: None) -> None:
         """Reconstructs the transient and calls the specific `plot_lightcurve` method.
@@ -220,4 +362,67 @@ def read_in_result(
         raise ValueError("No filetype extension provided")
     else:
         raise ValueError("Filetype {} not understood".format(extension))
+    result._result_directory = os.path.dirname(os.path.abspath(filename))
     return result
+
+
+def _get_constructor_arguments(transient: redback.transient.transient.Transient) -> list:
+    """Collects the names of all constructor arguments of the transient and its parent classes.
+
+    :param transient: The transient.
+    :type transient: redback.transient.transient.Transient
+
+    :return: The argument names.
+    :rtype: list
+    """
+    arguments = []
+    for cls in type(transient).__mro__:
+        if '__init__' not in cls.__dict__ or cls is object:
+            continue
+        for parameter in inspect.signature(cls.__init__).parameters.values():
+            if parameter.kind in (parameter.VAR_KEYWORD, parameter.VAR_POSITIONAL) or parameter.name == 'self':
+                continue
+            if parameter.name not in arguments:
+                arguments.append(parameter.name)
+    return arguments
+
+
+def build_meta_data(
+        transient: redback.transient.transient.Transient, model: callable, model_kwargs: dict = None,
+        transient_type: str = None, data_file: str = None) -> dict:
+    """Builds the compact `meta_data` used by `RedbackResult` to reconstruct the transient.
+    Only the constructor arguments of the transient are stored. Catalogue tables are not stored, they are
+    referenced by the transient name and type and read again by the constructor upon reconstruction.
+
+    :param transient: The transient used during sampling.
+    :type transient: redback.transient.transient.Transient
+    :param model: The model used during sampling.
+    :type model: callable
+    :param model_kwargs: Additional keyword arguments passed into the model.
+    :type model_kwargs: dict, optional
+    :param transient_type: Key of the transient class in `TRANSIENT_DICT`. Use the lowercase class name if not given.
+    :type transient_type: str, optional
+    :param data_file: If given, save the data arrays into this `.npz` file and only store the file name in the
+                      metadata. Otherwise, the arrays are stored in the metadata directly.
+    :type data_file: str, optional
+
+    :return: The metadata.
+    :rtype: dict
+    """
+    if transient_type is None:
+        transient_type = transient.__class__.__name__.lower()
+    transient_kwargs = dict()
+    transient_data = dict()
+    for argument in _get_constructor_arguments(transient):
+        value = getattr(transient, argument, None)
+        if value is None or isinstance(value, pd.DataFrame):
+            continue
+        if isinstance(value, np.ndarray):
+            transient_data[argument] = value.astype(str) if value.dtype == object else value
+        else:
+            transient_kwargs[argument] = value
+    if data_file is not None:
+        np.savez(data_file, **transient_data)
+        transient_data = os.path.basename(data_file)
+    return dict(model=model.__name__, transient_type=transient_type, name=transient.name,
+                transient_kwargs=transient_kwargs, transient_data=transient_data, model_kwargs=model_kwargs)
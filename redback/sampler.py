@@ -1,11 +1,18 @@
 import matplotlib.pyplot as plt
+import multiprocessing
 import os
+from collections import namedtuple
 from pathlib import Path
 from typing import Union
 
 import bilby
+import numpy as np
+import pandas as pd
+import scipy.optimize
 
 import redback.get_data
+import redback.priors
+import redback.profiling
 from redback.likelihoods import GaussianLikelihood, GRBGaussianLikelihood, PoissonLikelihood
 from redback.model_library import all_models_dict
 from redback.result import RedbackResult
@@ -18,6 +25,12 @@ from redback.transient.tde import TDE
 
 dirname = os.path.dirname(__file__)
 
+_UNIT_CUBE_EDGE = 1e-9
+_PENALTY = 1e100
+
+TriageResult = namedtuple('TriageResult', ['model', 'parameters', 'max_log_likelihood', 'parameter_keys',
+                                           'covariance', 'n_data', 'bic', 'log_laplace_evidence'])
+
 
 def fit_model(transient, model, outdir=None, sampler='dynesty', nlive=2000, prior=None,
               walks=200, truncate=True, use_photon_index_prior=False, truncate_method='prompt_time_error',
@@ -28,6 +41,7 @@ def fit_model(transient, model, outdir=None, sampler='dynesty', nlive=2000, prio
     :param model: Name of the model to fit to data or a function.
     :type model: Union[callable, str]
     :param sampler: The sampling backend. Nested samplers are encouraged to allow evidence calculation.
+                    Use 'triage' to only run the maximum likelihood optimisation of `triage_model`.
                     (Default value = 'dynesty')
     :type sampler: str
     :param nlive: Number of live points.
@@ -60,8 +74,11 @@ def fit_model(transient, model, outdir=None, sampler='dynesty', nlive=2000, prio
                 f"Transient data mode {transient.data_mode} is inconsistent with "
                 f"output format {model_kwargs['output_format']}. These should be the same.")
 
+    if sampler == 'triage':
+        return triage_model(transient=transient, model=model, prior=prior, model_kwargs=model_kwargs, **kwargs)
+
     if prior is None:
-        prior = bilby.prior.PriorDict(filename=f"{dirname}/Priors/{model}.prior")
+        prior = redback.priors.get_priors(model=model.__name__)
 
     if isinstance(transient, Afterglow):
         return _fit_grb(transient=transient, model=model, outdir=outdir, sampler=sampler, nlive=nlive, prior=prior,
@@ -109,17 +126,7 @@ def _fit_grb(transient, model, outdir=None, label=None, sampler='dynesty', nlive
     if use_photon_index_prior:
         label += '_photon_index'
 
-    if transient.flux_density_data or transient.magnitude_data:
-        x, x_err, y, y_err = transient.get_filtered_data()
-    else:
-        x, x_err, y, y_err = transient.x, transient.x_err, transient.y, transient.y_err
-
-    likelihood = kwargs.get('likelihood', GaussianLikelihood(x=x, y=y, sigma=y_err, function=model, kwargs=model_kwargs))
-
-    meta_data = dict(model=model.__name__, transient_type=transient.__class__.__name__.lower())
-    transient_kwargs = {k.lstrip("_"): v for k, v in transient.__dict__.items()}
-    meta_data.update(transient_kwargs)
-    meta_data['model_kwargs'] = model_kwargs
+    likelihood = kwargs.get('likelihood', _get_likelihood(transient=transient, model=model, model_kwargs=model_kwargs))
 
     if not kwargs.get("clean", False):
         try:
@@ -130,10 +137,15 @@ def _fit_grb(transient, model, outdir=None, label=None, sampler='dynesty', nlive
         except Exception:
             pass
 
-    result = bilby.run_sampler(likelihood=likelihood, priors=prior, label=label, sampler=sampler, nlive=nlive,
-                               outdir=outdir, plot=True, use_ratio=False, walks=walks, resume=resume,
-                               maxmcmc=10 * walks, result_class=RedbackResult, meta_data=meta_data,
-                               nthreads=4, save_bounds=False, nsteps=nlive, nwalkers=walks, save=save_format, **kwargs)
+    meta_data = _get_meta_data(transient=transient, model=model, model_kwargs=model_kwargs, outdir=outdir,
+                               label=label, save_format=save_format)
+    with redback.profiling.profile_run() as run:
+        result = bilby.run_sampler(likelihood=likelihood, priors=prior, label=label, sampler=sampler, nlive=nlive,
+                                   outdir=outdir, plot=True, use_ratio=False, walks=walks, resume=resume,
+                                   maxmcmc=10 * walks, result_class=RedbackResult, meta_data=meta_data,
+                                   nthreads=_get_nthreads(), save_bounds=False, nsteps=nlive, nwalkers=walks,
+                                   save=save_format, **kwargs)
+    _attach_profile(result=result, save_format=save_format, run=run)
     plt.close('all')
     return result
 
@@ -149,17 +161,7 @@ def _fit_kilonova(transient, model, outdir=None, sampler='dynesty', nlive=3000,
 
     label = kwargs.get("label", transient.name)
 
-    if transient.flux_density_data or transient.magnitude_data:
-        x, x_err, y, y_err = transient.get_filtered_data()
-    else:
-        x, x_err, y, y_err = transient.x, transient.x_err, transient.y, transient.y_err
-
-    likelihood = kwargs.get('likelihood', GaussianLikelihood(x=x, y=y, sigma=y_err, function=model, kwargs=model_kwargs))
-
-    meta_data = dict(model=model.__name__, transient_type=transient.__class__.__name__.lower())
-    transient_kwargs = {k.lstrip("_"): v for k, v in transient.__dict__.items()}
-    meta_data.update(transient_kwargs)
-    meta_data['model_kwargs'] = model_kwargs
+    likelihood = kwargs.get('likelihood', _get_likelihood(transient=transient, model=model, model_kwargs=model_kwargs))
 
     if not kwargs.get("clean", False):
         try:
@@ -170,10 +172,15 @@ def _fit_kilonova(transient, model, outdir=None, sampler='dynesty', nlive=3000,
         except Exception:
             pass
 
-    result = bilby.run_sampler(likelihood=likelihood, priors=prior, label=label, sampler=sampler, nlive=nlive,
-                               outdir=outdir, plot=True, use_ratio=False, walks=walks, resume=resume,
-                               maxmcmc=10 * walks, result_class=RedbackResult, meta_data=meta_data,
-                               nthreads=4, save_bounds=False, nsteps=nlive, nwalkers=walks, save=save_format, **kwargs)
+    meta_data = _get_meta_data(transient=transient, model=model, model_kwargs=model_kwargs, outdir=outdir,
+                               label=label, save_format=save_format)
+    with redback.profiling.profile_run() as run:
+        result = bilby.run_sampler(likelihood=likelihood, priors=prior, label=label, sampler=sampler, nlive=nlive,
+                                   outdir=outdir, plot=True, use_ratio=False, walks=walks, resume=resume,
+                                   maxmcmc=10 * walks, result_class=RedbackResult, meta_data=meta_data,
+                                   nthreads=_get_nthreads(), save_bounds=False, nsteps=nlive, nwalkers=walks,
+                                   save=save_format, **kwargs)
+    _attach_profile(result=result, save_format=save_format, run=run)
     plt.close('all')
     return result
 
@@ -190,14 +197,8 @@ def _fit_prompt(transient, model, outdir, integrated_rate_function=True, sampler
     if use_photon_index_prior:
         label += '_photon_index'
 
-    likelihood = PoissonLikelihood(time=transient.x, counts=transient.y,
-                                   dt=transient.bin_size, function=model,
-                                   integrated_rate_function=integrated_rate_function, kwargs=model_kwargs)
-
-    meta_data = dict(model=model.__name__, transient_type="prompt")
-    transient_kwargs = {k.lstrip("_"): v for k, v in transient.__dict__.items()}
-    meta_data.update(transient_kwargs)
-    meta_data['model_kwargs'] = model_kwargs
+    likelihood = _get_likelihood(transient=transient, model=model, model_kwargs=model_kwargs,
+                                 integrated_rate_function=integrated_rate_function)
 
     if not kwargs.get("clean", False):
         try:
@@ -208,15 +209,236 @@ def _fit_prompt(transient, model, outdir, integrated_rate_function=True, sampler
         except Exception:
             pass
 
-    result = bilby.run_sampler(likelihood=likelihood, priors=prior, label=label, sampler=sampler, nlive=nlive,
-                               outdir=outdir, plot=False, use_ratio=False, walks=walks, resume=resume,
-                               maxmcmc=10 * walks, result_class=RedbackResult, meta_data=meta_data,
-                               nthreads=4, save_bounds=False, nsteps=nlive, nwalkers=walks, save=save_format, **kwargs)
-
+    meta_data = _get_meta_data(transient=transient, model=model, model_kwargs=model_kwargs, outdir=outdir,
+                               label=label, save_format=save_format, transient_type="prompt")
+    with redback.profiling.profile_run() as run:
+        result = bilby.run_sampler(likelihood=likelihood, priors=prior, label=label, sampler=sampler, nlive=nlive,
+                                   outdir=outdir, plot=False, use_ratio=False, walks=walks, resume=resume,
+                                   maxmcmc=10 * walks, result_class=RedbackResult, meta_data=meta_data,
+                                   nthreads=_get_nthreads(), save_bounds=False, nsteps=nlive, nwalkers=walks,
+                                   save=save_format, **kwargs)
+    _attach_profile(result=result, save_format=save_format, run=run)
     plt.close('all')
     return result
 
 
+def _get_likelihood(transient, model, model_kwargs=None, integrated_rate_function=True):
+    """
+    :param transient: The transient to be fitted
+    :type transient: redback.transient.transient.Transient
+    :param model: The model to fit.
+    :type model: callable
+    :param model_kwargs: Additional keyword arguments passed into the model.
+    :type model_kwargs: dict, optional
+    :param integrated_rate_function: Whether the model of a prompt transient returns the integrated rate.
+    :type integrated_rate_function: bool, optional
+    :return: The likelihood `fit_model` uses for this transient.
+    :rtype: redback.likelihoods._RedbackLikelihood
+    """
+    if isinstance(transient, PromptTimeSeries):
+        return PoissonLikelihood(time=transient.x, counts=transient.y, dt=transient.bin_size, function=model,
+                                 integrated_rate_function=integrated_rate_function, kwargs=model_kwargs)
+    if transient.flux_density_data or transient.magnitude_data:
+        x, x_err, y, y_err = transient.get_filtered_data()
+    else:
+        x, x_err, y, y_err = transient.x, transient.x_err, transient.y, transient.y_err
+    return GaussianLikelihood(x=x, y=y, sigma=y_err, function=model, kwargs=model_kwargs)
+
+
+def triage_model(transient, model, prior=None, model_kwargs=None, n_starts=16, npool=1, method='L-BFGS-B',
+                 seed=None, **kwargs):
+    """Quick maximum likelihood fit to triage a model before running a full sampler. The likelihood `fit_model`
+    would use is maximised from `n_starts` random points in the unit cube of the prior, i.e. within the prior box.
+    The covariance and the evidence use the Laplace approximation around the best fit in the unit cube, where the
+    prior is flat.
+
+    :param transient: The transient to be fitted
+    :type transient: redback.transient.transient.Transient
+    :param model: Name of the model to fit to data or a function.
+    :type model: Union[callable, str]
+    :param prior: Priors that set the search box. Use the default priors of the model if not given.
+    :type prior: [None, dict, bilby.prior.PriorDict]
+    :param model_kwargs: Additional keyword arguments passed into the model.
+    :type model_kwargs: dict, optional
+    :param n_starts: Number of starting points.
+    :type n_starts: int, optional
+    :param npool: Number of processes to run the optimisations in.
+    :type npool: int, optional
+    :param method: Any bounded method of `scipy.optimize.minimize`.
+    :type method: str, optional
+    :param seed: Seed of the random starting points.
+    :type seed: int, optional
+    :param kwargs: Placeholder to prevent TypeErrors, e.g. from `fit_model` keyword arguments.
+    :type kwargs: None
+    :return: The best-fit parameters, maximum log likelihood, covariance of the search parameters, number of data
+             points, Bayesian information criterion, and Laplace approximation of the log evidence.
+    :rtype: TriageResult
+    """
+    if isinstance(model, str):
+        model = all_models_dict[model]
+    if prior is None:
+        prior = redback.priors.get_priors(model=model.__name__, times=transient.x, y=transient.y,
+                                          yerr=getattr(transient, 'y_err', None),
+                                          dt=getattr(transient, 'bin_size', None))
+    prior = bilby.core.prior.PriorDict(dictionary=dict(prior))
+    likelihood = _get_likelihood(transient=transient, model=model, model_kwargs=model_kwargs)
+    objective = _NegativeLogLikelihood(likelihood=likelihood, prior=prior)
+    n_dim = len(objective.keys)
+    if n_dim == 0:
+        raise ValueError(f"The priors of {model.__name__} have no search parameters.")
+
+    rng = np.random.default_rng(seed)
+    bounds = [(_UNIT_CUBE_EDGE, 1 - _UNIT_CUBE_EDGE)] * n_dim
+    arguments = [(objective, start, bounds, method) for start in rng.uniform(0.05, 0.95, size=(n_starts, n_dim))]
+    if npool > 1:
+        with multiprocessing.Pool(processes=npool) as pool:
+            optima = pool.map(_optimise_from_start, arguments)
+    else:
+        optima = [_optimise_from_start(argument) for argument in arguments]
+    best = min(optima, key=lambda optimum: optimum.fun)
+
+    parameters = objective.parameters(best.x)
+    max_log_likelihood = -best.fun
+    unit_covariance = _inverse_hessian(objective, best.x)
+    jacobian = np.array([1 / prior[key].prob(parameters[key]) for key in objective.keys])
+    covariance = unit_covariance * np.outer(jacobian, jacobian)
+    n_data = likelihood.n
+    bic = n_dim * np.log(n_data) - 2 * max_log_likelihood
+    if np.all(np.isfinite(unit_covariance)):
+        log_det = np.linalg.slogdet(unit_covariance)[1]
+        log_laplace_evidence = max_log_likelihood + n_dim / 2 * np.log(2 * np.pi) + log_det / 2
+    else:
+        logger.warning(f"The Hessian of {model.__name__} at the best fit is not positive definite. "
+                       f"The covariance and the Laplace evidence are NaN.")
+        log_laplace_evidence = np.nan
+    return TriageResult(model=model.__name__, parameters=parameters, max_log_likelihood=max_log_likelihood,
+                        parameter_keys=objective.keys, covariance=covariance, n_data=n_data, bic=bic,
+                        log_laplace_evidence=log_laplace_evidence)
+
+
+def rank_models(transient, models, model_kwargs=None, priors=None, **kwargs):
+    """Triages several models with `triage_model` and ranks them by their Bayesian information criterion.
+    Models that fail are logged and left out.
+
+    :param transient: The transient to be fitted
+    :type transient: redback.transient.transient.Transient
+    :param models: Names of the models or functions.
+    :type models: list
+    :param model_kwargs: Additional keyword arguments passed into all models.
+    :type model_kwargs: dict, optional
+    :param priors: Dictionary mapping the model name to its priors. Models not in here use their default priors.
+    :type priors: dict, optional
+    :param kwargs: Any other keyword arguments passed into `triage_model`.
+    :type kwargs: None
+    :return: One row per model sorted by the BIC, with the model name, maximum log likelihood, BIC, Laplace
+             approximation of the log evidence, and the `TriageResult`.
+    :rtype: pandas.DataFrame
+    """
+    priors = priors or dict()
+    rows = []
+    for model in models:
+        name = model if isinstance(model, str) else model.__name__
+        try:
+            triage = triage_model(transient=transient, model=model, prior=priors.get(name),
+                                  model_kwargs=model_kwargs, **kwargs)
+        except Exception as e:
+            logger.warning(f"Could not triage model {name}: {e}")
+            continue
+        rows.append(dict(model=name, max_log_likelihood=triage.max_log_likelihood, bic=triage.bic,
+                         log_laplace_evidence=triage.log_laplace_evidence, result=triage))
+    ranking = pd.DataFrame(rows, columns=['model', 'max_log_likelihood', 'bic', 'log_laplace_evidence', 'result'])
+    return ranking.sort_values(by='bic', ignore_index=True)
+
+
+class _NegativeLogLikelihood(object):
+
+    def __init__(self, likelihood, prior):
+        """Negative log likelihood as a function of the position of the search parameters in the unit cube of the
+        prior. Non-finite values and violated constraints are mapped to a large finite value so that the optimisers
+        can move away from them."""
+        self.likelihood = likelihood
+        self.prior = prior
+        self.keys = [key for key in prior.non_fixed_keys if key not in prior.constraint_keys]
+        self.fixed = {key: prior[key].peak for key in prior.fixed_keys}
+
+    def parameters(self, x):
+        parameters = dict(self.fixed)
+        parameters.update(zip(self.keys, self.prior.rescale(self.keys, x)))
+        return parameters
+
+    def __call__(self, x):
+        parameters = self.parameters(x)
+        if len(self.prior.constraint_keys) > 0 and not self.prior.evaluate_constraints(parameters):
+            return _PENALTY
+        self.likelihood.parameters.update(parameters)
+        with np.errstate(all='ignore'):
+            log_likelihood = self.likelihood.log_likelihood()
+        if not np.isfinite(log_likelihood):
+            return _PENALTY
+        return -log_likelihood
+
+
+def _optimise_from_start(arguments):
+    objective, start, bounds, method = arguments
+    return scipy.optimize.minimize(objective, x0=start, bounds=bounds, method=method)
+
+
+def _inverse_hessian(function, x, step=1e-4, bounds=(_UNIT_CUBE_EDGE, 1 - _UNIT_CUBE_EDGE)):
+    """Finite difference Hessian of `function` at `x`, inverted. The stencil is shifted away from the bounds where
+    `x` is closer than `step` to them, which gives one-sided differences there. Returns NaNs if any point of the
+    stencil is penalised or the Hessian is not positive definite."""
+    n = len(x)
+    hessian = np.zeros((n, n))
+    x = np.clip(x, bounds[0] + step, bounds[1] - step)
+    steps = np.eye(n) * step
+    values = []
+
+    def evaluate(point):
+        values.append(function(point))
+        return values[-1]
+
+    f0 = evaluate(x)
+    for i in range(n):
+        hessian[i, i] = (evaluate(x + steps[i]) - 2 * f0 + evaluate(x - steps[i])) / step ** 2
+        for j in range(i + 1, n):
+            hessian[i, j] = hessian[j, i] = (
+                evaluate(x + steps[i] + steps[j]) - evaluate(x + steps[i] - steps[j])
+                - evaluate(x - steps[i] + steps[j]) + evaluate(x - steps[i] - steps[j])) / (4 * step ** 2)
+    if max(values) >= _PENALTY or not np.all(np.isfinite(hessian)):
+        return np.full((n, n), np.nan)
+    try:
+        np.linalg.cholesky(hessian)
+    except np.linalg.LinAlgError:
+        return np.full((n, n), np.nan)
+    return np.linalg.inv(hessian)
+
+
+def _get_nthreads():
+    """Runs the sampler in a single process while profiling, so that all likelihood calls are recorded."""
+    if redback.profiling.get_profiler() is None:
+        return 4
+    return 1
+
+
+def _attach_profile(result, save_format, run):
+    """Adds the summary of the profiled run to the metadata of the result and saves the result again.
+    Does nothing if profiling is disabled or the run did not evaluate the likelihood, e.g. because the sampler only
+    loaded a finished run when resuming."""
+    if run is None or 'likelihood' not in run.components:
+        return
+    result.meta_data['profile'] = run.summary()
+    result.save_to_file(extension=save_format, overwrite=True)
+
+
+def _get_meta_data(transient, model, model_kwargs, outdir, label, save_format, transient_type=None):
+    if save_format == 'json':
+        data_file = f"{outdir}/{label}_transient_data.npz"
+    else:
+        data_file = None
+    return redback.result.build_meta_data(transient=transient, model=model, model_kwargs=model_kwargs,
+                                          transient_type=transient_type, data_file=data_file)
+
+
 def _fit_supernova(**kwargs):
     plt.close('all')
     pass
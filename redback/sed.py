@@ -2,7 +2,11 @@ from typing import Union
 
 import numpy as np
 from redback.constants import *
-from redback.utils import nu_to_lambda
+from redback.utils import lambda_to_nu, nu_to_lambda
+import redback.filters
+
+# observer frame wavelengths in Angstrom of spectra if none are given
+DEFAULT_LAMBDA_ARRAY = np.geomspace(100, 60000, 100)
 
 
 def blackbody_to_flux_density(temperature, r_photosphere, dl, frequency):
@@ -13,22 +17,87 @@ def blackbody_to_flux_density(temperature, r_photosphere, dl, frequency):
     :param r_photosphere: photosphere radius in cm
     :param dl: luminosity_distance in cm
     :param frequency: frequency to calculate in Hz - Must be same length as time array or a single number.
-                      In source frame
+                      In source frame. Arrays that broadcast against the temperature, e.g. of shape (n_frequency, 1),
+                      give the flux density at every frequency for every temperature.
     :return: flux_density
     """
-    # adding units back in to ensure dimensions are correct
-    frequency = frequency * uu.Hz
-    radius = r_photosphere * uu.cm
-    dl = dl * uu.cm
-    temperature = temperature * uu.K
-    planck = cc.h.cgs
-    speed_of_light = cc.c.cgs
-    boltzmann_constant = cc.k_B.cgs
-    num = 2 * np.pi * planck * frequency ** 3 * radius ** 2
+    # evaluate in cgs floats and attach the units once, which is much cheaper than unit-aware arithmetic
+    num = 2 * np.pi * planck * frequency ** 3 * r_photosphere ** 2
     denom = dl ** 2 * speed_of_light ** 2
     frac = 1. / (np.expm1((planck * frequency) / (boltzmann_constant * temperature)))
     flux_density = num / denom * frac
-    return flux_density
+    return flux_density << uu.erg / uu.s / uu.cm ** 2 / uu.Hz
+
+
+def _evaluate_sed(sed, frequency, index, n, **kwargs):
+    """
+    Evaluates an SED at many (frequency, epoch) points at once.
+
+    :param sed: SED class or blackbody_to_flux_density
+    :param frequency: source frame frequency of each point in Hz
+    :param index: epoch of each point, or any other index into arrays with one entry per epoch
+    :param n: number of epochs. Keyword arguments that are arrays of this length are indexed with the epoch.
+    :param kwargs: all other arguments of the SED except frequency
+    :return: flux density in erg/s/cm^2/Hz of each point
+    """
+    for key, value in kwargs.items():
+        if np.ndim(value) == 1 and len(value) == n:
+            kwargs[key] = np.asarray(value)[index]
+    if isinstance(sed, type):
+        flux_density = sed(frequency=frequency, **kwargs).flux_density
+    else:
+        flux_density = sed(frequency=frequency, **kwargs)
+    return (flux_density << uu.erg / uu.s / uu.cm ** 2 / uu.Hz).value
+
+
+def bandpass_flux_density(sed, bands, redshift, filters=None, **kwargs):
+    """
+    Synthetic photometry of an SED, i.e. the flux density averaged over the transmission curve of each band instead
+    of evaluated at a single effective frequency. The SED is evaluated on the wavelength grid of the filters inside
+    each band and reduced with one sparse matrix product.
+
+    :param sed: SED class, e.g. Blackbody or CutoffBlackbody, or blackbody_to_flux_density
+    :param bands: band of each observation, see `redback.filters.get_filter`
+    :param redshift: source redshift
+    :param filters: `redback.filters.FilterSet` with the bands. Default is the cached filter set of the bands.
+    :param kwargs: all other arguments of the SED except frequency. Arrays with one entry per observation,
+                   e.g. temperature, r_photosphere or time, are evaluated at every wavelength of the band.
+    :return: flux density in mJy, one per observation
+    """
+    bands = np.atleast_1d(bands)
+    if filters is None:
+        filters = redback.filters.get_filter_set(tuple(np.unique(bands)))
+    observation_index, wavelength_index, weights = filters.observation_weights(bands)
+    flux_density = _evaluate_sed(sed, frequency=filters.frequency[wavelength_index] * (1 + redshift),
+                                 index=observation_index, n=len(bands), **kwargs)
+    flux_density = (flux_density << uu.erg / uu.s / uu.cm ** 2 / uu.Hz).to(uu.mJy).value
+    return (weights @ flux_density) << uu.mJy
+
+
+def sed_spectra(sed, lambda_array, redshift, n_times, **kwargs):
+    """
+    Spectra of an SED at many epochs, evaluated in a single call of the SED.
+
+    :param sed: SED class, e.g. Blackbody or CutoffBlackbody, or blackbody_to_flux_density
+    :param lambda_array: observer frame wavelength in Angstrom
+    :param redshift: source redshift
+    :param n_times: number of epochs
+    :param kwargs: all other arguments of the SED except frequency. Arrays with one entry per epoch,
+                   e.g. temperature, r_photosphere or time, are evaluated at every wavelength.
+    :return: flux density per wavelength in erg/s/cm^2/Angstrom with shape (n_times, len(lambda_array))
+    """
+    lambda_array = np.asarray(lambda_array, dtype=float)
+    frequency = lambda_to_nu(lambda_array) * (1 + redshift)
+    if isinstance(sed, type) and issubclass(sed, _SED):
+        # these SEDs select frequencies with boolean masks, so they are evaluated on flattened arrays
+        index = np.repeat(np.arange(n_times), len(lambda_array))
+        flux_density = _evaluate_sed(sed, frequency=np.tile(frequency, n_times), index=index, n=n_times, **kwargs)
+    else:
+        # elementwise SEDs broadcast epochs along the first and wavelengths along the second axis
+        flux_density = _evaluate_sed(sed, frequency=frequency[np.newaxis, :], index=(slice(None), np.newaxis),
+                                     n=n_times, **kwargs)
+    flux_density = flux_density.reshape(n_times, len(lambda_array))
+    return flux_density * speed_of_light / (lambda_array * angstrom_cgs) ** 2 * angstrom_cgs
 
 
 class _SED(object):
@@ -0,0 +1,3 @@
+from redback.simulate import population, survey
+from redback.simulate.population import SimulatedPopulation, simulate_population
+from redback.simulate.survey import Survey
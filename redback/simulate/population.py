@@ -0,0 +1,165 @@
+import multiprocessing
+import os
+import time
+from collections import namedtuple
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from redback.model_library import all_models_dict
+from redback.simulate.survey import Survey
+from redback.utils import logger
+
+SimulatedPopulation = namedtuple(
+    'SimulatedPopulation', ['summary', 'observations', 'throughput', 'n_failed'])
+
+_MAGNITUDE_CONSTANT = 2.5 / np.log(10)
+
+
+def _simulate_chunk(arguments: tuple) -> tuple:
+    model, parameters, survey, model_kwargs, max_time, min_detections, seed_sequence = arguments
+    function = all_models_dict[model] if isinstance(model, str) else model
+    rng = np.random.default_rng(seed_sequence)
+    if 't0' not in parameters:
+        parameters = parameters.assign(t0=rng.uniform(survey.start, survey.end, len(parameters)))
+    model_parameters = parameters.drop(columns=['t0', 'event_id'])
+    flux_density_errors = survey.flux_density_errors
+
+    indices, event_ids, true_flux_densities, failed = [], [], [], []
+    for event_id, t0, row in zip(parameters['event_id'], parameters['t0'],
+                                 model_parameters.to_dict(orient='records')):
+        time_since_explosion = survey.times - t0
+        index = np.flatnonzero((time_since_explosion > 0) & (time_since_explosion <= max_time))
+        if len(index) == 0:
+            failed.append(False)
+            continue
+        try:
+            with np.errstate(all='ignore'):
+                flux_density = function(time_since_explosion[index], **row, frequency=survey.frequencies[index],
+                                        output_format='flux_density', **model_kwargs)
+            flux_density = np.broadcast_to(np.asarray(flux_density, dtype=float), index.shape)
+        except Exception as e:
+            logger.debug(f"Could not evaluate {model} for event {event_id}: {e}")
+            failed.append(True)
+            continue
+        failed.append(False)
+        indices.append(index)
+        event_ids.append(np.full(len(index), event_id))
+        true_flux_densities.append(flux_density)
+
+    if len(indices) > 0:
+        index = np.concatenate(indices)
+        event_id = np.concatenate(event_ids)
+        true_flux_density = np.concatenate(true_flux_densities)
+    else:
+        index = np.array([], dtype=int)
+        event_id = np.array([], dtype=parameters['event_id'].dtype)
+        true_flux_density = np.array([])
+    flux_density_error = flux_density_errors[index]
+    flux_density = true_flux_density + rng.normal(0, flux_density_error)
+    signal_to_noise = flux_density / flux_density_error
+    detected = signal_to_noise >= survey.detection_threshold
+    with np.errstate(all='ignore'):
+        magnitude = np.where(detected, -2.5 * np.log10(flux_density / 3631e3), np.nan)
+        magnitude_error = np.where(detected, _MAGNITUDE_CONSTANT / signal_to_noise, np.nan)
+    t0 = parameters.set_index('event_id')['t0']
+    observations = pd.DataFrame(dict(
+        event_id=event_id, time=survey.times[index], time_since_explosion=survey.times[index] - t0[event_id].values,
+        band=survey.bands[index], frequency=survey.frequencies[index], true_flux_density=true_flux_density,
+        flux_density=flux_density, flux_density_error=flux_density_error, magnitude=magnitude,
+        magnitude_error=magnitude_error, limiting_magnitude=survey.limiting_magnitudes[index], detected=detected))
+
+    detections = observations[observations['detected']].groupby('event_id')
+    summary = parameters.set_index('event_id')
+    summary['n_observations'] = observations.groupby('event_id').size()
+    summary['n_detections'] = detections.size()
+    summary = summary.fillna({'n_observations': 0, 'n_detections': 0})
+    summary = summary.astype({'n_observations': int, 'n_detections': int})
+    summary['first_detection'] = detections['time_since_explosion'].min()
+    summary['peak_magnitude'] = detections['magnitude'].min()
+    summary['detected'] = summary['n_detections'] >= min_detections
+    summary['failed'] = failed
+    return summary.reset_index(), observations
+
+
+def simulate_population(
+        model: Union[str, callable], parameters: Union[pd.DataFrame, dict], survey: Survey,
+        model_kwargs: dict = None, max_time: float = np.inf, min_detections: int = 2, npool: int = 1,
+        chunk_size: int = 100, filename: str = None, seed: int = None) -> SimulatedPopulation:
+    """Simulates noisy light curves of many transients observed by a survey.
+
+    Events are split into chunks that are simulated in a pool of processes. Within a chunk, each event costs a single
+    model call on all of its observations and the noise is drawn for the whole chunk at once. The flux density error
+    of an observation is set by the limiting magnitude of the survey, and an observation is a detection if its
+    signal-to-noise ratio reaches the detection threshold of the survey. The results do not depend on `npool`.
+
+    :param model: Name of a model in `redback.model_library.all_models_dict` or a model function. The model must take
+                  the observer frame time in days and `frequency` and `output_format='flux_density'` keyword arguments.
+    :type model: Union[str, callable]
+    :param parameters: One row of model parameters per event. An optional 't0' column sets the explosion time in the
+                       time of the survey in days. Otherwise, explosion times are drawn uniformly during the survey.
+    :type parameters: Union[pd.DataFrame, dict]
+    :param survey: The survey.
+    :type survey: Survey
+    :param model_kwargs: Any other keyword arguments passed into the model.
+    :type model_kwargs: dict, optional
+    :param max_time: Maximum time since explosion in days of observations of an event.
+    :type max_time: float, optional
+    :param min_detections: Number of detections for an event to count as detected.
+    :type min_detections: int, optional
+    :param npool: Number of processes.
+    :type npool: int, optional
+    :param chunk_size: Number of events per chunk.
+    :type chunk_size: int, optional
+    :param filename: If given, the observations are appended to this CSV file chunk by chunk instead of being kept in
+                     memory.
+    :type filename: str, optional
+    :param seed: Seed of the random numbers.
+    :type seed: int, optional
+    :return: The 'summary' with the parameters, number of observations and detections, the first detection time,
+             peak magnitude and detection flag of each event, the 'observations' of all events or None if they were
+             written to `filename`, the 'throughput' in events per second, and the number of events for which the
+             model failed.
+    :rtype: SimulatedPopulation
+    """
+    parameters = pd.DataFrame(parameters).reset_index(drop=True)
+    parameters.insert(0, 'event_id', np.arange(len(parameters)))
+    model_kwargs = model_kwargs or dict()
+    chunks = [parameters.iloc[i:i + chunk_size] for i in range(0, len(parameters), chunk_size)]
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(chunks))
+    arguments = [(model, chunk, survey, model_kwargs, max_time, min_detections, seed_sequence)
+                 for chunk, seed_sequence in zip(chunks, seed_sequences)]
+    if filename is not None and os.path.isfile(filename):
+        os.remove(filename)
+
+    summaries, observations = [], []
+    n_done = 0
+    start = time.perf_counter()
+    pool = multiprocessing.Pool(processes=npool) if npool > 1 else None
+    try:
+        results = pool.imap(_simulate_chunk, arguments) if pool is not None else map(_simulate_chunk, arguments)
+        for summary, chunk_observations in results:
+            summaries.append(summary)
+            if filename is None:
+                observations.append(chunk_observations)
+            else:
+                chunk_observations.to_csv(filename, mode='a', header=n_done == 0, index=False)
+            n_done += len(summary)
+            logger.info(f"Simulated {n_done}/{len(parameters)} events, "
+                        f"{n_done / (time.perf_counter() - start):.1f} events per second")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    throughput = n_done / (time.perf_counter() - start)
+
+    summary = pd.concat(summaries, ignore_index=True) if summaries else pd.DataFrame()
+    n_failed = int(summary['failed'].sum()) if len(summary) > 0 else 0
+    if n_failed > 0:
+        logger.warning(f"The model failed for {n_failed} of {len(summary)} events.")
+    if filename is None:
+        observations = pd.concat(observations, ignore_index=True) if observations else pd.DataFrame()
+    else:
+        observations = None
+    return SimulatedPopulation(summary=summary, observations=observations, throughput=throughput, n_failed=n_failed)
@@ -0,0 +1,110 @@
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+import redback.utils
+
+
+class Survey(object):
+
+    def __init__(
+            self, times: np.ndarray, bands: np.ndarray, limiting_magnitudes: Union[float, np.ndarray],
+            detection_threshold: float = 5., name: str = 'survey') -> None:
+        """Observing schedule of a survey. Each observation has a time, a band, and a limiting magnitude at which a
+        source is detected with a signal-to-noise ratio of `detection_threshold`.
+
+        :param times: Times of the observations in days.
+        :type times: np.ndarray
+        :param bands: Bands of the observations. Must be in `redback/tables/filters.csv`.
+        :type bands: np.ndarray
+        :param limiting_magnitudes: AB limiting magnitude of each observation or one for all observations.
+        :type limiting_magnitudes: Union[float, np.ndarray]
+        :param detection_threshold: Signal-to-noise ratio at the limiting magnitude.
+        :type detection_threshold: float, optional
+        :param name: Name of the survey.
+        :type name: str, optional
+        """
+        times = np.asarray(times, dtype=float)
+        order = np.argsort(times, kind='stable')
+        self.times = times[order]
+        self.bands = np.asarray(bands)[order]
+        self.limiting_magnitudes = np.broadcast_to(np.asarray(limiting_magnitudes, dtype=float), times.shape)[order]
+        unique_bands, inverse = np.unique(self.bands, return_inverse=True)
+        frequencies = redback.utils.bands_to_frequency(unique_bands)
+        unknown_bands = [band for band, frequency in zip(unique_bands, frequencies) if frequency == band]
+        if len(unknown_bands) > 0:
+            raise ValueError(f"Unknown bands {unknown_bands}. Bands must be in redback/tables/filters.csv.")
+        self.frequencies = frequencies.astype(float)[inverse]
+        self.detection_threshold = detection_threshold
+        self.name = name
+
+    @classmethod
+    def from_cadence(
+            cls, bands: list, cadence: Union[float, dict], limiting_magnitude: Union[float, dict], duration: float,
+            **kwargs: None) -> "Survey":
+        """Creates a survey that observes every band at a regular cadence.
+
+        :param bands: The bands.
+        :type bands: list
+        :param cadence: Days between observations in the same band, either for all bands or a dictionary per band.
+        :type cadence: Union[float, dict]
+        :param limiting_magnitude: AB limiting magnitude, either for all bands or a dictionary per band.
+        :type limiting_magnitude: Union[float, dict]
+        :param duration: Duration of the survey in days.
+        :type duration: float
+        :param kwargs: Any other keyword arguments of `Survey`.
+        :type kwargs: None
+        :return: The survey.
+        :rtype: Survey
+        """
+        times, survey_bands, limiting_magnitudes = [], [], []
+        for band in bands:
+            band_cadence = cadence[band] if isinstance(cadence, dict) else cadence
+            band_limit = limiting_magnitude[band] if isinstance(limiting_magnitude, dict) else limiting_magnitude
+            band_times = np.arange(0, duration, band_cadence)
+            times.append(band_times)
+            survey_bands.append(np.full(len(band_times), band, dtype=object))
+            limiting_magnitudes.append(np.full(len(band_times), band_limit, dtype=float))
+        return cls(times=np.concatenate(times), bands=np.concatenate(survey_bands),
+                   limiting_magnitudes=np.concatenate(limiting_magnitudes), **kwargs)
+
+    @classmethod
+    def from_table(cls, table: Union[pd.DataFrame, str], **kwargs: None) -> "Survey":
+        """Creates a survey from a schedule, e.g. the output of a survey simulator.
+
+        :param table: DataFrame or CSV file with the columns 'time', 'band', and 'limiting_magnitude'.
+        :type table: Union[pd.DataFrame, str]
+        :param kwargs: Any other keyword arguments of `Survey`.
+        :type kwargs: None
+        :return: The survey.
+        :rtype: Survey
+        """
+        if isinstance(table, str):
+            table = pd.read_csv(table)
+        return cls(times=table['time'].values, bands=table['band'].values,
+                   limiting_magnitudes=table['limiting_magnitude'].values, **kwargs)
+
+    @property
+    def start(self) -> float:
+        return self.times[0]
+
+    @property
+    def end(self) -> float:
+        return self.times[-1]
+
+    @property
+    def flux_density_errors(self) -> np.ndarray:
+        """
+        :return: Flux density error in mJy of each observation, i.e. the flux density at the limiting magnitude
+                 divided by the detection threshold.
+        :rtype: np.ndarray
+        """
+        return redback.utils.calc_flux_from_mag(
+            self.limiting_magnitudes, reference_flux=3631, magnitude_system='AB') / self.detection_threshold
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __repr__(self) -> str:
+        return f"Survey(name={self.name}, observations={len(self)}, bands={sorted(set(self.bands))})"
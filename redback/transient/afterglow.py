@@ -9,6 +9,7 @@ import pandas as pd
 from astropy.cosmology import Planck18 as cosmo  # noqa
 
 from redback.get_data.directory import afterglow_directory_structure
+from redback.get_data.utils import get_grb_catalogue_row
 from redback.transient.transient import Transient
 from redback.utils import logger
 
@@ -235,12 +236,10 @@ class Afterglow(Transient):
         df.to_csv(join(self.directory_structure.directory_path, filename), index=False)
 
     def _set_data(self) -> None:
-        """Loads data from the meta data table and sets it to the respective attribute."""
+        """Looks up the row of this event in the shared catalogue of the meta data table and sets it to the
+        respective attribute."""
         try:
-            meta_data = pd.read_csv(self.event_table, header=0, error_bad_lines=False, delimiter='\t', dtype='str')
-            meta_data['BAT Photon Index (15-150 keV) (PL = simple power-law, CPL = cutoff power-law)'] = meta_data[
-                'BAT Photon Index (15-150 keV) (PL = simple power-law, CPL = cutoff power-law)'].fillna(0)
-            self.meta_data = meta_data
+            self.meta_data = get_grb_catalogue_row(grb=self._stripped_name, table=self.event_table)
         except FileNotFoundError:
             logger.warning("Meta data does not exist for this event.")
             self.meta_data = None
@@ -252,10 +251,10 @@ class Afterglow(Transient):
         if self.magnitude_data or self.flux_density_data:
             self.photon_index = np.nan
         try:
-            photon_index = self.meta_data.query('GRB == @self._stripped_name')[
-                'BAT Photon Index (15-150 keV) (PL = simple power-law, CPL = cutoff power-law)'].values[0]
+            photon_index = self.meta_data[
+                'BAT Photon Index (15-150 keV) (PL = simple power-law, CPL = cutoff power-law)']
             self.photon_index = self.__clean_string(photon_index)
-        except (AttributeError, IndexError):
+        except (AttributeError, TypeError):
             self.photon_index = np.nan
 
     def _get_redshift(self) -> None:
@@ -263,12 +262,12 @@ class Afterglow(Transient):
         if not np.isnan(self.redshift):
             return
         try:
-            redshift = self.meta_data.query('GRB == @self._stripped_name')['Redshift'].values[0]
+            redshift = self.meta_data['Redshift']
             if isinstance(redshift, str):
                 self.redshift = self.__clean_string(redshift)
             else:
                 self.redshift = redshift
-        except (AttributeError, IndexError):
+        except (AttributeError, TypeError):
             self.redshift = np.nan
 
     def _get_redshift_for_luminosity_calculation(self) -> Union[float, None]:
@@ -287,11 +286,11 @@ class Afterglow(Transient):
     def _set_t90(self) -> None:
         """Sets t90 value from meta data table."""
         try:
-            t90 = self.meta_data.query('GRB == @self._stripped_name')['BAT T90 [sec]'].values[0]
+            t90 = self.meta_data['BAT T90 [sec]']
             if t90 == 0.:
                 return np.nan
             self.t90 = self.__clean_string(t90)
-        except (AttributeError, IndexError):
+        except (AttributeError, TypeError):
             self.t90 = np.nan
 
     @staticmethod
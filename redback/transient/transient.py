@@ -174,8 +174,8 @@ class Transient(object):
     @classmethod
     def from_lasair_data(
             cls, name: str, data_mode: str = "magnitude", active_bands: Union[np.ndarray, str] = 'all',
-            use_phase_model: bool = False) -> Transient:
-        """Constructor method to built object from Open Access Catalogue.
+            use_phase_model: bool = False, data: pd.DataFrame = None) -> Transient:
+        """Constructor method to built object from Lasair data.
 
         :param name: Name of the transient.
         :type name: str
@@ -186,17 +186,22 @@ class Transient(object):
         :type active_bands: Union[np.ndarray, str]
         :param use_phase_model: Whether to use a phase model.
         :type use_phase_model: bool, optional
+        :param data: The processed Lasair data. Read from the processed file if not given.
+        :type data: pandas.DataFrame, optional
 
         :return: A class instance.
         :rtype: OpticalTransient
         """
-        if cls.__name__ == "TDE":
-            transient_type = "tidal_disruption_event"
+        if data is None:
+            if cls.__name__ == "TDE":
+                transient_type = "tidal_disruption_event"
+            else:
+                transient_type = cls.__name__.lower()
+            directory_structure = redback.get_data.directory.lasair_directory_structure(
+                transient=name, transient_type=transient_type)
+            df = pd.read_csv(directory_structure.processed_file_path)
         else:
-            transient_type = cls.__name__.lower()
-        directory_structure = redback.get_data.directory.lasair_directory_structure(
-            transient=name, transient_type=transient_type)
-        df = pd.read_csv(directory_structure.processed_file_path)
+            df = data
         time_days = np.array(df["time (days)"])
         time_mjd = np.array(df["time"])
         magnitude = np.array(df["magnitude"])
@@ -1,10 +1,11 @@
+from collections import OrderedDict
+from functools import lru_cache
 from inspect import isfunction
 import numpy as np
 
 import redback.utils
 from redback.transient_models.fireball_models import predeceleration
 from redback.utils import logger, calc_ABmag_from_flux_density, citation_wrapper
-import astropy.units as uu
 
 extinction_afterglow_base_models = ['tophat', 'cocoon', 'gaussian',
                                     'kn_afterglow', 'cone_afterglow',
@@ -33,9 +34,11 @@ model_library = {'supernova': 'supernova_models', 'afterglow': 'afterglow_models
                  'magnetar_boosted': 'magnetar_boosted_ejecta_models', 'tde': 'tde_models',
                  'kilonova': 'kilonova_models'}
 
+@lru_cache(maxsize=None)
 def _get_correct_function(base_model, model_type=None):
     """
-    Gets the correct function to use for the base model specified
+    Gets the correct function to use for the base model specified.
+    Results are cached so the model library is only searched on the first call for each base model.
 
     :param base_model: string or a function
     :param model_type: type of model, could be None if using a function as input
@@ -58,20 +61,90 @@ def _get_correct_function(base_model, model_type=None):
 
     return function
 
-def _perform_extinction(flux_density, frequency, av, r_v):
+_extinction_laws = ['fitzpatrick99', 'ccm89', 'odonnell94', 'calzetti00']
+
+# A_lambda / A_V is linear in 1 / r_v for ccm89, odonnell94 and calzetti00 and very nearly so for fitzpatrick99,
+# so sampled r_v values are interpolated linearly in 1 / r_v from curves tabulated on this grid.
+_r_v_grid = np.round(np.arange(2.0, 6.0 + 1e-9, 0.05), 2)
+_extinction_curve_cache = OrderedDict()
+_extinction_curve_cache_maxsize = 64
+
+
+def _get_extinction_law(law):
+    """
+    :param law: name of the extinction law, one of 'fitzpatrick99', 'ccm89', 'odonnell94', 'calzetti00'
+    :return: function from the extinction package with signature (wave, a_v, r_v)
+    """
+    import extinction  # noqa
+    if law not in _extinction_laws:
+        raise ValueError(f"Extinction law {law} not implemented. Choose from {_extinction_laws}")
+    return getattr(extinction, law)
+
+
+def _extinction_curve_table(frequency, law):
+    """
+    Tabulates A_lambda / A_V on the r_v grid for a fixed set of frequencies.
+    Tables are cached per (law, frequencies) so that the extinction package is only called once per fit.
+
+    :param frequency: 1D array of frequencies in Hz
+    :param law: name of the extinction law
+    :return: array of shape (len(_r_v_grid), len(frequency))
+    """
+    key = (law, frequency.tobytes())
+    try:
+        table = _extinction_curve_cache[key]
+        _extinction_curve_cache.move_to_end(key)
+        return table
+    except KeyError:
+        pass
+    function = _get_extinction_law(law)
+    angstroms = redback.utils.nu_to_lambda(frequency)
+    table = np.array([function(angstroms, 1.0, r_v) for r_v in _r_v_grid])
+    _extinction_curve_cache[key] = table
+    if len(_extinction_curve_cache) > _extinction_curve_cache_maxsize:
+        _extinction_curve_cache.popitem(last=False)
+    return table
+
+
+def get_extinction_curve(frequency, r_v=3.1, law='fitzpatrick99'):
+    """
+    Extinction curve A_lambda / A_V at the given frequencies.
+    The extinction in magnitudes for any av is then simply av * curve.
+
+    :param frequency: frequency in Hz, float or array
+    :param r_v: extinction parameter
+    :param law: extinction law, one of 'fitzpatrick99' (default), 'ccm89', 'odonnell94', 'calzetti00'
+    :return: A_lambda / A_V with the same shape as frequency
+    """
+    frequency = np.asarray(frequency, dtype=float)
+    flat_frequency = np.atleast_1d(frequency).ravel()
+    if not _r_v_grid[0] <= r_v <= _r_v_grid[-1]:
+        angstroms = redback.utils.nu_to_lambda(flat_frequency)
+        curve = _get_extinction_law(law)(angstroms, 1.0, r_v)
+        return curve.reshape(frequency.shape)
+    table = _extinction_curve_table(flat_frequency, law)
+    idx = min(int(np.searchsorted(_r_v_grid, r_v)), len(_r_v_grid) - 1)
+    if _r_v_grid[idx] == r_v:
+        curve = table[idx]
+    else:
+        lower, upper = 1. / _r_v_grid[idx - 1], 1. / _r_v_grid[idx]
+        weight = (1. / r_v - lower) / (upper - lower)
+        curve = table[idx - 1] + weight * (table[idx] - table[idx - 1])
+    return curve.reshape(frequency.shape)
+
+
+def _perform_extinction(flux_density, frequency, av, r_v, law='fitzpatrick99'):
     """
     :param flux_density: flux density in mjy outputted by the model
     :param frequency: frequency in Hz
     :param av: absolute mag extinction
     :param r_v: extinction parameter
+    :param law: extinction law, one of 'fitzpatrick99' (default), 'ccm89', 'odonnell94', 'calzetti00'
     :return: flux density
     """
-    import extinction  # noqa
-    # convert to angstrom
-    angstroms = redback.utils.nu_to_lambda(frequency)
-    mag_extinction = extinction.fitzpatrick99(angstroms, av, r_v=r_v)
-    flux_density = extinction.apply(mag_extinction, flux_density)
-    return flux_density
+    curve = get_extinction_curve(frequency=frequency, r_v=r_v, law=law)
+    # equivalent to flux_density * 10 ** (-0.4 * av * curve) but exp is considerably cheaper
+    return flux_density * np.exp((-0.4 * np.log(10) * av) * curve)
 
 def _evaluate_extinction_model(time, av, model_type, **kwargs):
     """
@@ -81,20 +154,21 @@ def _evaluate_extinction_model(time, av, model_type, **kwargs):
     :param av: absolute mag extinction
     :param model_type: None, or one of the types implemented
     :param kwargs: Must be all the parameters required by the base_model specified using kwargs['base_model']
-        and r_v, default is 3.1
+        and r_v, default is 3.1, and extinction_law, default is 'fitzpatrick99'
     :return: flux_density or magnitude depending on kwargs['output_format']
     """
-    base_model = kwargs['base_model']
-    frequency = kwargs['frequency']
-    temp_kwargs = kwargs.copy()
-    temp_kwargs['output_format'] = 'flux_density'
-    function = _get_correct_function(base_model=base_model, model_type=model_type)
-    flux_density = function(time, **temp_kwargs)
+    function = _get_correct_function(base_model=kwargs['base_model'], model_type=model_type)
+    # kwargs is already a fresh dict local to this call so we can switch the output format without a copy
+    output_format = kwargs['output_format']
+    kwargs['output_format'] = 'flux_density'
+    flux_density = function(time, **kwargs)
     r_v = kwargs.get('r_v', 3.1)
-    flux_density = _perform_extinction(flux_density=flux_density, frequency=frequency, av=av, r_v=r_v)
-    if kwargs['output_format'] == 'flux_density':
+    law = kwargs.get('extinction_law', 'fitzpatrick99')
+    flux_density = _perform_extinction(flux_density=flux_density, frequency=kwargs['frequency'],
+                                       av=av, r_v=r_v, law=law)
+    if output_format == 'flux_density':
         return flux_density
-    elif kwargs['output_format'] == 'magnitude':
+    elif output_format == 'magnitude':
         return calc_ABmag_from_flux_density(flux_density).value
 
 @citation_wrapper('redback')
@@ -105,7 +179,7 @@ def extinction_with_function(time, av, **kwargs):
     :param time: time in observer frame in days
     :param av: absolute mag extinction
     :param kwargs: Must be all the parameters required by the base_model specified using kwargs['base_model']
-        and r_v, default is 3.1
+        and r_v, default is 3.1, and extinction_law, default is 'fitzpatrick99'
     :return: flux_density or magnitude depending on kwargs['output_format']
     """
     output = _evaluate_extinction_model(time=time, av=av, model_type=None, **kwargs)
@@ -119,7 +193,7 @@ def extinction_with_supernova_base_model(time, av, **kwargs):
     :param time: time in observer frame in days
     :param av: absolute mag extinction
     :param kwargs: Must be all the parameters required by the base_model specified using kwargs['base_model']
-        and r_v, default is 3.1
+        and r_v, default is 3.1, and extinction_law, default is 'fitzpatrick99'
     :return: flux_density or magnitude depending on kwargs['output_format']
     """
     output = _evaluate_extinction_model(time=time, av=av, model_type='supernova', **kwargs)
@@ -132,7 +206,7 @@ def extinction_with_kilonova_base_model(time, av, **kwargs):
     :param time: time in observer frame in days
     :param av: absolute mag extinction
     :param kwargs: Must be all the parameters required by the base_model specified using kwargs['base_model']
-        and r_v, default is 3.1
+        and r_v, default is 3.1, and extinction_law, default is 'fitzpatrick99'
     :return: flux_density or magnitude depending on kwargs['output_format']
     """
     output = _evaluate_extinction_model(time=time, av=av, model_type='kilonova', **kwargs)
@@ -146,7 +220,7 @@ def extinction_with_tde_base_model(time, av, **kwargs):
     :param time: time in observer frame in days
     :param av: absolute mag extinction
     :param kwargs: Must be all the parameters required by the base_model specified using kwargs['base_model']
-        and r_v, default is 3.1
+        and r_v, default is 3.1, and extinction_law, default is 'fitzpatrick99'
     :return: flux_density or magnitude depending on kwargs['output_format']
     """
     output = _evaluate_extinction_model(time=time, av=av, model_type='tde', **kwargs)
@@ -161,7 +235,7 @@ def extinction_with_magnetar_boosted_base_model(time, av, **kwargs):
     :param time: time in observer frame in days
     :param av: absolute mag extinction
     :param kwargs: Must be all the parameters required by the base_model specified using kwargs['base_model']
-        and r_v, default is 3.1
+        and r_v, default is 3.1, and extinction_law, default is 'fitzpatrick99'
     :return: flux_density or magnitude depending on kwargs['output_format']
     """
     output = _evaluate_extinction_model(time=time, av=av, model_type='magnetar_boosted', **kwargs)
@@ -176,7 +250,7 @@ def extinction_with_afterglow_base_model(time, av, **kwargs):
     :param time: time in observer frame in days
     :param av: absolute mag extinction
     :param kwargs: Must be all the parameters required by the base_model specified using kwargs['base_model']
-        and r_v, default is 3.1
+        and r_v, default is 3.1, and extinction_law, default is 'fitzpatrick99'
     :return: flux_density or magnitude depending on kwargs['output_format']
     """
     output = _evaluate_extinction_model(time=time, av=av, model_type='afterglow', **kwargs)
@@ -208,17 +282,13 @@ def _extinction_with_predeceleration(time, lognh, factor, **kwargs):
     :param kwargs: all params
     :return: flux or magnitude with extinction applied depending on kwargs
     """
-    import extinction  # noqa
     lc = predeceleration(time, **kwargs)
     lc = np.nan_to_num(lc)
     factor = factor * 1e21
     nh = 10 ** lognh
     av = nh / factor
     frequency = kwargs['frequency']
-    # convert to angstrom
-    frequency = (frequency * uu.Hz).to(uu.Angstrom).value
-    mag_extinction = extinction.fitzpatrick99(frequency, av, r_v=3.1)
-    lc = extinction.apply(mag_extinction, lc, inplace=True)
+    lc = _perform_extinction(flux_density=lc, frequency=frequency, av=av, r_v=3.1)
     if kwargs['output_format'] == 'flux_density':
         return lc
     elif kwargs['output_format'] == 'magnitude':
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from inspect import isfunction
 import numpy as np
 
@@ -11,17 +12,15 @@ integrated_flux_base_models = ['tophat', 'cocoon', 'gaussian',
                                'smoothpowerlaw', 'powerlawcore',
                                'tophat']
 
-@citation_wrapper('https://ui.adsabs.harvard.edu/abs/2021arXiv210510108S/abstract')
-def integrated_flux_afterglowpy_base_model(time, **kwargs):
+@lru_cache(maxsize=None)
+def _get_integrated_flux_base_function(base_model):
     """
-    Synchrotron afterglow with integrated flux
+    Gets the afterglow function to integrate over. Cached so the model library is only searched once per base model.
 
-    :param time: time in days
-    :param kwargs:all kwargs required by model + frequency: a list of two frequencies to integrate over.
-    :return: integrated flux
+    :param base_model: string or a function
+    :return: function; function to evaluate
     """
     from ..model_library import modules_dict  # import model library in function to avoid circular dependency
-    base_model = kwargs['base_model']
 
     if isfunction(base_model):
         function = base_model
@@ -32,19 +31,117 @@ def integrated_flux_afterglowpy_base_model(time, **kwargs):
         function = modules_dict['afterglow_models'][base_model]
     else:
         raise ValueError("Not a valid base model.")
+    return function
 
-    frequency_bounds = kwargs['frequency']  # should be 2 numbers that serve as start and end point
-    nu_1d = np.linspace(frequency_bounds[0], frequency_bounds[1], 3)
+_MAX_GAUSS_LEGENDRE_NODES = 64
+_gauss_legendre_n_nodes = dict()
+
+@lru_cache(maxsize=32)
+def _log_gauss_legendre_nodes(lower, upper, n_nodes):
+    """
+    Gauss-Legendre nodes and weights for integrating over frequency in log space,
+    i.e., int f(nu) dnu = int f(nu) nu dln(nu). Cached so they are only computed once per band.
+
+    :param lower: lower frequency bound in Hz
+    :param upper: upper frequency bound in Hz
+    :param n_nodes: number of quadrature nodes
+    :return: frequency nodes in Hz, weights in Hz (including the nu Jacobian)
+    """
+    x, w = np.polynomial.legendre.leggauss(n_nodes)
+    log_lower, log_upper = np.log(lower), np.log(upper)
+    half_width = 0.5 * (log_upper - log_lower)
+    nodes = np.exp(half_width * x + 0.5 * (log_upper + log_lower))
+    weights = half_width * w * nodes
+    nodes.flags.writeable = False
+    weights.flags.writeable = False
+    return nodes, weights
+
+def _gauss_legendre_integral(function, time, lower, upper, n_nodes, kwargs):
+    """
+    Integrates the flux density of function over frequency with Gauss-Legendre quadrature in log frequency.
+
+    :param function: flux density function
+    :param time: time in days
+    :param lower: lower frequency bound in Hz
+    :param upper: upper frequency bound in Hz
+    :param n_nodes: number of quadrature nodes
+    :param kwargs: dictionary of all kwargs required by function
+    :return: integrated flux
+    """
+    nu_1d, weights = _log_gauss_legendre_nodes(lower, upper, n_nodes)
+    return weights @ _flux_density_at_frequencies(function, time, nu_1d, kwargs)
+
+def _flux_density_at_frequencies(function, time, nu_1d, kwargs):
     tt, nu = np.meshgrid(time, nu_1d)  # meshgrid makes 2D t and n
-    tt = tt.flatten()
-    nu = nu.flatten()
-    kwargs['frequency'] = nu
-    flux_density = function(tt, **kwargs)
-    lightcurve_at_nu = flux_density.reshape(len(nu_1d), len(time))
+    kwargs = dict(kwargs, frequency=nu.flatten())
+    flux_density = function(tt.flatten(), **kwargs)
     prefactor = 1e-26
-    lightcurve_at_nu = prefactor * lightcurve_at_nu
-    integrated_flux = simps(lightcurve_at_nu, axis=0, x=nu_1d)
-    return integrated_flux
+    return prefactor * flux_density.reshape(len(nu_1d), len(time))
+
+def _adaptive_gauss_legendre_integral(function, time, lower, upper, tolerance, kwargs):
+    """
+    Doubles the number of nodes n until the integrals with n and 2n nodes agree to a relative tolerance at every
+    time, and returns the integral with 2n nodes. Convergence is checked on every call. The search starts from the
+    number of nodes that the last call for the same base model, band and tolerance converged with, or half of it if
+    that call converged straight away, so the node count follows the spectrum as the parameters change.
+
+    :param function: flux density function
+    :param time: time in days
+    :param lower: lower frequency bound in Hz
+    :param upper: upper frequency bound in Hz
+    :param tolerance: relative tolerance of the integrated flux
+    :param kwargs: dictionary of all kwargs required by function
+    :return: integrated flux
+    """
+    key = (function, lower, upper, tolerance)
+    n_nodes = _gauss_legendre_n_nodes.get(key, 2)
+    first_n_nodes = n_nodes
+    integral = _gauss_legendre_integral(function, time, lower, upper, n_nodes, kwargs)
+    while True:
+        finer_integral = _gauss_legendre_integral(function, time, lower, upper, 2 * n_nodes, kwargs)
+        if np.all(np.abs(finer_integral - integral) <= tolerance * np.abs(finer_integral)):
+            break
+        if 2 * n_nodes >= _MAX_GAUSS_LEGENDRE_NODES:
+            logger.warning(f'Gauss-Legendre quadrature did not reach a relative tolerance of {tolerance} '
+                           f'with {2 * n_nodes} nodes')
+            break
+        n_nodes *= 2
+        integral = finer_integral
+    _gauss_legendre_n_nodes[key] = max(2, n_nodes // 2) if n_nodes == first_n_nodes else n_nodes
+    return finer_integral
+
+@citation_wrapper('https://ui.adsabs.harvard.edu/abs/2021arXiv210510108S/abstract')
+def integrated_flux_afterglowpy_base_model(time, **kwargs):
+    """
+    Synchrotron afterglow with integrated flux
+
+    :param time: time in days
+    :param kwargs:all kwargs required by model + frequency: a list of two frequencies to integrate over.
+        integration_method: 'simpson' (default) uses Simpson's rule on 3 linearly spaced frequencies,
+        'gauss_legendre' uses Gauss-Legendre quadrature in log frequency with n_nodes nodes (default 3).
+        tolerance: only for 'gauss_legendre'. If given, the number of nodes n is doubled on every call until the
+        integrals with n and 2 * n nodes agree to this relative tolerance at every time, up to 64 nodes.
+        The afterglowpy spectra are power laws with sharp breaks, so the quadrature converges slowly once a break
+        lies in the band. With the default 3 nodes, the error for the tophat model in the 0.3-10 keV band is ~2%
+        for the median draw of its default priors and up to ~10%, see `redback.benchmarks.benchmark_band_integration`.
+        Use tolerance to control the error.
+    :return: integrated flux
+    """
+    function = _get_integrated_flux_base_function(kwargs['base_model'])
+    frequency_bounds = kwargs['frequency']  # should be 2 numbers that serve as start and end point
+    integration_method = kwargs.get('integration_method', 'simpson')
+    if integration_method == 'simpson':
+        nu_1d = np.linspace(frequency_bounds[0], frequency_bounds[1], 3)
+        lightcurve_at_nu = _flux_density_at_frequencies(function, time, nu_1d, kwargs)
+        return simps(lightcurve_at_nu, axis=0, x=nu_1d)
+    elif integration_method == 'gauss_legendre':
+        lower, upper = float(frequency_bounds[0]), float(frequency_bounds[1])
+        if kwargs.get('tolerance') is None:
+            return _gauss_legendre_integral(function, time, lower, upper, kwargs.get('n_nodes', 3), kwargs)
+        return _adaptive_gauss_legendre_integral(function, time, lower, upper, kwargs['tolerance'], kwargs)
+    else:
+        raise ValueError(f"Integration method {integration_method} not implemented. "
+                         f"Choose from 'simpson' or 'gauss_legendre'.")
 
 @citation_wrapper('https://ui.adsabs.harvard.edu/abs/2021arXiv210510108S/abstract')
 def integrated_flux_rate_model(time, **kwargs):
@@ -6,7 +6,7 @@ from scipy.interpolate import interp1d
 from astropy.cosmology import Planck18 as cosmo  # noqa
 from redback.utils import calc_kcorrected_properties, interpolated_barnes_and_kasen_thermalisation_efficiency, \
     electron_fraction_from_kappa
-from redback.sed import blackbody_to_flux_density
+from redback.sed import DEFAULT_LAMBDA_ARRAY, bandpass_flux_density, blackbody_to_flux_density, sed_spectra
 from redback.constants import *
 from redback.utils import citation_wrapper
 import astropy.units as uu
@@ -236,12 +236,11 @@ def one_component_ejecta_relation_model(time, redshift, mass_1, mass_2,
                     frequency (frequency to calculate - Must be same length as time array or a single number)
     :return: flux_density or magnitude
     """
-    frequency = kwargs['frequency']
     ejecta_relation = kwargs.get('ejecta_relation', ejr.OneComponentBNSNoProjection)
     ejecta_relation = ejecta_relation(mass_1, mass_2, lambda_1, lambda_2)
     mej = ejecta_relation.ejecta_mass
     vej = ejecta_relation.ejecta_velocity
-    flux_density = one_component_kilonova_model(time, redshift, frequency, mej, vej, kappa, **kwargs)
+    flux_density = one_component_kilonova_model(time, redshift, mej, vej, kappa, **kwargs)
     return flux_density
 
 @citation_wrapper('redback')
@@ -255,10 +254,14 @@ def one_component_kilonova_model(time, redshift, mej, vej, kappa, **kwargs):
     :param kwargs: temperature_floor
                    frequency (frequency to calculate - Must be same length as time array or a single number)
                    output_format
-    :return: flux_density or magnitude
+                   bands (optional band of each observation. If given, the flux density is averaged over the
+                   transmission curve of the band (see redback.filters) instead of evaluated at frequency)
+                   lambda_array (observer frame wavelengths in Angstrom for output_format='spectra')
+    :return: flux_density or magnitude, or flux density per wavelength in erg/s/cm^2/Angstrom with shape
+             (len(time), len(lambda_array)) for output_format='spectra'
     """
     time = time * day_to_s
-    frequency = kwargs['frequency']
+    bands = kwargs.get('bands', None)
     time_temp = np.geomspace(1e-4, 1e7, 300)
     _, temperature, r_photosphere = _one_component_kilonova_model(time_temp, mej, vej, kappa, **kwargs)
     dl = cosmo.luminosity_distance(redshift).cgs.value
@@ -267,13 +270,23 @@ def one_component_kilonova_model(time, redshift, mej, vej, kappa, **kwargs):
     temp_func = interp1d(time_temp, y=temperature)
     rad_func = interp1d(time_temp, y=r_photosphere)
     # convert to source frame time and frequency
-    frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
+    if bands is None and kwargs['output_format'] != 'spectra':
+        frequency, time = calc_kcorrected_properties(frequency=kwargs['frequency'], redshift=redshift, time=time)
+    else:
+        time = time / (1 + redshift)
 
     temp = temp_func(time)
     photosphere = rad_func(time)
 
-    flux_density = blackbody_to_flux_density(temperature=temp, r_photosphere=photosphere,
-                                             dl=dl, frequency=frequency)
+    if kwargs['output_format'] == 'spectra':
+        return sed_spectra(blackbody_to_flux_density, lambda_array=kwargs.get('lambda_array', DEFAULT_LAMBDA_ARRAY),
+                           redshift=redshift, n_times=len(time), temperature=temp, r_photosphere=photosphere, dl=dl)
+    elif bands is None:
+        flux_density = blackbody_to_flux_density(temperature=temp, r_photosphere=photosphere,
+                                                 dl=dl, frequency=frequency)
+    else:
+        flux_density = bandpass_flux_density(blackbody_to_flux_density, bands=np.broadcast_to(bands, time.shape),
+                                             redshift=redshift, temperature=temp, r_photosphere=photosphere, dl=dl)
 
     if kwargs['output_format'] == 'flux_density':
         return flux_density.to(uu.mJy).value
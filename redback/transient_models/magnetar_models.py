@@ -12,6 +12,10 @@ from redback.transient_models.fireball_models import one_component_fireball_mode
 luminosity_models = ['evolving_magnetar', 'evolving_magnetar_only', 'gw_magnetar', 'radiative_losses',
                      'radiative_losses_smoothness', 'radiative_only', 'collapsing_radiative_losses']
 
+_HYP2F1_NODES_PER_DECADE = 16
+_HYP2F1_KAPPA_RANGE = (1e-2, 10.)
+_HYP2F1_ALPHA_RANGE = (1., 21.)
+
 
 def _mu_function(time, mu0, muinf, tm):
     mu = muinf + (mu0 - muinf) * np.exp(-time / tm)
@@ -220,6 +224,50 @@ def _integral_general_collapsing(time, t0, kappa, tau, nn, tcol, **kwargs):
     first_term, second_term = _get_integral_terms(time=time, t0=t0, kappa=kappa, tau=tau, nn=nn)
     return np.heaviside(tcol - time, 1e-50) * (first_term - second_term)
 
+def _radiative_losses_hyp2f1(kappa, alpha, x):
+    """
+    Evaluates hyp2f1(1 + kappa, alpha, 2 + kappa, -x) for the radiative losses integrals.
+
+    For long arrays the function is evaluated exactly on _HYP2F1_NODES_PER_DECADE log-spaced nodes per decade
+    spanning the range of x, and interpolated in between with a cubic Hermite interpolant of log(hyp2f1) in log(x),
+    using the analytic derivative at the nodes. For kappa in [1e-2, 10] and alpha in [1, 21] (braking indices
+    n >= 1.1) the relative error is below 1e-5. Outside these ranges, for short arrays, or for non-positive x,
+    hyp2f1 is evaluated exactly.
+
+    :param kappa: radiative efficiency
+    :param alpha: (1 + nn) / (nn - 1) for braking index nn
+    :param x: time / tau
+    :return: hyp2f1(1 + kappa, alpha, 2 + kappa, -x)
+    """
+    x = np.asarray(x, dtype=float)
+    exact = (not _HYP2F1_KAPPA_RANGE[0] <= kappa <= _HYP2F1_KAPPA_RANGE[1]
+             or not _HYP2F1_ALPHA_RANGE[0] <= alpha <= _HYP2F1_ALPHA_RANGE[1]
+             or x.size < 2 or np.any(x <= 0))
+    if not exact:
+        log_x = np.log(x)
+        log_x_min, log_x_max = np.min(log_x), np.max(log_x)
+        n_nodes = max(int(np.ceil((log_x_max - log_x_min) / np.log(10) * _HYP2F1_NODES_PER_DECADE)) + 1, 2)
+        exact = x.size <= 2 * n_nodes
+    if exact:
+        return ss.hyp2f1(1 + kappa, alpha, 2 + kappa, -x)
+
+    nodes = np.linspace(log_x_min, log_x_max, n_nodes)
+    step = nodes[1] - nodes[0]
+    x_nodes = np.exp(nodes)
+    f_nodes = ss.hyp2f1(1 + kappa, alpha, 2 + kappa, -x_nodes)
+    if not np.all(np.isfinite(f_nodes) & (f_nodes > 0)):
+        return ss.hyp2f1(1 + kappa, alpha, 2 + kappa, -x)
+    y = np.log(f_nodes)
+    dy = (1 + kappa) * ((1 + x_nodes) ** (-alpha) / f_nodes - 1) * step
+
+    index = np.clip(((log_x - log_x_min) / step).astype(int), 0, n_nodes - 2)
+    s = (log_x - nodes[index]) / step
+    s2 = s * s
+    s3 = s2 * s
+    log_f = ((2 * s3 - 3 * s2 + 1) * y[index] + (s3 - 2 * s2 + s) * dy[index] +
+             (3 * s2 - 2 * s3) * y[index + 1] + (s3 - s2) * dy[index + 1])
+    return np.exp(log_f)
+
 @citation_wrapper('https://ui.adsabs.harvard.edu/abs/2020MNRAS.499.5986S/abstract')
 def _get_integral_terms(time, t0, kappa, tau, nn):
     """
@@ -233,7 +281,7 @@ def _get_integral_terms(time, t0, kappa, tau, nn):
     :return: first and second terms
     """
     alpha = (1 + nn) / (-1 + nn)
-    pft = ss.hyp2f1(1 + kappa, alpha, 2 + kappa, -time / tau)
+    pft = _radiative_losses_hyp2f1(kappa, alpha, time / tau)
     pst = ss.hyp2f1(1 + kappa, alpha, 2 + kappa, -t0 / tau)
     first_term = (time ** (1 + kappa) * pft) / (1 + kappa)
     second_term = (t0 ** (1 + kappa) * pst) / (1 + kappa)
@@ -242,7 +290,7 @@ def _get_integral_terms(time, t0, kappa, tau, nn):
 @citation_wrapper('https://ui.adsabs.harvard.edu/abs/2020MNRAS.499.5986S/abstract')
 def _integral_mdr(time, t0, kappa, a, **kwargs):
     """
-    Calculate integral for vacuum dipole radiation
+    Calculate integral for vacuum dipole radiation, i.e., the general integral with braking index n = 3
 
     :param time: time in seconds
     :param t0: time for radiative losses to start in seconds
@@ -250,13 +298,8 @@ def _integral_mdr(time, t0, kappa, a, **kwargs):
     :param a: 1/tau (spin down damping timescale)
     :return: integral
     """
-    z_f = (1 + a * time) ** (-1)
-    z_int = (1 + a * t0) ** (-1)
-    divisor_i = a ** (1 + kappa) * (kappa - 1) * (1 + a * t0) ** (1 - kappa)
-    divisor_f = a ** (1 + kappa) * (kappa - 1) * (1 + a * time) ** (1 - kappa)
-    first = ss.hyp2f1(1 - kappa, -kappa, 2 - kappa, z_f) / divisor_f
-    second = ss.hyp2f1(1 - kappa, -kappa, 2 - kappa, z_int) / divisor_i
-    return first - second
+    first_term, second_term = _get_integral_terms(time=time, t0=t0, kappa=kappa, tau=1. / a, nn=3.)
+    return first_term - second_term
 
 @citation_wrapper('https://ui.adsabs.harvard.edu/abs/2020MNRAS.499.5986S/abstract')
 def piecewise_radiative_losses(time, a_1, alpha_1, l0, tau, nn, kappa, t0, **kwargs):
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from inspect import isfunction
 import numpy as np
 
@@ -16,6 +17,25 @@ extinction_model_functions = {'supernova':extinction_models.extinction_with_supe
                               'tde':extinction_models.extinction_with_tde_base_model,
                               'magnetar_boosted':extinction_models.extinction_with_magnetar_boosted_base_model}
 
+@lru_cache(maxsize=None)
+def _get_base_function(base_model, module=None):
+    """
+    Gets the function for the base model. Cached so the model library is only searched once per base model.
+
+    :param base_model: string or a function
+    :param module: name of the model module to search e.g., 'afterglow_models'. Searches all models if None.
+    :return: function; function to evaluate
+    """
+    from redback.model_library import all_models_dict, modules_dict  # import model library in function to avoid circular dependency
+    if isfunction(base_model):
+        return base_model
+    elif isinstance(base_model, str):
+        if module is None:
+            return all_models_dict[base_model]
+        return modules_dict[module][base_model]
+    else:
+        raise ValueError("Not a valid base model.")
+
 @citation_wrapper('redback')
 def t0_base_model(time, t0, **kwargs):
     """
@@ -24,9 +44,7 @@ def t0_base_model(time, t0, **kwargs):
     :param kwargs: Must be all the parameters required by the base_model specified using kwargs['base_model']
     :return: output of the base_model
     """
-    from redback.model_library import all_models_dict  # import model library in function to avoid circular dependency
-    base_model = kwargs['base_model']
-    function = all_models_dict(base_model)
+    function = _get_base_function(kwargs['base_model'])
     t0 = Time(t0, format='mjd')
     time = Time(np.asarray(time, dtype=float), format='mjd')
     time = (time - t0).to(uu.day).value
@@ -157,13 +175,10 @@ def _t0_thin_shell_predeceleration(time, **kwargs):
     gradient = kwargs['m']
     tt_predec = time[time < tp]
     tt_postdec = time[time >= tp]
-    predec_kwargs = kwargs.copy()
-    afterglow_kwargs = kwargs.copy()
-    f2 = t0_afterglow_extinction_model_d2g(tt_postdec, **afterglow_kwargs)
-    f_at_tp = t0_afterglow_extinction_model_d2g(tp, **afterglow_kwargs)
+    f2 = t0_afterglow_extinction_model_d2g(tt_postdec, **kwargs)
+    f_at_tp = t0_afterglow_extinction_model_d2g(tp, **kwargs)
     aa = f_at_tp / (kwargs['tp'] - kwargs['t0']) ** gradient
-    predec_kwargs['aa'] = aa
-    predec_kwargs['mm'] = gradient
+    predec_kwargs = dict(kwargs, aa=aa, mm=gradient)
 
     f1 = extinction_models._extinction_with_predeceleration(tt_predec, **predec_kwargs)
     flux = np.concatenate((f1, f2))
@@ -186,13 +201,10 @@ def _t0_exinction_models_with_sampled_t_peak(time, tp, **kwargs):
     gradient = kwargs['m']
     tt_predec = time[time < tp]
     tt_postdec = time[time >= tp]
-    predec_kwargs = kwargs.copy()
-    afterglow_kwargs = kwargs.copy()
-    f2 = t0_afterglow_extinction_model_d2g(tt_postdec, **afterglow_kwargs)
-    f_at_tp = t0_afterglow_extinction_model_d2g(tp, **afterglow_kwargs)
+    f2 = t0_afterglow_extinction_model_d2g(tt_postdec, **kwargs)
+    f_at_tp = t0_afterglow_extinction_model_d2g(tp, **kwargs)
     aa = f_at_tp / (kwargs['tp'] - kwargs['t0']) ** gradient
-    predec_kwargs['aa'] = aa
-    predec_kwargs['mm'] = gradient
+    predec_kwargs = dict(kwargs, aa=aa, mm=gradient)
     f1 = extinction_models._extinction_with_predeceleration(tt_predec, **predec_kwargs)
     flux = np.concatenate((f1, f2))
     if kwargs['output_format'] == 'flux_density':
@@ -242,16 +254,7 @@ def _t0_afterglowpy_flux_density_model(time, burst_start, **kwargs):
     :return: flux density for time > T0 parameter
 
     """
-    from ..model_library import modules_dict
-    base_model = kwargs['base_model']
-
-    if isfunction(base_model):
-        function = base_model
-    elif isinstance(base_model, str):
-        function = modules_dict['afterglow_models'][base_model]
-    else:
-        raise ValueError("Not a valid base model.")
-
+    function = _get_base_function(kwargs['base_model'], module='afterglow_models')
     grb_time = time[time >= burst_start] - burst_start
     flux = function(grb_time, **kwargs)
     return flux, grb_time
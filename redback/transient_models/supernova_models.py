@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 from redback.transient_models.phenomenological_models import exponential_powerlaw
 from redback.transient_models.magnetar_models import magnetar_only
 import redback.interaction_processes as ip
@@ -11,16 +10,44 @@ from redback.constants import day_to_s, solar_mass, km_cgs, au_cgs
 from inspect import isfunction
 import astropy.units as uu
 from collections import namedtuple
+from functools import lru_cache
 
 homologous_expansion_models = ['exponential_powerlaw_bolometric', 'arnett_bolometric',
                                'basic_magnetar_powered_bolometric','slsn_bolometric',
                                'general_magnetar_slsn_bolometric','csm_interaction_bolometric',
                                'type_1c_bolometric','type_1a_bolometric']
 
+@lru_cache(maxsize=32)
+def _get_sncosmo_model(model_name, host_extinction, mw_extinction):
+    """
+    :return: a configured sncosmo model and its default parameters. The model is shared between calls,
+             so all parameters must be set before it is used.
+    """
+    import sncosmo
+    model = sncosmo.Model(source=model_name)
+    if host_extinction:
+        model.add_effect(sncosmo.CCM89Dust(), 'host', 'rest')
+    if mw_extinction:
+        model.add_effect(sncosmo.F99Dust(), 'mw', 'obs')
+    return model, model.parameters.copy()
+
+
+@lru_cache(maxsize=1024)
+def _sncosmo_unit_amplitude_peakmag(model_name, host_extinction, mw_extinction, band, magsys, source_parameters):
+    """
+    :return: peak magnitude of the source with an amplitude of one, which only depends on the shape parameters
+    """
+    model, _ = _get_sncosmo_model(model_name, host_extinction, mw_extinction)
+    source = model.source
+    source.set(**dict(zip(source.param_names, (1.,) + source_parameters)))
+    return source.peakmag(band, magsys)
+
+
 @citation_wrapper('https://zenodo.org/record/6363879#.YkQn3y8RoeY')
 def sncosmo_models(time, redshift, model_kwargs, **kwargs):
     """
-    A wrapper to SNCosmo models
+    A wrapper to SNCosmo models. The configured sncosmo models and the peak magnitude normalisation for given
+    shape parameters are cached between calls.
 
     :param time: observer frame time in days
     :param redshift: redshift
@@ -38,10 +65,9 @@ def sncosmo_models(time, redshift, model_kwargs, **kwargs):
             if used adds an extra parameter ebv which must also be in kwargs; host galaxy E(B-V). Set to 0.1 by default
     :return: flux_density or magnitude depending on output_format kwarg
     """
-    import sncosmo
-    frequency = kwargs['frequency']
+    frequency = np.atleast_1d(kwargs['frequency'])
 
-    if (len(frequency) != 1 or len(frequency) == len(time)):
+    if len(frequency) != 1 and len(frequency) != len(time):
         raise ValueError('frequency array must be of length 1 or same size as time array')
 
     cosmology = kwargs.get('cosmology', cosmo)
@@ -53,28 +79,28 @@ def sncosmo_models(time, redshift, model_kwargs, **kwargs):
     mw_extinction = kwargs.get('mw_extinction',True)
     magsystem = kwargs.get('magnitude_system', 'ab')
 
-    model = sncosmo.Model(source=model_name)
+    model, default_parameters = _get_sncosmo_model(model_name, host_extinction, mw_extinction)
+    model.parameters = default_parameters
     model.set(z=redshift)
     model.set(t0=peak_time)
     model.update(model_kwargs)
-
     if host_extinction:
-        ebv = kwargs.get('ebv', 0.1)
-        model.add_effect(sncosmo.CCM89Dust(), 'host', 'rest')
-        model.set(hostebv=ebv)
-    if mw_extinction:
-        model.add_effect(sncosmo.F99Dust(), 'mw', 'obs')
+        model.set(hostebv=kwargs.get('ebv', 0.1))
+
+    # equivalent to model.set_source_peakabsmag, with the band integration memoized on the shape parameters
+    source = model.source
+    unit_amplitude_peakmag = _sncosmo_unit_amplitude_peakmag(
+        model_name, host_extinction, mw_extinction, peak_abs_mag_band, magsystem,
+        tuple(float(source.get(name)) for name in source.param_names[1:]))
+    peak_mag = peak_abs_mag + cosmology.distmod(redshift).value
+    source.set(**{source.param_names[0]: 10. ** (0.4 * (unit_amplitude_peakmag - peak_mag))})
 
-    model.set_source_peakabsmag(peak_abs_mag, band=peak_abs_mag_band, magsys=magsystem, cosmo=cosmology)
-    unique_frequency = np.sort(np.unique(frequency))
+    unique_frequency, frequency_index = np.unique(frequency, return_inverse=True)
     angstroms = nu_to_lambda(unique_frequency)
 
     _flux = model.flux(time, angstroms)
-
     if len(frequency) > 1:
-        _flux = pd.DataFrame(_flux)
-        _flux.columns = unique_frequency
-        _flux = np.array([_flux[freq].iloc[i] for i, freq in enumerate(frequency)])
+        _flux = _flux[np.arange(len(frequency)), frequency_index]
 
     units = uu.erg / uu.s / uu.Hz / uu.cm ** 2.
     _flux = _flux * nu_to_lambda(frequency)
@@ -144,12 +170,14 @@ def sn_exponential_powerlaw(time, redshift, lbol_0, alpha_1, alpha_2, tpeak_d, *
     frequency = kwargs['frequency']
     frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
 
-    lbol = exponential_powerlaw_bolometric(time=time, lbol_0=lbol_0,
+    lbol = exponential_powerlaw_bolometric(time=unique_time, lbol_0=lbol_0,
                                            alpha_1=alpha_1,alpha_2=alpha_2, tpeak_d=tpeak_d,
                                            interaction_process=_interaction_process, **kwargs)
-    photo = _photosphere(time=time, luminosity=lbol, **kwargs)
-    sed_1 = _sed(temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
+    photo = _photosphere(time=unique_time, luminosity=lbol, **kwargs)
+    sed_1 = _sed(temperature=photo.photosphere_temperature[time_index], r_photosphere=photo.r_photosphere[time_index],
               frequency=frequency, luminosity_distance=dl)
 
     flux_density = sed_1.flux_density
@@ -209,23 +237,44 @@ def arnett(time, redshift, f_nickel, mej, **kwargs):
     :param photosphere: Default is TemperatureFloor.
             kwargs must have vej or relevant parameters if using different photosphere model
     :param sed: Default is blackbody.
-    :return: flux_density or magnitude depending on output_format kwarg
+    :param bands: Optional band of each observation. If given, the flux density is averaged over the transmission
+            curve of the band (see redback.filters) instead of evaluated at frequency.
+    :param lambda_array: Observer frame wavelengths in Angstrom for output_format='spectra'.
+    :return: flux_density or magnitude depending on output_format kwarg,
+             or flux density per wavelength in erg/s/cm^2/Angstrom with shape (len(time), len(lambda_array))
+             for output_format='spectra'
     """
     _interaction_process = kwargs.get("interaction_process", ip.Diffusion)
     _photosphere = kwargs.get("photosphere", photosphere.TemperatureFloor)
     _sed = kwargs.get("sed", sed.Blackbody)
+    bands = kwargs.get("bands", None)
 
-
-    frequency = kwargs['frequency']
-    frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
+    if bands is None and kwargs['output_format'] != 'spectra':
+        frequency, time = calc_kcorrected_properties(frequency=kwargs['frequency'], redshift=redshift, time=time)
+    else:
+        time = time / (1 + redshift)
     dl = cosmo.luminosity_distance(redshift).cgs.value
-
-    lbol = arnett_bolometric(time=time, f_nickel=f_nickel, mej=mej, interaction_process=_interaction_process, **kwargs)
-    photo = _photosphere(time=time, luminosity=lbol, **kwargs)
-    sed_1 = _sed(temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
-                frequency=frequency, luminosity_distance=dl)
-
-    flux_density = sed_1.flux_density
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
+
+    lbol = arnett_bolometric(time=unique_time, f_nickel=f_nickel, mej=mej, interaction_process=_interaction_process,
+                             **kwargs)
+    photo = _photosphere(time=unique_time, luminosity=lbol, **kwargs)
+    if kwargs['output_format'] == 'spectra':
+        spectra = sed.sed_spectra(_sed, lambda_array=kwargs.get('lambda_array', sed.DEFAULT_LAMBDA_ARRAY),
+                                  redshift=redshift, n_times=len(unique_time),
+                                  temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
+                                  luminosity_distance=dl)
+        return spectra[time_index]
+    elif bands is None:
+        sed_1 = _sed(temperature=photo.photosphere_temperature[time_index],
+                     r_photosphere=photo.r_photosphere[time_index], frequency=frequency, luminosity_distance=dl)
+        flux_density = sed_1.flux_density
+    else:
+        flux_density = sed.bandpass_flux_density(
+            _sed, bands=np.broadcast_to(bands, time.shape), redshift=redshift,
+            temperature=photo.photosphere_temperature[time_index], r_photosphere=photo.r_photosphere[time_index],
+            luminosity_distance=dl)
 
     if kwargs['output_format'] == 'flux_density':
         return flux_density.to(uu.mJy).value
@@ -294,12 +343,14 @@ def basic_magnetar_powered(time, redshift, p0, bp, mass_ns, theta_pb,**kwargs):
     frequency = kwargs['frequency']
     frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
 
-    lbol = basic_magnetar_powered_bolometric(time=time, p0=p0,bp=bp, mass_ns=mass_ns, theta_pb=theta_pb,
+    lbol = basic_magnetar_powered_bolometric(time=unique_time, p0=p0,bp=bp, mass_ns=mass_ns, theta_pb=theta_pb,
                                      interaction_process=_interaction_process, **kwargs)
-    photo = _photosphere(time=time, luminosity=lbol, **kwargs)
+    photo = _photosphere(time=unique_time, luminosity=lbol, **kwargs)
 
-    sed_1 = _sed(temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
+    sed_1 = _sed(temperature=photo.photosphere_temperature[time_index], r_photosphere=photo.r_photosphere[time_index],
                 frequency=frequency, luminosity_distance=dl)
 
     flux_density = sed_1.flux_density
@@ -349,20 +400,33 @@ def slsn(time, redshift, p0, bp, mass_ns, theta_pb,**kwargs):
     :param photosphere: Default is TemperatureFloor.
             kwargs must have vej or relevant parameters if using different photosphere model
     :param sed: Default is CutoffBlackbody.
-    :return: flux_density or magnitude depending on output_format kwarg
+    :param lambda_array: Observer frame wavelengths in Angstrom for output_format='spectra'.
+    :return: flux_density or magnitude depending on output_format kwarg,
+             or flux density per wavelength in erg/s/cm^2/Angstrom with shape (len(time), len(lambda_array))
+             for output_format='spectra'
     """
-    frequency = kwargs['frequency']
     _interaction_process = kwargs.get("interaction_process", ip.Diffusion)
     _photosphere = kwargs.get("photosphere", photosphere.TemperatureFloor)
     _sed = kwargs.get("sed", sed.CutoffBlackbody)
     cutoff_wavelength = kwargs.get('cutoff_wavelength', 3000)
-    frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
+    if kwargs['output_format'] == 'spectra':
+        time = time / (1 + redshift)
+    else:
+        frequency, time = calc_kcorrected_properties(frequency=kwargs['frequency'], redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
-
-    lbol = slsn_bolometric(time=time, p0=p0, bp=bp, mass_ns=mass_ns, theta_pb=theta_pb, **kwargs)
-    photo = _photosphere(time=time, luminosity=lbol, **kwargs)
-    sed_1 = _sed(time=time, luminosity=lbol, temperature=photo.photosphere_temperature,
-                r_photosphere=photo.r_photosphere,frequency=frequency, luminosity_distance=dl,
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
+
+    lbol = slsn_bolometric(time=unique_time, p0=p0, bp=bp, mass_ns=mass_ns, theta_pb=theta_pb, **kwargs)
+    photo = _photosphere(time=unique_time, luminosity=lbol, **kwargs)
+    if kwargs['output_format'] == 'spectra':
+        spectra = sed.sed_spectra(_sed, lambda_array=kwargs.get('lambda_array', sed.DEFAULT_LAMBDA_ARRAY),
+                                  redshift=redshift, n_times=len(unique_time), time=unique_time, luminosity=lbol,
+                                  temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
+                                  luminosity_distance=dl, cutoff_wavelength=cutoff_wavelength)
+        return spectra[time_index]
+    sed_1 = _sed(time=time, luminosity=lbol[time_index], temperature=photo.photosphere_temperature[time_index],
+                r_photosphere=photo.r_photosphere[time_index],frequency=frequency, luminosity_distance=dl,
                 cutoff_wavelength=cutoff_wavelength)
 
     flux_density = sed_1.flux_density
@@ -400,18 +464,20 @@ def magnetar_nickel(time, redshift, f_nickel, mej, p0, bp, mass_ns, theta_pb, **
     frequency = kwargs['frequency']
     frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
 
-    lbol_mag = _basic_magnetar(time=time*day_to_s, p0=p0, bp=bp, mass_ns=mass_ns, theta_pb=theta_pb)
-    lbol_arnett = _nickelcobalt_engine(time=time, f_nickel=f_nickel, mej=mej)
+    lbol_mag = _basic_magnetar(time=unique_time*day_to_s, p0=p0, bp=bp, mass_ns=mass_ns, theta_pb=theta_pb)
+    lbol_arnett = _nickelcobalt_engine(time=unique_time, f_nickel=f_nickel, mej=mej)
     lbol = lbol_mag + lbol_arnett
 
     if _interaction_process is not None:
-        interaction_class = _interaction_process(time=time, luminosity=lbol, mej=mej, **kwargs)
+        interaction_class = _interaction_process(time=unique_time, luminosity=lbol, mej=mej, **kwargs)
         lbol = interaction_class.new_luminosity
 
-    photo = _photosphere(time=time, luminosity=lbol, **kwargs)
+    photo = _photosphere(time=unique_time, luminosity=lbol, **kwargs)
 
-    sed_1 = _sed(temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
+    sed_1 = _sed(temperature=photo.photosphere_temperature[time_index], r_photosphere=photo.r_photosphere[time_index],
                 frequency=frequency, luminosity_distance=dl)
 
     flux_density = sed_1.flux_density
@@ -519,12 +585,14 @@ def homologous_expansion_supernova_model(time, redshift, mej, ek, **kwargs):
     frequency = kwargs['frequency']
     frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
 
-    lbol = homologous_expansion_supernova_model_bolometric(time=time, mej=mej, ek=ek,
+    lbol = homologous_expansion_supernova_model_bolometric(time=unique_time, mej=mej, ek=ek,
                                                            interaction_process=_interaction_process, **kwargs)
-    photo = _photosphere(time=time, luminosity=lbol, **kwargs)
+    photo = _photosphere(time=unique_time, luminosity=lbol, **kwargs)
 
-    sed_1 = _sed(temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
+    sed_1 = _sed(temperature=photo.photosphere_temperature[time_index], r_photosphere=photo.r_photosphere[time_index],
                 frequency=frequency, luminosity_distance=dl)
 
     flux_density = sed_1.flux_density
@@ -560,12 +628,14 @@ def thin_shell_supernova_model(time, redshift, mej, ek, **kwargs):
     frequency = kwargs['frequency']
     frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
 
-    lbol = thin_shell_supernova_model_bolometric(time=time, mej=mej, ek=ek,
+    lbol = thin_shell_supernova_model_bolometric(time=unique_time, mej=mej, ek=ek,
                                      interaction_process=_interaction_process, **kwargs)
-    photo = _photosphere(time=time, luminosity=lbol, **kwargs)
+    photo = _photosphere(time=unique_time, luminosity=lbol, **kwargs)
 
-    sed_1 = _sed(temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
+    sed_1 = _sed(temperature=photo.photosphere_temperature[time_index], r_photosphere=photo.r_photosphere[time_index],
                 frequency=frequency, luminosity_distance=dl)
 
     flux_density = sed_1.flux_density
@@ -729,13 +799,15 @@ def csm_interaction(time, redshift, mej, csm_mass, vej, eta, rho, kappa, r0, **k
     frequency = kwargs['frequency']
     frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
 
-    lbol = csm_interaction_bolometric(time=time, mej=mej, csm_mass=csm_mass, vej=vej, eta=eta,
+    lbol = csm_interaction_bolometric(time=unique_time, mej=mej, csm_mass=csm_mass, vej=vej, eta=eta,
                                       rho=rho, kappa=kappa, r0=r0, interaction_process=_interaction_process, **kwargs)
 
-    photo = _photosphere(time=time, luminosity=lbol, vej=vej, **kwargs)
+    photo = _photosphere(time=unique_time, luminosity=lbol, vej=vej, **kwargs)
 
-    sed_1 = _sed(temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
+    sed_1 = _sed(temperature=photo.photosphere_temperature[time_index], r_photosphere=photo.r_photosphere[time_index],
                 frequency=frequency, luminosity_distance=dl)
 
     flux_density = sed_1.flux_density
@@ -766,19 +838,21 @@ def csm_nickel(time, redshift, mej, f_nickel, csm_mass, ek, eta, rho, kappa, r0,
     frequency = kwargs['frequency']
     frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
 
     vej = np.sqrt(2.0 * ek / (mej * solar_mass)) / km_cgs
     kwargs['vej'] = vej
-    nickel_lbol = arnett_bolometric(time=time, f_nickel=f_nickel,
+    nickel_lbol = arnett_bolometric(time=unique_time, f_nickel=f_nickel,
                                     mej=mej, interaction_process=ip.Diffusion, **kwargs)
-    csm_lbol = csm_interaction_bolometric(time=time, mej=mej, csm_mass=csm_mass, eta=eta,
+    csm_lbol = csm_interaction_bolometric(time=unique_time, mej=mej, csm_mass=csm_mass, eta=eta,
                                       rho=rho, kappa=kappa, r0=r0, interaction_process=ip.CSMDiffusion, **kwargs)
     lbol = nickel_lbol + csm_lbol
 
-    photo = photosphere.TemperatureFloor(time=time, luminosity=lbol, vej=vej, **kwargs)
+    photo = photosphere.TemperatureFloor(time=unique_time, luminosity=lbol, vej=vej, **kwargs)
 
-    sed_1 = sed.Blackbody(temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
-                frequency=frequency, luminosity_distance=dl)
+    sed_1 = sed.Blackbody(temperature=photo.photosphere_temperature[time_index],
+                          r_photosphere=photo.r_photosphere[time_index], frequency=frequency, luminosity_distance=dl)
 
     flux_density = sed_1.flux_density
 
@@ -805,14 +879,17 @@ def type_1a(time, redshift, f_nickel, mej, **kwargs):
     cutoff_wavelength = kwargs.get('cutoff_wavelength', 3000)
     frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
-    lbol = arnett_bolometric(time=time, f_nickel=f_nickel, mej=mej,
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
+    lbol = arnett_bolometric(time=unique_time, f_nickel=f_nickel, mej=mej,
                              interaction_process=ip.Diffusion, **kwargs)
 
-    photo = photosphere.TemperatureFloor(time=time, luminosity=lbol, **kwargs)
-    sed_1 = sed.CutoffBlackbody(time=time, luminosity=lbol, temperature=photo.photosphere_temperature,
-                                r_photosphere=photo.r_photosphere,frequency=frequency, luminosity_distance=dl,
-                                cutoff_wavelength=cutoff_wavelength)
-    sed_2 = sed.Line(time=time, luminosity=lbol, frequency=frequency, luminosity_distance=dl,
+    photo = photosphere.TemperatureFloor(time=unique_time, luminosity=lbol, **kwargs)
+    sed_1 = sed.CutoffBlackbody(time=time, luminosity=lbol[time_index],
+                                temperature=photo.photosphere_temperature[time_index],
+                                r_photosphere=photo.r_photosphere[time_index], frequency=frequency,
+                                luminosity_distance=dl, cutoff_wavelength=cutoff_wavelength)
+    sed_2 = sed.Line(time=time, luminosity=lbol[time_index], frequency=frequency, luminosity_distance=dl,
                      sed=sed_1, **kwargs)
 
     flux_density = sed_2.flux_density
@@ -841,12 +918,14 @@ def type_1c(time, redshift, f_nickel, mej, **kwargs):
     nu_max = kwargs.get('nu_max', 1e9)
     frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
-    lbol = arnett_bolometric(time=time, f_nickel=f_nickel, mej=mej,
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
+    lbol = arnett_bolometric(time=unique_time, f_nickel=f_nickel, mej=mej,
                              interaction_process=ip.Diffusion, **kwargs)
 
-    photo = photosphere.TemperatureFloor(time=time, luminosity=lbol, **kwargs)
-    sed_1 = sed.Blackbody(temperature=photo.photosphere_temperature,
-                          r_photosphere=photo.r_photosphere,frequency=frequency, luminosity_distance=dl)
+    photo = photosphere.TemperatureFloor(time=unique_time, luminosity=lbol, **kwargs)
+    sed_1 = sed.Blackbody(temperature=photo.photosphere_temperature[time_index],
+                          r_photosphere=photo.r_photosphere[time_index],frequency=frequency, luminosity_distance=dl)
     sed_2 = sed.Synchrotron(frequency=frequency, luminosity_distance=dl, pp=pp, nu_max=nu_max, **kwargs)
 
     flux_density = sed_1.flux_density + sed_2.flux_density
@@ -901,12 +980,14 @@ def general_magnetar_slsn(time, redshift, l0, tsd, nn, ** kwargs):
     frequency = kwargs['frequency']
     frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
 
-    lbol = general_magnetar_slsn_bolometric(time=time, l0=l0, tsd=tsd, nn=nn,
+    lbol = general_magnetar_slsn_bolometric(time=unique_time, l0=l0, tsd=tsd, nn=nn,
                                              interaction_process = _interaction_process, ** kwargs)
-    photo = _photosphere(time=time, luminosity=lbol, **kwargs)
+    photo = _photosphere(time=unique_time, luminosity=lbol, **kwargs)
 
-    sed_1 = _sed(temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
+    sed_1 = _sed(temperature=photo.photosphere_temperature[time_index], r_photosphere=photo.r_photosphere[time_index],
                 frequency = frequency, luminosity_distance = dl)
 
     flux_density = sed_1.flux_density
@@ -54,21 +54,36 @@ def tde_analytical(time, redshift, l0, t_0, **kwargs):
     :param sed: CutoffBlackbody must have cutoff_wavelength in kwargs or it will default to 3000 Angstrom
     :param kwargs: Must be all the kwargs required by the specific interaction_process
      e.g., for Diffusion TemperatureFloor: kappa, kappa_gamma, vej (km/s), temperature_floor
-    :return: flux_density or magnitude depending on output_format kwarg
+    :param lambda_array: Observer frame wavelengths in Angstrom for output_format='spectra'.
+    :return: flux_density or magnitude depending on output_format kwarg,
+             or flux density per wavelength in erg/s/cm^2/Angstrom with shape (len(time), len(lambda_array))
+             for output_format='spectra'
     """
     _interaction_process = kwargs.get("interaction_process", ip.Diffusion)
     _photosphere = kwargs.get("photosphere", photosphere.TemperatureFloor)
     _sed = kwargs.get("sed", sed.CutoffBlackbody)
 
-    frequency = kwargs['frequency']
     cutoff_wavelength = kwargs.get('cutoff_wavelength', 3000)
-    frequency, time = calc_kcorrected_properties(frequency=frequency, redshift=redshift, time=time)
+    if kwargs['output_format'] == 'spectra':
+        time = time / (1 + redshift)
+    else:
+        frequency, time = calc_kcorrected_properties(frequency=kwargs['frequency'], redshift=redshift, time=time)
     dl = cosmo.luminosity_distance(redshift).cgs.value
-    lbol = tde_analytical_bolometric(time=time, l0=l0, t_0=t_0, interaction_process=_interaction_process, **kwargs)
+    # engine and photosphere only depend on time so evaluate them once per epoch, not per band
+    unique_time, time_index = np.unique(time, return_inverse=True)
+    lbol = tde_analytical_bolometric(time=unique_time, l0=l0, t_0=t_0, interaction_process=_interaction_process,
+                                     **kwargs)
 
-    photo = _photosphere(time=time, luminosity=lbol, **kwargs)
-    sed_1 = _sed(time=time, temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
-                 frequency=frequency, luminosity_distance=dl, cutoff_wavelength=cutoff_wavelength, luminosity=lbol)
+    photo = _photosphere(time=unique_time, luminosity=lbol, **kwargs)
+    if kwargs['output_format'] == 'spectra':
+        spectra = sed.sed_spectra(_sed, lambda_array=kwargs.get('lambda_array', sed.DEFAULT_LAMBDA_ARRAY),
+                                  redshift=redshift, n_times=len(unique_time), time=unique_time, luminosity=lbol,
+                                  temperature=photo.photosphere_temperature, r_photosphere=photo.r_photosphere,
+                                  luminosity_distance=dl, cutoff_wavelength=cutoff_wavelength)
+        return np.nan_to_num(spectra)[time_index]
+    sed_1 = _sed(time=time, temperature=photo.photosphere_temperature[time_index],
+                 r_photosphere=photo.r_photosphere[time_index], frequency=frequency, luminosity_distance=dl,
+                 cutoff_wavelength=cutoff_wavelength, luminosity=lbol[time_index])
 
     flux_density = sed_1.flux_density
     flux_density = np.nan_to_num(flux_density)
@@ -13,8 +13,6 @@ import numpy as np
 import pandas as pd
 from scipy.interpolate import RegularGridInterpolator, interp1d
 from scipy.stats import gaussian_kde
-from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException
 
 import redback
 from redback.constants import *
@@ -145,6 +143,7 @@ def check_element(driver, id_number):
     """
     checks that an element exists on a website, and provides an exception
     """
+    from selenium.common.exceptions import NoSuchElementException
     try:
         driver.find_element_by_id(id_number)
     except NoSuchElementException as e:
@@ -184,7 +183,8 @@ def bands_to_frequency(bands):
 
 
 def fetch_driver():
-    # open the webdriver
+    # open the webdriver, selenium is only needed here so we import it lazily
+    from selenium import webdriver
     return webdriver.PhantomJS()
 
 
@@ -12,7 +12,7 @@ setup(name='redback',
       author='Nikhil Sarin, Moritz Huebner',
       author_email='nikhil.sarin@su.se',
       license='MIT',
-      packages=['redback', 'redback.get_data', 'redback.transient', 'redback.transient_models'],
+      packages=['redback', 'redback.benchmarks', 'redback.get_data', 'redback.simulate', 'redback.transient', 'redback.transient_models'],
       package_dir={'redback': 'redback', },
       package_data={'redback': ['priors/*', 'tables/*', 'plot_styles/*']},
       python_requires=">=3.7",
@@ -0,0 +1,83 @@
+import os
+import unittest
+
+import bilby
+import numpy as np
+
+import redback.benchmarks
+from redback.benchmarks import models
+
+
+class TestBenchmarkBandIntegration(unittest.TestCase):
+
+    def test_tolerance_controls_error(self):
+        bilby.core.utils.random.seed(0)
+        results = redback.benchmarks.benchmark_band_integration(n_draws=3, n_times=5)
+        self.assertSetEqual(set(redback.benchmarks.integration.DEFAULT_SETTINGS), set(results))
+        self.assertLess(results['gauss_legendre_1e_3']['max_error'], 1e-3)
+        self.assertLess(results['gauss_legendre_1e_3']['max_error'], results['gauss_legendre']['max_error'])
+        self.assertGreater(results['gauss_legendre_1e_3']['time'], 0)
+
+
+class TestBenchmarkModel(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.filename = 'benchmarks_test.json'
+
+    def tearDown(self) -> None:
+        if os.path.isfile(self.filename):
+            os.remove(self.filename)
+
+    def test_benchmark_model(self):
+        result = models.benchmark_model('two_component_powerlaw', n_calls=3, batch_size=5)
+        self.assertEqual('ok', result['status'])
+        self.assertGreater(result['latency_median'], 0)
+        self.assertGreaterEqual(result['latency_median'], result['latency_min'])
+        self.assertGreater(result['throughput'], 0)
+
+    def test_model_without_prior_file_is_skipped(self):
+        result = models.benchmark_model('gaussian_prompt')
+        self.assertEqual('skipped', result['status'])
+
+    def test_benchmark_models_are_public_models(self):
+        benchmark_models = models.get_benchmark_models()
+        self.assertIn('tophat', benchmark_models)
+        self.assertNotIn('lru_cache', benchmark_models)
+        self.assertFalse(any(name.startswith('_') for name in benchmark_models))
+
+    def test_times_in_model_units(self):
+        seconds = models.get_times(redback.model_library.all_models_dict['magnetar_only'])
+        days = models.get_times(redback.model_library.all_models_dict['arnett'])
+        self.assertEqual(1e5, np.max(seconds))
+        self.assertEqual(100, np.max(days))
+
+    def test_save_and_load(self):
+        benchmarks = redback.benchmarks.run_benchmarks(
+            models=['two_component_powerlaw'], filename=self.filename, n_calls=2, batch_size=2)
+        self.assertDictEqual(benchmarks['results'], redback.benchmarks.load_results(self.filename)['results'])
+
+
+class TestCompareToBaseline(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.baseline = dict(results=dict(
+            a=dict(status='ok', latency_median=1.0, throughput=1.0),
+            b=dict(status='ok', latency_median=1.0, throughput=1.0),
+            c=dict(status='skipped', reason='')))
+
+    def test_no_regressions(self):
+        benchmarks = dict(results=dict(a=dict(status='ok', latency_median=1.1, throughput=0.9)))
+        self.assertListEqual([], redback.benchmarks.compare_to_baseline(benchmarks, self.baseline, threshold=0.25))
+
+    def test_regressions(self):
+        benchmarks = dict(results=dict(a=dict(status='ok', latency_median=2.0, throughput=1.0),
+                                       b=dict(status='ok', latency_median=1.0, throughput=0.5)))
+        regressions = redback.benchmarks.compare_to_baseline(benchmarks, self.baseline, threshold=0.25)
+        self.assertListEqual([('a', 'latency_median'), ('b', 'throughput')],
+                             [(regression['model'], regression['metric']) for regression in regressions])
+        self.assertAlmostEqual(2.0, regressions[1]['slowdown'])
+
+    def test_missing_and_skipped_models_are_ignored(self):
+        benchmarks = dict(results=dict(c=dict(status='ok', latency_median=2.0, throughput=1.0),
+                                       d=dict(status='ok', latency_median=2.0, throughput=1.0)))
+        self.assertListEqual([], redback.benchmarks.compare_to_baseline(benchmarks, self.baseline))
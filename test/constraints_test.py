@@ -0,0 +1,104 @@
+import os
+import shutil
+import sys
+import unittest
+
+import numpy as np
+
+import redback.constraints
+
+
+def _linear_maximum_mass(log_p, gamma_1, gamma_2, gamma_3):
+    return 0.5 * (log_p - 34.) + 0.2 * gamma_1 + 0.1 * gamma_2 + 0.1 * gamma_3
+
+
+def _linear_speed_of_sound(log_p, gamma_1, gamma_2, gamma_3):
+    return 0.1 * (log_p - 34.) + 0.1 * gamma_1 + 0.05 * gamma_2 + 0.05 * gamma_3
+
+
+class TestPiecewisePolytropeTable(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.grid = dict(log_p=np.linspace(34., 35., 5), gamma_1=np.linspace(2., 4., 5),
+                         gamma_2=np.linspace(1., 3., 4), gamma_3=np.linspace(1., 3., 4))
+        self.table = redback.constraints.PiecewisePolytropeTable.build(
+            **self.grid, maximum_mass_function=np.vectorize(_linear_maximum_mass),
+            speed_of_sound_function=np.vectorize(_linear_speed_of_sound))
+        self.outdir = "eos_table"
+
+    def tearDown(self) -> None:
+        redback.constraints.set_piecewise_polytrope_table(None)
+        shutil.rmtree(self.outdir, ignore_errors=True)
+
+    def test_query_matches_exact_solution(self):
+        rng = np.random.default_rng(1)
+        parameters = [rng.uniform(grid[0], grid[-1], 1000) for grid in self.grid.values()]
+        maximum_eos_mass, maximum_speed_of_sound = self.table(*parameters)
+        self.assertTrue(np.allclose(_linear_maximum_mass(*parameters), maximum_eos_mass))
+        self.assertTrue(np.allclose(_linear_speed_of_sound(*parameters), maximum_speed_of_sound))
+        self.assertLess(self.table.n_exact, 1000)
+
+    def test_points_near_boundaries_and_outside_grid_are_solved_exactly(self):
+        self.table.maximum_mass_boundary = 1.27
+        near_boundary = (34.5, 3., 2., 2.)
+        self.assertAlmostEqual(1.25, _linear_maximum_mass(*near_boundary))
+        self.table(*near_boundary)
+        self.assertEqual(1, self.table.n_exact)
+        maximum_eos_mass, _ = self.table(36., 3., 2., 2.)
+        self.assertEqual(2, self.table.n_exact)
+        self.assertAlmostEqual(_linear_maximum_mass(36., 3., 2., 2.), maximum_eos_mass)
+
+    def test_save_and_load(self):
+        os.makedirs(self.outdir)
+        filename = os.path.join(self.outdir, "table.npz")
+        self.table.save(filename)
+        redback.constraints.set_piecewise_polytrope_table(filename)
+        table = redback.constraints.get_piecewise_polytrope_table()
+        self.assertTrue(np.array_equal(self.table.maximum_eos_mass, table.maximum_eos_mass))
+        for expected, grid in zip(self.table.grid, table.grid):
+            self.assertTrue(np.array_equal(expected, grid))
+
+    def test_constraints_use_table(self):
+        redback.constraints.set_piecewise_polytrope_table(self.table)
+        parameters = dict(log_p=np.array([34.2, 34.8]), gamma_1=np.array([2.5, 3.5]),
+                          gamma_2=np.array([1.5, 2.5]), gamma_3=np.array([1.5, 2.5]))
+        converted = redback.constraints.piecewise_polytrope_eos_constraints(parameters)
+        self.assertTrue(np.allclose(_linear_maximum_mass(**parameters), converted['maximum_eos_mass']))
+        self.assertTrue(np.allclose(_linear_speed_of_sound(**parameters), converted['maximum_speed_of_sound']))
+
+
+class TestPiecewisePolytropeTableDefaultSolvers(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.outdir = "toast_stand_in"
+        package = os.path.join(self.outdir, "toast")
+        os.makedirs(package)
+        with open(os.path.join(package, "__init__.py"), "w") as f:
+            f.write("from . import piecewise_polytrope\n")
+        with open(os.path.join(package, "piecewise_polytrope.py"), "w") as f:
+            f.write("def maximum_mass(log_p, Gamma_1, Gamma_2, Gamma_3):\n"
+                    "    return 0.5 * (log_p - 34.) + 0.2 * Gamma_1 + 0.1 * Gamma_2 + 0.1 * Gamma_3\n\n\n"
+                    "def maximum_speed_of_sound(log_p, Gamma_1, Gamma_2, Gamma_3):\n"
+                    "    return 0.1 * (log_p - 34.) + 0.1 * Gamma_1 + 0.05 * Gamma_2 + 0.05 * Gamma_3\n")
+        self.toast = sys.modules.pop("toast", None)
+        sys.path.insert(0, os.path.abspath(self.outdir))
+        self.grid = dict(log_p=np.linspace(34., 35., 3), gamma_1=np.linspace(2., 4., 3),
+                         gamma_2=np.linspace(1., 3., 2), gamma_3=np.linspace(1., 3., 2))
+
+    def tearDown(self) -> None:
+        sys.path.remove(os.path.abspath(self.outdir))
+        for name in ["toast", "toast.piecewise_polytrope"]:
+            sys.modules.pop(name, None)
+        if self.toast is not None:
+            sys.modules["toast"] = self.toast
+        shutil.rmtree(self.outdir, ignore_errors=True)
+
+    def test_build_with_pool(self):
+        table = redback.constraints.PiecewisePolytropeTable.build(**self.grid, npool=2)
+        serial = redback.constraints.PiecewisePolytropeTable.build(**self.grid, npool=1)
+        mesh = np.meshgrid(*self.grid.values(), indexing='ij')
+        self.assertTrue(np.allclose(_linear_maximum_mass(*mesh), table.maximum_eos_mass))
+        self.assertTrue(np.array_equal(serial.maximum_speed_of_sound, table.maximum_speed_of_sound))
+        maximum_eos_mass, _ = table(36., 3., 2., 2.)
+        self.assertEqual(1, table.n_exact)
+        self.assertAlmostEqual(_linear_maximum_mass(36., 3., 2., 2.), maximum_eos_mass)
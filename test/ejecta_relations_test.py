@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+import redback.ejecta_relations as ejr
+
+
+class TestEjectaRelations(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.mass_1 = rng.uniform(1.3, 2., 100)
+        self.mass_2 = rng.uniform(1., 1.3, 100)
+        self.lambda_1 = rng.uniform(100, 800, 100)
+        self.lambda_2 = rng.uniform(100, 800, 100)
+        self.chi = rng.uniform(-0.9, 0.9, 100)
+
+    def tearDown(self) -> None:
+        del self.mass_1
+        del self.mass_2
+        del self.lambda_1
+        del self.lambda_2
+        del self.chi
+
+    def test_bns_relations_accept_arrays(self):
+        for relation in [ejr.OneComponentBNSNoProjection, ejr.OneComponentBNSProjection]:
+            arrays = relation(self.mass_1, self.mass_2, self.lambda_1, self.lambda_2)
+            scalar = relation(self.mass_1[3], self.mass_2[3], self.lambda_1[3], self.lambda_2[3])
+            self.assertEqual((100,), arrays.ejecta_mass.shape)
+            for attribute in ['ejecta_mass', 'ejecta_velocity', 'qej', 'phej']:
+                self.assertAlmostEqual(getattr(scalar, attribute), getattr(arrays, attribute)[3])
+
+    def test_two_component_bns_matches_functional_api(self):
+        relation = ejr.TwoComponentBNS(self.mass_1, self.mass_2, self.lambda_1, self.lambda_2, mtov=2.2, zeta=0.2)
+        self.assertTrue(np.array_equal(
+            ejr.bns_disk_wind_mass(self.mass_1, self.mass_2, self.lambda_1, self.lambda_2, mtov=2.2, zeta=0.2),
+            relation.disk_wind_mej))
+        self.assertTrue(np.array_equal(
+            ejr.bns_dynamical_ejecta_mass(self.mass_1, self.mass_2, self.lambda_1, self.lambda_2),
+            relation.dynamical_mej))
+
+    def test_nsbh_relations_accept_arrays(self):
+        mass_bh = 3 * self.mass_1
+        two_component = ejr.TwoComponentNSBH(mass_bh, self.mass_2, self.chi, self.lambda_2, zeta=0.2)
+        one_component = ejr.OneComponentNSBH(mass_bh, self.mass_2, self.chi, self.lambda_2)
+        scalar = ejr.OneComponentNSBH(mass_bh[5], self.mass_2[5], self.chi[5], self.lambda_2[5])
+        self.assertTrue(np.array_equal(two_component.dynamical_mej, one_component.ejecta_mass))
+        self.assertAlmostEqual(scalar.ejecta_mass, one_component.ejecta_mass[5])
+        self.assertTrue(np.all(two_component.disk_wind_mej >= 0))
+        self.assertAlmostEqual(6., ejr.calc_isco_radius(0.))
@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+from redback.eos import Piecewise_polytrope
+
+try:
+    import lalsimulation
+    lalsimulation_available = True
+except ModuleNotFoundError:
+    lalsimulation_available = False
+
+
+@unittest.skipUnless(lalsimulation_available, "lalsimulation is not installed")
+class TestPiecewisePolytrope(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.eos = Piecewise_polytrope(log_p=34.384, gamma_1=3.005, gamma_2=2.988, gamma_3=2.851)
+
+    def tearDown(self) -> None:
+        del self.eos
+
+    def test_family_is_shared_between_instances(self):
+        other = Piecewise_polytrope(log_p=34.384, gamma_1=3.005, gamma_2=2.988, gamma_3=2.851)
+        self.assertIs(self.eos.family, other.family)
+        self.assertIs(self.eos.mass_radius_lambda_curve()[0], other.mass_radius_lambda_curve()[0])
+
+    def test_radius_of_mass_matches_family(self):
+        mass = np.array([1.2, 1.4, 1.8])
+        expected = [lalsimulation.SimNeutronStarRadius(mm * 1.98840987e30, self.eos.family) for mm in mass]
+        self.assertTrue(np.allclose(self.eos.radius_of_mass(mass), expected, rtol=1e-12))
+
+    def test_radius_of_mass_drops_masses_outside_family(self):
+        mass = np.array([1.4, self.eos.maximum_mass() + 0.1])
+        self.assertEqual(1, len(self.eos.radius_of_mass(mass)))
+
+    def test_lambda_of_mass_from_curve_matches_family(self):
+        mass = np.array([1.2, 1.4, 1.8])
+        radius = np.array([lalsimulation.SimNeutronStarRadius(mm * 1.98840987e30, self.eos.family) for mm in mass])
+        k2 = np.array([lalsimulation.SimNeutronStarLoveNumberK2(mm * 1.98840987e30, self.eos.family) for mm in mass])
+        compactness = 6.67430e-11 * mass * 1.98840987e30 / (299792458. ** 2 * radius)
+        expected = (2 / 3) * k2 / compactness ** 5
+        self.assertTrue(np.allclose(self.eos.lambda_of_mass_from_curve(mass), expected, rtol=1e-3))
+
+    def test_lambda_of_mass_from_curve_is_nan_outside_family(self):
+        mass = np.array([[1.4, 1.6], [self.eos.maximum_mass() + 0.1, 1e-3]])
+        Lambda = self.eos.lambda_of_mass_from_curve(mass)
+        self.assertEqual(mass.shape, Lambda.shape)
+        self.assertTrue(np.all(np.isnan(Lambda[1])))
+        self.assertTrue(np.all(Lambda[0] > 0))
@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+import redback
+from redback.filters import Filter, FilterSet, get_filter, get_filter_set, register_filter
+
+
+class TestFilterSet(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.blue = Filter.top_hat('test_blue', 4000, 5500)
+        self.red = Filter.top_hat('test_red', 5500, 7000)
+        self.filters = FilterSet([self.blue, self.red], resolution=2000)
+
+    def tearDown(self) -> None:
+        del self.blue
+        del self.red
+        del self.filters
+
+    def test_weights_are_normalised(self):
+        self.assertTrue(np.allclose(1, np.asarray(self.filters.weights.sum(axis=1)).ravel()))
+
+    def test_power_law_average(self):
+        # <f_nu> = int nu^alpha dnu / nu / int dnu / nu for a top-hat filter
+        alpha = 2.
+        flux_density = self.filters.frequency ** alpha
+        nu_low = redback.constants.speed_of_light / 5500e-8
+        nu_high = redback.constants.speed_of_light / 4000e-8
+        expected = (nu_high ** alpha - nu_low ** alpha) / alpha / np.log(nu_high / nu_low)
+        self.assertAlmostEqual(1, self.filters.synthetic_flux_density(flux_density)[0] / expected, places=3)
+
+    def test_observation_weights_match_band_weights(self):
+        flux_density = np.sin(self.filters.wavelength / 300.) + 2
+        bands = ['test_red', 'test_blue', 'test_red']
+        observation_index, wavelength_index, matrix = self.filters.observation_weights(bands)
+        self.assertTrue(np.array_equal([0, 1, 2], np.unique(observation_index)))
+        expected = self.filters.synthetic_flux_density(flux_density)[[1, 0, 1]]
+        self.assertTrue(np.allclose(expected, matrix @ flux_density[wavelength_index]))
+
+    def test_unknown_band(self):
+        with self.assertRaises(ValueError):
+            self.filters.band_index(['test_green'])
+
+    def test_invalid_transmission(self):
+        with self.assertRaises(ValueError):
+            Filter('test_invalid', wavelength=[5000, 4000], transmission=[1, 1])
+
+
+class TestBandpassFluxDensity(unittest.TestCase):
+
+    def setUp(self) -> None:
+        register_filter(Filter.top_hat('test_g', 4000, 5500))
+        register_filter(Filter.top_hat('test_r', 5500, 7000))
+        self.time = np.repeat(np.linspace(1, 30, 10), 2)
+        self.bands = np.tile(['test_g', 'test_r'], 10)
+        self.kwargs = dict(redshift=0.05, f_nickel=0.1, mej=2., kappa=0.1, kappa_gamma=10., vej=1e4,
+                           temperature_floor=3000., output_format='magnitude')
+
+    def test_registered_filter(self):
+        self.assertIs(get_filter('test_g'), get_filter_set(('test_g', 'test_r')).filters[0])
+
+    def test_sed_class_and_function_agree(self):
+        temperature = np.linspace(4000, 8000, 20)
+        r_photosphere = np.full(20, 1e15)
+        from_class = redback.sed.bandpass_flux_density(
+            redback.sed.Blackbody, bands=self.bands, redshift=0.1, temperature=temperature,
+            r_photosphere=r_photosphere, luminosity_distance=1e27)
+        from_function = redback.sed.bandpass_flux_density(
+            redback.sed.blackbody_to_flux_density, bands=self.bands, redshift=0.1, temperature=temperature,
+            r_photosphere=r_photosphere, dl=1e27)
+        self.assertTrue(np.allclose(from_class.value, from_function.value))
+
+    def test_arnett_bandpass_is_close_to_effective_frequency(self):
+        filters = get_filter_set(('test_g', 'test_r'))
+        frequency = np.array([f.effective_frequency for f in filters.filters])[filters.band_index(self.bands)]
+        bandpass = redback.transient_models.supernova_models.arnett(self.time, bands=self.bands, **self.kwargs)
+        effective = redback.transient_models.supernova_models.arnett(self.time, frequency=frequency, **self.kwargs)
+        self.assertEqual(effective.shape, bandpass.shape)
+        self.assertLess(np.max(np.abs(bandpass - effective)), 0.1)
+        self.assertGreater(np.max(np.abs(bandpass - effective)), 0)
@@ -1,6 +1,12 @@
+import asyncio
+import json
 import os.path
 import shutil
+import subprocess
+import sys
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 from unittest.mock import MagicMock, PropertyMock
 
@@ -37,6 +43,72 @@ class TestUtils(unittest.TestCase):
         table = redback.get_data.utils.get_grb_table()
         self.assertListEqual(expected_keys, list(table.keys()))
 
+    def test_get_grb_catalogue_row(self):
+        table = redback.get_data.utils.get_grb_table()
+        row = redback.get_data.utils.get_grb_catalogue_row(
+            grb="GRB041223", table=redback.get_data.utils._long_table)
+        self.assertEqual("100585", row['Trigger Number'])
+        self.assertEqual(list(table.keys()), list(row.keys()))
+
+    def test_get_grb_catalogue_row_missing(self):
+        self.assertIsNone(redback.get_data.utils.get_grb_catalogue_row(
+            grb="123456", table=redback.get_data.utils._short_table))
+
+    def test_get_grb_catalogue_fills_photon_index(self):
+        catalogue = redback.get_data.utils.get_grb_catalogue(table=redback.get_data.utils._long_table)
+        photon_indices = [row[redback.get_data.utils._photon_index_column] for row in catalogue.values()]
+        self.assertFalse(any(pd.isna(photon_index) for photon_index in photon_indices))
+
+    def test_get_batse_trigger_from_grb(self):
+        self.assertEqual(105, redback.get_data.utils.get_batse_trigger_from_grb("910421"))
+
+    def test_get_batse_trigger_from_grb_repeated_label(self):
+        self.assertEqual(109, redback.get_data.utils.get_batse_trigger_from_grb("GRB910425A"))
+        self.assertEqual(110, redback.get_data.utils.get_batse_trigger_from_grb("GRB910425B"))
+
+    def test_get_batse_trigger_from_grb_missing(self):
+        with self.assertRaises(ValueError):
+            redback.get_data.utils.get_batse_trigger_from_grb("GRB910425")
+
+    def test_get_batse_triggers_from_grbs(self):
+        triggers = redback.get_data.utils.get_batse_triggers_from_grbs(["910421", "GRB000104B", "GRB910425A"])
+        self.assertTrue(np.array_equal(np.array([105, 7934, 109]), triggers))
+
+    def test_get_batse_triggers_from_grbs_missing(self):
+        with self.assertRaises(ValueError):
+            redback.get_data.utils.get_batse_triggers_from_grbs(["910421", "123456"])
+
+    def test_get_batse_trigger_index_persisted(self):
+        cache_file = "batse_trigger_index_test.npz"
+        try:
+            index = redback.get_data.utils.get_batse_trigger_index(cache_file=cache_file)
+            self.assertTrue(os.path.isfile(cache_file))
+            redback.get_data.utils._build_batse_trigger_index.cache_clear()
+            loaded = redback.get_data.utils.get_batse_trigger_index(cache_file=cache_file)
+            self.assertDictEqual(dict(index), dict(loaded))
+        finally:
+            os.remove(cache_file)
+
+    def test_get_batse_trigger_index_persisted_without_extension(self):
+        cache_file = "batse_trigger_index_test"
+        redback.get_data.utils._build_batse_trigger_index.cache_clear()
+        try:
+            index = redback.get_data.utils.get_batse_trigger_index(cache_file=cache_file)
+            self.assertTrue(os.path.isfile(f"{cache_file}.npz"))
+            redback.get_data.utils._build_batse_trigger_index.cache_clear()
+            with mock.patch("astropy.io.ascii.read") as read:
+                loaded = redback.get_data.utils.get_batse_trigger_index(cache_file=cache_file)
+            read.assert_not_called()
+            self.assertDictEqual(dict(index), dict(loaded))
+        finally:
+            os.remove(f"{cache_file}.npz")
+
+    def test_get_grb_catalogue_is_cached(self):
+        first = redback.get_data.utils.get_grb_catalogue(table=redback.get_data.utils._short_table)
+        table = os.path.join(os.path.dirname(redback.__file__), 'transient', '..', 'tables', 'SGRB_table.txt')
+        second = redback.get_data.utils.get_grb_catalogue(table=table)
+        self.assertIs(first, second)
+
 
 class TestDirectory(unittest.TestCase):
 
@@ -267,32 +339,33 @@ class TestOpenDataGetter(unittest.TestCase):
         self.assertEqual(expected, self.getter.metadata_path)
 
     @mock.patch("os.path.isfile")
-    @mock.patch("requests.get")
-    def test_collect_data_file_exists(self, get, isfile):
+    @mock.patch("redback.get_data.download.fetch")
+    def test_collect_data_file_exists(self, fetch, isfile):
         isfile.return_value = True
         self.getter.collect_data()
         isfile.assert_called_once_with(self.getter.raw_file_path)
-        get.assert_not_called()
+        fetch.assert_not_called()
 
     @mock.patch("os.path.isfile")
-    @mock.patch("requests.get")
-    @mock.patch("urllib.request.urlretrieve")
-    def test_collect_data_not_found(self, urlretrieve, get, isfile):
+    @mock.patch("redback.get_data.download.fetch")
+    @mock.patch("redback.get_data.download.write")
+    def test_collect_data_not_found(self, write, fetch, isfile):
         isfile.return_value = False
-        type(get.return_value).text = PropertyMock(return_value='not found')
+        type(fetch.return_value).text = PropertyMock(return_value='not found')
         with self.assertRaises(ValueError):
             self.getter.collect_data()
-        get.assert_called_once_with(self.getter.url)
-        urlretrieve.assert_not_called()
+        fetch.assert_called_once_with(self.getter.url)
+        write.assert_not_called()
 
     @mock.patch("os.path.isfile")
-    @mock.patch("requests.get")
-    @mock.patch("urllib.request.urlretrieve")
-    def test_collect_data(self, urlretrieve, get, isfile):
+    @mock.patch("redback.get_data.download.fetch")
+    @mock.patch("redback.get_data.download.write")
+    def test_collect_data(self, write, fetch, isfile):
         isfile.return_value = False
-        type(get.return_value).text = PropertyMock(return_value='')
+        type(fetch.return_value).text = PropertyMock(return_value='')
         self.getter.collect_data()
-        urlretrieve.assert_called_with(url=self.getter.metadata_url, filename=self.getter.metadata_path)
+        fetch.assert_called_with(self.getter.metadata_url)
+        write.assert_called_with(response=fetch.return_value, filename=self.getter.metadata_path)
 
     @mock.patch("pandas.read_csv")
     @mock.patch("pandas.isna")
@@ -474,16 +547,17 @@ class TestSwiftDataGetter(unittest.TestCase):
         redback.utils.logger.warning.assert_called_once()
 
     @mock.patch("os.path.isfile")
-    @mock.patch('requests.get')
-    def test_collect_data_no_lightcurve_available(self, get, isfile):
+    @mock.patch("redback.get_data.download.fetch")
+    def test_collect_data_no_lightcurve_available(self, fetch, isfile):
         isfile.return_value = False
-        get.return_value = MagicMock()
-        get.return_value.__setattr__('text', 'No Light curve available')
+        fetch.return_value = MagicMock()
+        fetch.return_value.__setattr__('text', 'No Light curve available')
         with self.assertRaises(redback.redback_errors.WebsiteExist):
             self.getter.collect_data()
 
     @mock.patch("os.path.isfile")
-    def test_collect_data_xrt(self, isfile):
+    @mock.patch("redback.get_data.download.fetch")
+    def test_collect_data_xrt(self, fetch, isfile):
         isfile.return_value = False
         self.getter.instrument = "XRT"
         self.getter.download_directly = MagicMock()
@@ -495,7 +569,8 @@ class TestSwiftDataGetter(unittest.TestCase):
         self.getter.download_flux_density_data.assert_not_called()
 
     @mock.patch("os.path.isfile")
-    def test_collect_data_prompt(self, isfile):
+    @mock.patch("redback.get_data.download.fetch")
+    def test_collect_data_prompt(self, fetch, isfile):
         isfile.return_value = False
         self.getter.transient_type = 'prompt'
         self.getter.download_directly = MagicMock()
@@ -507,7 +582,8 @@ class TestSwiftDataGetter(unittest.TestCase):
         self.getter.download_flux_density_data.assert_not_called()
 
     @mock.patch("os.path.isfile")
-    def test_collect_data_afterglow_flux(self, isfile):
+    @mock.patch("redback.get_data.download.fetch")
+    def test_collect_data_afterglow_flux(self, fetch, isfile):
         isfile.return_value = False
         self.getter.instrument = 'BAT+XRT'
         self.getter.transient_type = 'afterglow'
@@ -521,7 +597,8 @@ class TestSwiftDataGetter(unittest.TestCase):
         self.getter.download_flux_density_data.assert_not_called()
 
     @mock.patch("os.path.isfile")
-    def test_collect_data_afterglow_flux_density(self, isfile):
+    @mock.patch("redback.get_data.download.fetch")
+    def test_collect_data_afterglow_flux_density(self, fetch, isfile):
         isfile.return_value = False
         self.getter.instrument = 'BAT+XRT'
         self.getter.transient_type = 'afterglow'
@@ -577,6 +654,38 @@ class TestSwiftDataGetter(unittest.TestCase):
         self.getter.convert_raw_prompt_data_to_csv.assert_called_once()
 
 
+class TestReadQDPBlocks(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.filename = "qdp_test_file.qdp"
+        with open(self.filename, "w") as f:
+            f.write("READ TERR 1 2\n! header comment\n"
+                    "NO NO NO\n! batSNR4flux\n1.0\t0.1\t-0.1\t5e-08\t1e-08\t-1e-08\t7\n"
+                    "2.0\t0.1\t-0.1\t4e-08\t1e-08\t-1e-08\t7\n"
+                    "NO NO NO\n! xrtwtflux\n100.5\t10.0\t-10.0\t3e-10\t2e-11\t-2e-11\t7\n")
+
+    def tearDown(self) -> None:
+        os.remove(self.filename)
+
+    def test_data(self):
+        data, _ = redback.get_data.swift._read_qdp_blocks(self.filename, n_columns=6)
+        expected = np.array([[1.0, 0.1, -0.1, 5e-08, 1e-08, -1e-08],
+                             [2.0, 0.1, -0.1, 4e-08, 1e-08, -1e-08],
+                             [100.5, 10.0, -10.0, 3e-10, 2e-11, -2e-11]])
+        self.assertTrue(np.array_equal(expected, data))
+
+    def test_labels_per_block(self):
+        _, labels = redback.get_data.swift._read_qdp_blocks(self.filename, n_columns=6)
+        self.assertListEqual(["batSNR4flux", "batSNR4flux", "xrtwtflux"], list(labels))
+
+    def test_no_data(self):
+        with open(self.filename, "w") as f:
+            f.write("READ TERR 1 2\n")
+        data, labels = redback.get_data.swift._read_qdp_blocks(self.filename, n_columns=6)
+        self.assertEqual((0, 6), data.shape)
+        self.assertEqual(0, len(labels))
+
+
 class TestLasairDataGetter(unittest.TestCase):
 
     @classmethod
@@ -620,20 +729,498 @@ class TestLasairDataGetter(unittest.TestCase):
         redback.utils.logger.warning.assert_called_once()
 
     @mock.patch("os.path.isfile")
-    @mock.patch("requests.get")
-    def test_collect_data_no_lightcurve_available(self, get, isfile):
+    @mock.patch("redback.get_data.download.fetch")
+    def test_collect_data_no_lightcurve_available(self, fetch, isfile):
         isfile.return_value = False
-        get.return_value = MagicMock()
-        get.return_value.__setattr__('text', 'does not exist')
+        fetch.return_value = MagicMock()
+        fetch.return_value.__setattr__('text', 'does not exist')
         with self.assertRaises(ValueError):
             self.getter.collect_data()
 
     @mock.patch("os.path.isfile")
-    @mock.patch("requests.get")
-    @mock.patch("urllib.request.urlretrieve")
-    def test_collect_data(self, urlretrieve, get, isfile):
+    @mock.patch("redback.get_data.download.fetch")
+    @mock.patch("redback.get_data.download.write")
+    def test_collect_data(self, write, fetch, isfile):
         isfile.return_value = False
-        get.return_value = MagicMock()
-        get.return_value.__setattr__('text', '')
+        fetch.return_value = MagicMock()
+        fetch.return_value.__setattr__('text', '')
+        self.getter.collect_data()
+        fetch.assert_called_once_with(self.getter.url)
+        write.assert_called_once_with(response=fetch.return_value, filename=self.getter.raw_file_path)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures = dict()
+    client_ports = []
+
+    def do_GET(self):
+        self.client_ports.append(self.client_address[1])
+        if self.path.startswith("/flaky") and self.failures.get(self.path, 0) > 0:
+            self.failures[self.path] -= 1
+            self._respond(503, b"unavailable")
+        elif "missing" in self.path:
+            self._respond(200, b"Object does not exist")
+        elif self.path.startswith("/broken"):
+            self._respond(404, b"<html>Not Found</html>")
+        else:
+            candidates = [dict(candid=1, mjd=59000. + i, dc_mag=18. + i, dc_sigmag=0.1, fid=1) for i in range(3)]
+            self._respond(200, json.dumps(dict(candidates=candidates)).encode())
+
+    def _respond(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownload(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        _StandInHandler.failures.clear()
+        _StandInHandler.client_ports.clear()
+        self.session = redback.get_data.download.requests.Session()
+        self.directory_existed = os.path.isdir("unknown")
+
+    def tearDown(self) -> None:
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+        if not self.directory_existed:
+            shutil.rmtree("unknown", ignore_errors=True)
+
+    def test_fetch_reuses_connection(self):
+        for _ in range(3):
+            redback.get_data.download.fetch(f"{self.base_url}/object", session=self.session)
+        self.assertEqual(1, len(set(_StandInHandler.client_ports)))
+
+    def test_fetch_retries(self):
+        _StandInHandler.failures["/flaky"] = 2
+        response = redback.get_data.download.fetch(
+            f"{self.base_url}/flaky", session=self.session, retries=2, backoff_factor=0)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, len(_StandInHandler.client_ports))
+
+    def test_fetch_gives_up(self):
+        _StandInHandler.failures["/flaky"] = 5
+        with self.assertRaises(redback.get_data.download.requests.HTTPError):
+            redback.get_data.download.fetch(
+                f"{self.base_url}/flaky", session=self.session, retries=1, backoff_factor=0)
+        self.assertEqual(2, len(_StandInHandler.client_ports))
+
+    def test_fetch_gives_up_without_raising(self):
+        _StandInHandler.failures["/flaky"] = 5
+        response = redback.get_data.download.fetch(
+            f"{self.base_url}/flaky", session=self.session, retries=1, backoff_factor=0, raise_for_status=False)
+        self.assertEqual(503, response.status_code)
+
+    def test_failed_refresh_keeps_existing_files(self):
+        base_url = self.base_url
+        path = "object"
+        with mock.patch.object(redback.get_data.LasairDataGetter, "url",
+                               new=property(lambda getter: f"{base_url}/{path}/{getter.transient}/json/")):
+            getter = redback.get_data.LasairDataGetter(transient="ZTFkept", transient_type="unknown")
+            getter.get_data()
+            data = pd.read_csv(getter.processed_file_path)
+            path = "broken"
+            with self.assertRaises(redback.get_data.download.requests.HTTPError):
+                getter.get_data(refresh=True)
+        self.assertTrue(os.path.isfile(getter.raw_file_path))
+        self.assertTrue(data.equals(pd.read_csv(getter.processed_file_path)))
+        self.assertFalse(os.path.isfile(f"{getter.raw_file_path}.bak"))
+
+    def test_collect_data_error_status(self):
+        base_url = self.base_url
+        with mock.patch.object(redback.get_data.LasairDataGetter, "url",
+                               new=property(lambda getter: f"{base_url}/broken/{getter.transient}/json/")):
+            getter = redback.get_data.LasairDataGetter(transient="ZTFbroken", transient_type="unknown")
+            with self.assertRaises(redback.get_data.download.requests.HTTPError):
+                getter.collect_data()
+        self.assertFalse(os.path.isfile(getter.raw_file_path))
+
+    def test_write(self):
+        filename = "download_test_file.txt"
+        response = redback.get_data.download.fetch(f"{self.base_url}/object", session=self.session)
+        try:
+            redback.get_data.download.write(response=response, filename=filename)
+            with open(filename, "rb") as f:
+                self.assertEqual(response.content, f.read())
+        finally:
+            os.remove(filename)
+
+    def test_get_data_in_bulk(self):
+        base_url = self.base_url
+        with mock.patch.object(redback.get_data.LasairDataGetter, "url",
+                               new=property(lambda getter: f"{base_url}/object/{getter.transient}/json/")):
+            getters = [redback.get_data.LasairDataGetter(transient=f"ZTFtest{i}", transient_type="unknown")
+                       for i in range(4)]
+            getters.append(redback.get_data.LasairDataGetter(transient="ZTFmissing", transient_type="unknown"))
+            data = redback.get_data.download.get_data_in_bulk(getters, max_workers=2)
+        self.assertListEqual([f"ZTFtest{i}" for i in range(4)], list(data.keys()))
+        for processed_data in data.values():
+            self.assertTrue(np.array_equal(np.array([18., 19., 20.]), processed_data["magnitude"].values))
+        self.assertFalse(os.path.isfile(getters[-1].raw_file_path))
+
+
+class _BurstAnalyserHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    pending = dict()
+
+    def do_GET(self):
+        if self.path == "/burst_analyser/00123456/":
+            body = b'<a href="batxrtfiles/batxrt_XRTBAND_SNR4.qdp">data</a>' \
+                   b'<a href="xrtfiles/xrt_DENSITY.qdp">data</a>'
+        elif self.pending.get(self.path, 0) > 0:
+            self.pending[self.path] -= 1
+            body = b"Your product is being generated."
+        else:
+            body = b"READ TERR 1 2\n! BAT\n1.0\t0.1\t-0.1\t2e-9\t1e-10\t-1e-10\n"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSwiftBurstAnalyserDownload(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _BurstAnalyserHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        website = f"http://127.0.0.1:{self.server.server_address[1]}/burst_analyser/00123456/"
+        _BurstAnalyserHandler.pending.clear()
+        self.getter = redback.get_data.swift.SwiftDataGetter(
+            grb="050202", transient_type="afterglow", data_mode="flux", instrument="BAT+XRT", use_browser=False)
+        self.getter.POLL_INTERVAL = 0.01
+        self.website_patch = mock.patch.object(
+            redback.get_data.swift.SwiftDataGetter, "grb_website", new=PropertyMock(return_value=website))
+        self.website_patch.start()
+
+    def tearDown(self) -> None:
+        self.website_patch.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree("GRBData", ignore_errors=True)
+
+    def test_poll_for_product(self):
+        _BurstAnalyserHandler.pending["/product.qdp"] = 2
+        url = f"http://127.0.0.1:{self.server.server_address[1]}/product.qdp"
+        response = self.getter.poll_for_product(url)
+        self.assertIn("READ TERR", response.text)
+        self.assertEqual(0, _BurstAnalyserHandler.pending["/product.qdp"])
+
+    def test_poll_for_product_timeout(self):
+        _BurstAnalyserHandler.pending["/product.qdp"] = 100
+        self.getter.POLL_TIMEOUT = 0.05
+        url = f"http://127.0.0.1:{self.server.server_address[1]}/product.qdp"
+        with self.assertRaises(TimeoutError):
+            self.getter.poll_for_product(url)
+
+    def test_collect_integrated_flux_data(self):
+        _BurstAnalyserHandler.pending["/burst_analyser/00123456/batxrtfiles/batxrt_XRTBAND_SNR4.qdp"] = 1
+        self.getter.collect_data()
+        with open(self.getter.raw_file_path) as f:
+            self.assertIn("! BAT", f.read())
+
+    def test_collect_flux_density_data(self):
+        self.getter.data_mode = "flux_density"
+        self.getter.directory_path, self.getter.raw_file_path, self.getter.processed_file_path = \
+            self.getter.create_directory_structure()
         self.getter.collect_data()
-        urlretrieve.assert_called_with(url=self.getter.url, filename=self.getter.raw_file_path)
+        self.assertTrue(os.path.isfile(self.getter.raw_file_path))
+
+    def test_ambiguous_product_link(self):
+        page = '<a href="batxrtfiles/batxrt_XRTBAND_SNR4.qdp">data</a>' \
+               '<a href="batxrtfiles/batxrt_XRTBAND_SNR7.qdp">data</a>'
+        with self.assertRaises(ValueError):
+            self.getter.download_integrated_flux_data(page=page)
+        self.assertFalse(os.path.isfile(self.getter.raw_file_path))
+
+    @mock.patch("time.sleep")
+    @mock.patch("redback.get_data.swift.check_element")
+    @mock.patch("redback.get_data.swift.fetch_driver")
+    def test_collect_integrated_flux_data_with_browser(self, fetch_driver, check_element, sleep):
+        check_element.return_value = True
+        driver = fetch_driver.return_value
+        driver.current_url = f"http://127.0.0.1:{self.server.server_address[1]}/product.qdp"
+        self.getter.use_browser = True
+        self.getter.collect_data()
+        xpaths = [call.args[0] for call in driver.find_element_by_xpath.call_args_list]
+        self.assertListEqual(["//select[@name='batxrtbin']/option[text()='SNR 4']",
+                              "//select[@name='batxrtsub']/option[text()='no']",
+                              ".//*[@id='batxrtband1']", ".//*[@id='batxrtband0']",
+                              ".//*[@id='batxrt_XRTBAND_makeDownload']"], xpaths)
+        driver.quit.assert_called()
+        with open(self.getter.raw_file_path) as f:
+            self.assertIn("! BAT", f.read())
+
+    def test_selenium_not_imported(self):
+        output = subprocess.run(
+            [sys.executable, "-c", "import sys, redback; print('selenium' in sys.modules)"],
+            capture_output=True, text=True).stdout
+        self.assertEqual("False", output.strip())
+
+
+class _ValidatingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    content = dict()
+    statuses = []
+
+    def do_GET(self):
+        body = self.content.get(self.path, b"")
+        etag = f'"{hash(body)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.statuses.append(200)
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", "Wed, 21 Oct 2015 07:28:00 GMT")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHTTPCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _ValidatingHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        _ValidatingHandler.content.clear()
+        _ValidatingHandler.statuses.clear()
+        self.directory = "http_cache_test"
+        self.session = redback.get_data.download.requests.Session()
+
+    def tearDown(self) -> None:
+        redback.get_data.download.disable_cache()
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _fetch(self, path):
+        return redback.get_data.download.fetch(f"{self.base_url}{path}", session=self.session)
+
+    def test_fresh_response_served_from_disk(self):
+        redback.get_data.download.enable_cache(directory=self.directory, ttl=3600)
+        _ValidatingHandler.content["/a"] = b"1,2,3"
+        self._fetch("/a")
+        response = self._fetch("/a")
+        self.assertEqual("1,2,3", response.text)
+        self.assertListEqual([200], _ValidatingHandler.statuses)
+
+    def test_stale_response_revalidated(self):
+        redback.get_data.download.enable_cache(directory=self.directory, ttl=0)
+        _ValidatingHandler.content["/a"] = b"1,2,3"
+        self._fetch("/a")
+        response = self._fetch("/a")
+        self.assertEqual(b"1,2,3", response.content)
+        _ValidatingHandler.content["/a"] = b"1,2,3,4"
+        response = self._fetch("/a")
+        self.assertEqual(b"1,2,3,4", response.content)
+        self.assertListEqual([200, 304, 200], _ValidatingHandler.statuses)
+
+    def test_cache_persists_on_disk(self):
+        redback.get_data.download.enable_cache(directory=self.directory, ttl=3600)
+        _ValidatingHandler.content["/a"] = b"1,2,3"
+        self._fetch("/a")
+        redback.get_data.download.enable_cache(directory=self.directory, ttl=3600)
+        self.assertEqual(b"1,2,3", self._fetch("/a").content)
+        self.assertListEqual([200], _ValidatingHandler.statuses)
+
+    def test_identical_content_stored_once(self):
+        cache = redback.get_data.download.enable_cache(directory=self.directory)
+        _ValidatingHandler.content["/a"] = b"1,2,3"
+        _ValidatingHandler.content["/b"] = b"1,2,3"
+        self._fetch("/a")
+        self._fetch("/b")
+        self.assertEqual(1, len(os.listdir(os.path.join(self.directory, "objects"))))
+        self.assertEqual(5, cache.size)
+
+    def test_least_recently_used_evicted(self):
+        cache = redback.get_data.download.enable_cache(directory=self.directory, ttl=3600, max_size=10)
+        _ValidatingHandler.content["/a"] = b"aaaa"
+        _ValidatingHandler.content["/b"] = b"bbbb"
+        _ValidatingHandler.content["/c"] = b"cccc"
+        self._fetch("/a")
+        self._fetch("/b")
+        self._fetch("/a")
+        self._fetch("/c")
+        self.assertEqual(8, cache.size)
+        self._fetch("/a")
+        self._fetch("/b")
+        self.assertListEqual([200, 200, 200, 200], _ValidatingHandler.statuses)
+
+    def test_refresh_only_downloads_changes(self):
+        redback.get_data.download.enable_cache(directory=self.directory, ttl=0)
+        _ValidatingHandler.content["/object/ZTFtest/json/"] = json.dumps(dict(candidates=[
+            dict(candid=1, mjd=59000., dc_mag=18., dc_sigmag=0.1, fid=1)])).encode()
+        base_url = self.base_url
+        directory_existed = os.path.isdir("unknown")
+        try:
+            with mock.patch.object(redback.get_data.LasairDataGetter, "url",
+                                   new=property(lambda getter: f"{base_url}/object/{getter.transient}/json/")):
+                getter = redback.get_data.LasairDataGetter(transient="ZTFtest", transient_type="unknown")
+                getter.get_data()
+                data = getter.get_data(refresh=True)
+        finally:
+            if not directory_existed:
+                shutil.rmtree("unknown", ignore_errors=True)
+        self.assertListEqual([200, 304], _ValidatingHandler.statuses)
+        self.assertEqual(18., data["magnitude"].values[0])
+
+    def test_refresh_revalidates_fresh_responses(self):
+        redback.get_data.download.enable_cache(directory=self.directory, ttl=3600)
+        _ValidatingHandler.content["/object/ZTFtest/json/"] = json.dumps(dict(candidates=[
+            dict(candid=1, mjd=59000., dc_mag=18., dc_sigmag=0.1, fid=1)])).encode()
+        base_url = self.base_url
+        directory_existed = os.path.isdir("unknown")
+        try:
+            with mock.patch.object(redback.get_data.LasairDataGetter, "url",
+                                   new=property(lambda getter: f"{base_url}/object/{getter.transient}/json/")):
+                getter = redback.get_data.LasairDataGetter(transient="ZTFtest", transient_type="unknown")
+                getter.get_data()
+                getter.get_data(refresh=True)
+                self.assertListEqual([200, 304], _ValidatingHandler.statuses)
+                getter.get_data()
+                self.assertFalse(redback.get_data.download.revalidating())
+        finally:
+            if not directory_existed:
+                shutil.rmtree("unknown", ignore_errors=True)
+        self.assertListEqual([200, 304], _ValidatingHandler.statuses)
+
+
+class _LasairStandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    candidates = dict()
+
+    def do_GET(self):
+        transient = self.path.split("/")[2]
+        if transient not in self.candidates:
+            body = b"Object does not exist"
+        else:
+            body = json.dumps(dict(objectId=transient, candidates=self.candidates[transient])).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _lasair_candidates(start, stop):
+    return [dict(candid=i, mjd=59000. + i, dc_mag=18. + 0.1 * i, dc_sigmag=0.1, fid=1 + i % 2)
+            for i in range(start, stop)]
+
+
+class TestLasairAlertStream(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _LasairStandInHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        _LasairStandInHandler.candidates.clear()
+        _LasairStandInHandler.candidates["ZTFstream"] = _lasair_candidates(0, 3) + [dict(mjd=58999., fid=1)]
+        self.directory_existed = os.path.isdir("unknown")
+        self.emitted = []
+        self.stream = self._create_stream()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if not self.directory_existed:
+            shutil.rmtree("unknown", ignore_errors=True)
+        else:
+            for filename in ["unknown/ZTFstream.csv", "unknown/ZTFstream_rawdata.json"]:
+                if os.path.isfile(filename):
+                    os.remove(filename)
+
+    def _create_stream(self):
+        return redback.get_data.LasairAlertStream(
+            transients=["ZTFstream"], callback=self.emitted.append, poll_interval=0, base_url=self.base_url)
+
+    def test_first_poll_emits_transient(self):
+        updated = asyncio.run(self.stream.poll())
+        self.assertListEqual(["ZTFstream"], list(updated.keys()))
+        self.assertEqual(1, len(self.emitted))
+        self.assertIsInstance(self.emitted[0], redback.transient.transient.OpticalTransient)
+        self.assertTrue(np.array_equal(np.array([0., 1., 2.]), self.emitted[0].x))
+        self.assertTrue(os.path.isfile(self.stream.getters["ZTFstream"].processed_file_path))
+
+    def test_no_new_candidates(self):
+        asyncio.run(self.stream.poll())
+        updated = asyncio.run(self.stream.poll())
+        self.assertDictEqual(dict(), updated)
+        self.assertEqual(1, len(self.emitted))
+
+    def test_only_new_candidates_are_appended(self):
+        asyncio.run(self.stream.poll())
+        _LasairStandInHandler.candidates["ZTFstream"] += _lasair_candidates(3, 5)
+        new_data = self.stream.update("ZTFstream", dict(candidates=_LasairStandInHandler.candidates["ZTFstream"]))
+        self.assertTrue(np.array_equal(np.array([59003., 59004.]), new_data["time"].values))
+        processed_data = pd.read_csv(self.stream.getters["ZTFstream"].processed_file_path)
+        self.assertTrue(np.array_equal(np.arange(5.), processed_data["time (days)"].values))
+        with open(self.stream.getters["ZTFstream"].raw_file_path) as f:
+            self.assertEqual(5, len(json.load(f)["candidates"]))
+
+    def test_processed_data_matches_data_getter(self):
+        _LasairStandInHandler.candidates["ZTFstream"] += _lasair_candidates(3, 5)
+        asyncio.run(self.stream.poll())
+        expected = redback.get_data.lasair.process_candidates(_LasairStandInHandler.candidates["ZTFstream"])
+        processed_data = pd.read_csv(self.stream.getters["ZTFstream"].processed_file_path)
+        self.assertTrue(np.allclose(expected["flux_density(mjy)"].values, processed_data["flux_density(mjy)"].values))
+        self.assertListEqual(list(expected["band"]), list(processed_data["band"]))
+
+    def test_restart_picks_up_stored_data(self):
+        asyncio.run(self.stream.poll())
+        stream = self._create_stream()
+        self.assertDictEqual(dict(), asyncio.run(stream.poll()))
+        _LasairStandInHandler.candidates["ZTFstream"] += _lasair_candidates(3, 4)
+        updated = asyncio.run(stream.poll())
+        self.assertEqual(4, len(updated["ZTFstream"].x))
+
+    def test_missing_object_is_skipped(self):
+        self.stream.add("ZTFmissing")
+        updated = asyncio.run(self.stream.poll())
+        self.assertListEqual(["ZTFstream"], list(updated.keys()))
+
+    def test_coroutine_callback(self):
+        emitted = []
+
+        async def callback(transient):
+            emitted.append(transient.name)
+
+        self.stream.callback = callback
+        asyncio.run(self.stream.poll())
+        self.assertListEqual(["ZTFstream"], emitted)
+
+    def test_run(self):
+        asyncio.run(self.stream.run(n_polls=3))
+        self.assertEqual(1, len(self.emitted))
+
+    def test_stop(self):
+        self.stream.poll_interval = 60
+        self.stream.callback = lambda transient: self.stream.stop()
+        asyncio.run(asyncio.wait_for(self.stream.run(), timeout=10))
+        self.assertTrue(self.stream._stop_event.is_set())
@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.special import log_ndtr
 import unittest
 from unittest import mock
 
@@ -195,25 +196,114 @@ class GaussianLikelihoodQuadratureNoiseNonDetectionsTest(unittest.TestCase):
         expected = -3 * np.log(2 * np.pi * np.sqrt(2) ** 2) / 2
         self.assertEqual(expected, self.likelihood.log_likelihood_y())
 
-    def test_log_likelihood_upper_limit_exceed(self):
-        self.assertEqual(np.nan_to_num(-np.inf), self.likelihood.log_likelihood_upper_limit())
-
     def test_log_likelihood_upper_limit(self):
+        expected = np.sum(log_ndtr(self.upperlimit_kwargs['flux'] - self.x))
+        self.assertAlmostEqual(expected, self.likelihood.log_likelihood_upper_limit())
+
+    def test_log_likelihood_upper_limit_new_flux(self):
         new_upper_limit = 5
         self.likelihood.upperlimit_kwargs['flux'] = new_upper_limit
-        expected = -3*np.log(new_upper_limit)
-        self.assertEqual(expected, self.likelihood.log_likelihood_upper_limit())
-
-    def test_log_likelihood_exceed(self):
-        self.assertEqual(np.nan_to_num(-np.inf), self.likelihood.log_likelihood())
+        expected = np.sum(log_ndtr(new_upper_limit - self.x))
+        self.assertAlmostEqual(expected, self.likelihood.log_likelihood_upper_limit())
 
     def test_log_likelihood(self):
         new_upper_limit = 5
         self.likelihood.upperlimit_kwargs['flux'] = new_upper_limit
         expected_y = -3 * np.log(2 * np.pi * np.sqrt(2) ** 2) / 2
-        expected_upper_limit = -3*np.log(new_upper_limit)
+        expected_upper_limit = np.sum(log_ndtr(new_upper_limit - self.x))
         expected = expected_y + expected_upper_limit
-        self.assertEqual(expected, self.likelihood.log_likelihood())
+        self.assertAlmostEqual(expected, self.likelihood.log_likelihood())
+
+    def test_log_likelihood_single_model_call(self):
+        calls = []
+
+        def func(x, param_1, param_2, **kwargs):
+            calls.append(kwargs['frequency'])
+            return np.ones(len(x))
+
+        likelihood = likelihoods.GaussianLikelihoodQuadratureNoiseNonDetections(
+            x=self.x, y=self.y, sigma_i=self.sigma_i, function=func, kwargs=dict(frequency=1),
+            upperlimit_kwargs=dict(flux=np.array([2, 3]), frequency=np.array([2, 3])),
+            upperlimit_x=np.array([3, 4]))
+        likelihood.parameters.update(dict(param_1=0, param_2=0, sigma=1))
+        likelihood.log_likelihood()
+        self.assertEqual(1, len(calls))
+        self.assertTrue(np.array_equal(np.array([1, 1, 1, 2, 3]), calls[0]))
+
+    def test_log_likelihood_matches_separate_calls(self):
+        likelihood = likelihoods.GaussianLikelihoodQuadratureNoiseNonDetections(
+            x=self.x, y=self.y, sigma_i=self.sigma_i, function=self.function,
+            kwargs=dict(output_format='flux_density'), upperlimit_kwargs=dict(flux=5, output_format='magnitude'))
+        likelihood.parameters.update(dict(param_1=0, param_2=0, sigma=1))
+        expected = likelihood.log_likelihood_y() + likelihood.log_likelihood_upper_limit()
+        self.assertAlmostEqual(expected, likelihood.log_likelihood())
+
+    def test_default_upperlimit_kwargs(self):
+        likelihood = likelihoods.GaussianLikelihoodQuadratureNoiseNonDetections(
+            x=self.x, y=self.y, sigma_i=self.sigma_i, function=self.function)
+        self.assertDictEqual(dict(), likelihood.upperlimit_kwargs)
+
+    def test_log_likelihood_after_reassigning_x(self):
+        likelihood = likelihoods.GaussianLikelihoodQuadratureNoiseNonDetections(
+            x=self.x, y=self.y, sigma_i=self.sigma_i, function=self.function,
+            kwargs=dict(frequency=np.array([1, 2, 3])), upperlimit_kwargs=dict(flux=5))
+        likelihood.parameters.update(dict(param_1=0, param_2=0, sigma=1))
+        likelihood.x = np.array([1, 2, 3])
+        expected = likelihood.log_likelihood_y() + likelihood.log_likelihood_upper_limit()
+        self.assertAlmostEqual(expected, likelihood.log_likelihood())
+
+    def test_non_per_point_array_kwargs_are_not_concatenated(self):
+        calls = []
+
+        def func(x, param_1, param_2, **kwargs):
+            calls.append(kwargs['frequency_bounds'])
+            return np.ones(len(x))
+
+        likelihood = likelihoods.GaussianLikelihoodQuadratureNoiseNonDetections(
+            x=self.x, y=self.y, sigma_i=self.sigma_i, function=func, kwargs=dict(frequency_bounds=np.array([1, 2])),
+            upperlimit_kwargs=dict(flux=5, frequency_bounds=np.array([3, 4])))
+        likelihood.parameters.update(dict(param_1=0, param_2=0, sigma=1))
+        likelihood.log_likelihood()
+        self.assertEqual(2, len(calls))
+        self.assertTrue(np.array_equal(np.array([1, 2]), calls[0]))
+        self.assertTrue(np.array_equal(np.array([3, 4]), calls[1]))
+
+    def test_combined_call_is_sorted(self):
+        calls = []
+
+        def func(x, param_1, param_2, **kwargs):
+            calls.append(x)
+            if np.any(np.diff(x) < 0):
+                raise ValueError("x must be sorted")
+            return x * kwargs['frequency']
+
+        likelihood = likelihoods.GaussianLikelihoodQuadratureNoiseNonDetections(
+            x=np.array([1., 3., 5.]), y=self.y, sigma_i=self.sigma_i, function=func,
+            kwargs=dict(frequency=np.array([1., 2., 3.])),
+            upperlimit_kwargs=dict(flux=np.array([2., 3.]), frequency=np.array([4., 5.])),
+            upperlimit_x=np.array([4., 0.]))
+        likelihood.parameters.update(dict(param_1=0, param_2=0, sigma=1))
+        model, upperlimit_model = likelihood._evaluate_model()
+        self.assertEqual(1, len(calls))
+        self.assertTrue(np.array_equal(np.array([0., 1., 3., 4., 5.]), calls[0]))
+        self.assertTrue(np.array_equal(np.array([1., 6., 15.]), model))
+        self.assertTrue(np.array_equal(np.array([16., 0.]), upperlimit_model))
+
+    def test_model_with_fewer_outputs_falls_back_to_separate_calls(self):
+        calls = []
+
+        def func(x, param_1, param_2, **kwargs):
+            calls.append(x)
+            return np.unique(x)
+
+        likelihood = likelihoods.GaussianLikelihoodQuadratureNoiseNonDetections(
+            x=self.x, y=self.y, sigma_i=self.sigma_i, function=func, upperlimit_kwargs=dict(flux=5),
+            upperlimit_x=np.array([2, 3]))
+        likelihood.parameters.update(dict(param_1=0, param_2=0, sigma=1))
+        model, upperlimit_model = likelihood._evaluate_model()
+        self.assertEqual(3, len(calls))
+        self.assertTrue(np.array_equal(self.x, model))
+        self.assertTrue(np.array_equal(np.array([2, 3]), upperlimit_model))
 
 
 class GRBGaussianLikelihoodTest(unittest.TestCase):
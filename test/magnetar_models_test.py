@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+import scipy.special as ss
+from scipy.integrate import quad
+
+from redback.transient_models import magnetar_models
+
+
+class TestRadiativeLossesHyp2f1(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.x = np.geomspace(1e-4, 1e4, 3000)
+
+    def tearDown(self) -> None:
+        del self.x
+
+    def test_interpolation_accuracy(self):
+        for kappa in [1e-2, 0.3, 1., 2., 9.5]:
+            for alpha in [1., 2., 4.5, 21.]:
+                exact = ss.hyp2f1(1 + kappa, alpha, 2 + kappa, -self.x)
+                fast = magnetar_models._radiative_losses_hyp2f1(kappa, alpha, self.x)
+                np.testing.assert_allclose(fast, exact, rtol=1e-5)
+
+    def test_exact_outside_range(self):
+        exact = ss.hyp2f1(1 + 20., 2., 2 + 20., -self.x)
+        fast = magnetar_models._radiative_losses_hyp2f1(20., 2., self.x)
+        np.testing.assert_array_equal(fast, exact)
+
+    def test_exact_for_short_arrays(self):
+        x = self.x[::300]
+        exact = ss.hyp2f1(1 + 0.5, 3., 2 + 0.5, -x)
+        fast = magnetar_models._radiative_losses_hyp2f1(0.5, 3., x)
+        np.testing.assert_array_equal(fast, exact)
+
+
+class TestRadiativeLossesIntegrals(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.time = np.geomspace(20, 1e6, 1000)
+        self.t0 = 20.
+        self.tau = 1e3
+
+    def tearDown(self) -> None:
+        del self.time
+        del self.t0
+        del self.tau
+
+    def _quad(self, time, kappa, alpha):
+        integrand = lambda t: (t / self.t0) ** kappa * (1 + t / self.tau) ** (-alpha)
+        return self.t0 ** kappa * quad(integrand, self.t0, time, limit=200, epsabs=0, epsrel=1e-10)[0]
+
+    def test_integral_general(self):
+        nn = 4.
+        for kappa in [0.1, 1.5, 5.]:
+            integ = magnetar_models._integral_general(self.time, self.t0, kappa, self.tau, nn)
+            for i in [100, 500, 999]:
+                expected = self._quad(self.time[i], kappa, (1 + nn) / (nn - 1))
+                self.assertAlmostEqual(integ[i] / expected, 1, places=4)
+
+    def test_integral_mdr(self):
+        for kappa in [0.1, 1.5, 5.]:
+            integ = magnetar_models._integral_mdr(self.time, self.t0, kappa, 1. / self.tau)
+            for i in [100, 500, 999]:
+                self.assertAlmostEqual(integ[i] / self._quad(self.time[i], kappa, 2.), 1, places=4)
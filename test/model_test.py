@@ -35,3 +35,154 @@ class TestModels(unittest.TestCase):
             function = redback.model_library.all_models_dict[f.replace(".prior", "")]
             ys = function(times, **prior.sample(), **kwargs)
             self.assertEqual(len(times), len(ys))
+
+
+class TestExtinctionCurve(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.frequency = np.array([3e14, 4.5e14, 6e14, 8e14])
+        self.angstroms = redback.utils.nu_to_lambda(self.frequency)
+        self.flux_density = np.ones(len(self.frequency))
+
+    def tearDown(self) -> None:
+        del self.frequency
+        del self.angstroms
+        del self.flux_density
+
+    def test_matches_extinction_package(self):
+        import extinction
+        for law in ['fitzpatrick99', 'ccm89', 'odonnell94', 'calzetti00']:
+            for r_v in [3.1, 2.73, 7.0]:
+                expected = extinction.apply(getattr(extinction, law)(self.angstroms, 0.5, r_v), self.flux_density)
+                flux_density = redback.transient_models.extinction_models._perform_extinction(
+                    flux_density=self.flux_density, frequency=self.frequency, av=0.5, r_v=r_v, law=law)
+                self.assertTrue(np.allclose(expected, flux_density, rtol=1e-5))
+
+    def test_curve_shape_of_scalar_frequency(self):
+        curve = redback.transient_models.extinction_models.get_extinction_curve(frequency=4.5e14)
+        self.assertEqual(np.shape(curve), ())
+
+    def test_unknown_law(self):
+        with self.assertRaises(ValueError):
+            redback.transient_models.extinction_models.get_extinction_curve(frequency=self.frequency, law='unknown')
+
+
+class TestBaseModelResolution(unittest.TestCase):
+
+    def test_extinction_base_model_is_resolved(self):
+        function = redback.transient_models.extinction_models._get_correct_function(
+            base_model='arnett', model_type='supernova')
+        self.assertEqual(redback.transient_models.supernova_models.arnett, function)
+
+    def test_extinction_invalid_base_model(self):
+        with self.assertRaises(ValueError):
+            redback.transient_models.extinction_models._get_correct_function(
+                base_model='arnett', model_type='afterglow')
+
+    def test_t0_base_model(self):
+        def base_model(time, **kwargs):
+            return time
+        times = redback.transient_models.phase_models.t0_base_model(
+            np.array([55001., 55003.]), t0=55000., base_model=base_model)
+        self.assertTrue(np.allclose(np.array([1., 3.]), times))
+
+
+class TestIntegratedFluxQuadrature(unittest.TestCase):
+
+    def setUp(self) -> None:
+        def power_law(time, **kwargs):
+            return time * kwargs['frequency'] ** -0.7
+        self.base_model = power_law
+        self.time = np.array([1., 2., 5.])
+        self.frequency = [2.4e17, 2.4e18]
+
+    def tearDown(self) -> None:
+        del self.base_model
+        del self.time
+        del self.frequency
+
+    def test_gauss_legendre_power_law(self):
+        lower, upper = self.frequency
+        expected = 1e-26 * self.time * (upper ** 0.3 - lower ** 0.3) / 0.3
+        integrated_flux = redback.transient_models.integrated_flux_afterglow_models.integrated_flux_afterglowpy_base_model(
+            self.time, base_model=self.base_model, frequency=self.frequency, integration_method='gauss_legendre')
+        self.assertTrue(np.allclose(expected, integrated_flux, rtol=1e-6))
+
+    def test_gauss_legendre_tolerance(self):
+        def broken_power_law(time, **kwargs):
+            frequency = kwargs['frequency']
+            nu_break = kwargs['nu_break']
+            return time * np.where(frequency < nu_break, (frequency / nu_break) ** -0.5,
+                                   (frequency / nu_break) ** -1.5)
+        lower, upper = self.frequency
+        tolerance = 1e-3
+        # the first spectrum is a power law in the band, the node count of that call must not be reused for the break
+        for nu_break in [1e19, 1e18]:
+            low, high = min(lower, nu_break), min(upper, nu_break)
+            expected = 1e-26 * self.time * nu_break * ((high / nu_break) ** 0.5 - (low / nu_break) ** 0.5) / 0.5
+            expected += 1e-26 * self.time * nu_break * ((max(lower, nu_break) / nu_break) ** -0.5 -
+                                                        (max(upper, nu_break) / nu_break) ** -0.5) / 0.5
+            integrated_flux = redback.transient_models.integrated_flux_afterglow_models.integrated_flux_afterglowpy_base_model(
+                self.time, base_model=broken_power_law, frequency=self.frequency, integration_method='gauss_legendre',
+                tolerance=tolerance, nu_break=nu_break)
+            self.assertTrue(np.allclose(expected, integrated_flux, rtol=tolerance, atol=0))
+
+    def test_gauss_legendre_tophat(self):
+        bilby.core.utils.random.seed(0)
+        priors = redback.priors.get_priors('tophat')
+        time = np.geomspace(0.01, 30, 20)
+        kwargs = dict(base_model='tophat', frequency=[7.25e16, 2.42e18], integration_method='gauss_legendre',
+                      output_format='flux_density')
+        for parameters in [priors.sample() for _ in range(10)]:
+            reference = redback.transient_models.integrated_flux_afterglow_models.integrated_flux_afterglowpy_base_model(
+                time, n_nodes=256, **kwargs, **parameters)
+            integrated_flux = redback.transient_models.integrated_flux_afterglow_models.integrated_flux_afterglowpy_base_model(
+                time, **kwargs, **parameters)
+            self.assertTrue(np.allclose(reference, integrated_flux, rtol=0.04, atol=0))
+            integrated_flux = redback.transient_models.integrated_flux_afterglow_models.integrated_flux_afterglowpy_base_model(
+                time, tolerance=1e-3, **kwargs, **parameters)
+            self.assertTrue(np.allclose(reference, integrated_flux, rtol=1e-3, atol=0))
+
+    def test_invalid_integration_method(self):
+        with self.assertRaises(ValueError):
+            redback.transient_models.integrated_flux_afterglow_models.integrated_flux_afterglowpy_base_model(
+                self.time, base_model=self.base_model, frequency=self.frequency, integration_method='trapezoid')
+
+
+class TestUniqueEpochEvaluation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.parameters = dict(redshift=0.05, f_nickel=0.1, mej=2, kappa=0.1, kappa_gamma=10, vej=8000,
+                               temperature_floor=3000, output_format='flux_density')
+        self.epochs = np.linspace(1, 60, 20)
+        self.frequencies = np.array([6.3e14, 4.8e14, 3.9e14])
+
+    def tearDown(self) -> None:
+        del self.parameters
+        del self.epochs
+        del self.frequencies
+
+    def test_multiband_matches_single_band(self):
+        function = redback.model_library.all_models_dict['arnett']
+        time = np.repeat(self.epochs, len(self.frequencies))
+        frequency = np.tile(self.frequencies, len(self.epochs))
+        flux_density = function(time, frequency=frequency, **self.parameters)
+        for i, nu in enumerate(self.frequencies):
+            expected = function(self.epochs, frequency=nu, **self.parameters)
+            self.assertTrue(np.allclose(expected, flux_density[i::len(self.frequencies)]))
+
+    def test_unsorted_repeated_times_match_per_point_evaluation(self):
+        rng = np.random.default_rng(1)
+        time = rng.choice(self.epochs, size=45)
+        frequency = rng.choice(self.frequencies, size=45)
+        models = dict(arnett=self.parameters,
+                      tde_analytical=dict(redshift=0.05, l0=1e45, t_0=30, mej=1, kappa=0.1, kappa_gamma=10,
+                                          vej=10000, temperature_floor=10000, output_format='flux_density'))
+        for model, parameters in models.items():
+            function = redback.model_library.all_models_dict[model]
+            flux_density = function(time, frequency=frequency, **parameters)
+            # the diffusion integral depends on the earliest epoch, so evaluate on the same set of epochs
+            epochs = np.unique(time)
+            for tt, nu, flux in zip(time, frequency, flux_density):
+                expected = function(epochs, frequency=nu, **parameters)[epochs == tt]
+                self.assertTrue(np.allclose(expected, flux))
@@ -0,0 +1,140 @@
+import shutil
+import unittest
+from unittest import mock
+
+import bilby
+import numpy as np
+
+import redback
+from redback import profiling
+
+
+def _line(time, a, **kwargs):
+    return a * time
+
+
+class TestProfile(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.time = np.linspace(1, 10, 10)
+        self.likelihood = redback.likelihoods.GaussianLikelihood(
+            x=self.time, y=2 * self.time, sigma=np.ones(10), function=_line)
+        self.likelihood.parameters['a'] = 2.
+
+    def tearDown(self) -> None:
+        pass
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(profiling.get_profiler())
+        self.assertIs(_line, self.likelihood.function)
+
+    def test_call_counts(self):
+        with profiling.profile() as profiler:
+            for _ in range(5):
+                self.likelihood.log_likelihood()
+        summary = profiler.summary()
+        self.assertEqual(5, summary['components']['likelihood']['calls'])
+        self.assertEqual(5, summary['components']['model:_line']['calls'])
+        self.assertEqual(5, summary['components']['likelihood_arithmetic']['calls'])
+        self.assertIsNone(profiling.get_profiler())
+
+    def test_nested_log_likelihood_calls_are_counted_once(self):
+        likelihood = redback.likelihoods.GaussianLikelihoodUniformXErrors(
+            x=self.time, y=2 * self.time, sigma=np.ones(10), bin_size=1., function=_line)
+        likelihood.parameters['a'] = 2.
+        with profiling.profile() as profiler:
+            likelihood.log_likelihood()
+        self.assertEqual(1, profiler.summary()['components']['likelihood']['calls'])
+
+    def test_log_likelihood_unchanged(self):
+        expected = self.likelihood.log_likelihood()
+        with profiling.profile():
+            self.assertEqual(expected, self.likelihood.log_likelihood())
+
+    def test_time_split(self):
+        with profiling.profile() as profiler:
+            self.likelihood.log_likelihood()
+        components = profiler.summary()['components']
+        self.assertAlmostEqual(components['likelihood']['total_time'],
+                               components['model:_line']['total_time']
+                               + components['likelihood_arithmetic']['total_time'])
+        self.assertLessEqual(components['likelihood']['p50'], components['likelihood']['p99'])
+
+    def test_track_allocations(self):
+        with profiling.profile(track_allocations=True) as profiler:
+            self.likelihood.log_likelihood()
+        self.assertGreater(profiler.summary()['components']['model:_line']['allocated'], 0)
+
+    def test_logs_evaluation_rate(self):
+        with mock.patch('redback.profiling.logger') as logger:
+            with profiling.profile(log_interval=0):
+                self.likelihood.log_likelihood()
+        logger.info.assert_called_once()
+
+    def test_runs_are_recorded_separately(self):
+        with profiling.profile() as profiler:
+            self.likelihood.log_likelihood()
+            with profiling.profile_run() as run:
+                for _ in range(3):
+                    self.likelihood.log_likelihood()
+            self.likelihood.log_likelihood()
+        self.assertEqual(3, run.summary()['components']['likelihood']['calls'])
+        self.assertEqual(3, run.summary()['components']['model:_line']['calls'])
+        self.assertEqual(5, profiler.summary()['components']['likelihood']['calls'])
+        self.assertListEqual([], profiler._runs)
+
+    def test_run_without_profiling(self):
+        with profiling.profile_run() as run:
+            self.likelihood.log_likelihood()
+        self.assertIsNone(run)
+
+    def test_reservoir_is_bounded(self):
+        statistics = profiling._ComponentStatistics(max_samples=10)
+        for elapsed in range(100):
+            statistics.record(float(elapsed))
+        self.assertEqual(10, len(statistics._latencies))
+        self.assertEqual(100, statistics.summary()['calls'])
+
+
+class TestProfileFitModel(unittest.TestCase):
+
+    def setUp(self) -> None:
+        time = np.linspace(1, 10, 10)
+        self.transient = redback.transient.SGRB(name='GRB050813', data_mode='flux', time=time, flux=2 * time,
+                                                flux_err=np.ones(10))
+        self.outdir = 'profiling_test'
+        self.n_calls = []
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.outdir, ignore_errors=True)
+
+    def _run_sampler(self, likelihood, **kwargs):
+        likelihood.parameters['a'] = 2.
+        for _ in range(self.n_calls.pop(0)):
+            likelihood.log_likelihood()
+        result = mock.MagicMock()
+        result.meta_data = dict()
+        return result
+
+    def _fit(self):
+        return redback.fit_model(transient=self.transient, model=_line, outdir=self.outdir, clean=True,
+                                 prior=dict(a=bilby.core.prior.Uniform(0, 4, 'a')))
+
+    def test_profile_of_each_fit(self):
+        self.n_calls = [5, 3]
+        with mock.patch('bilby.run_sampler', side_effect=self._run_sampler):
+            with profiling.profile() as profiler:
+                first = self._fit()
+                second = self._fit()
+        self.assertEqual(5, first.meta_data['profile']['components']['likelihood']['calls'])
+        self.assertEqual(3, second.meta_data['profile']['components']['likelihood']['calls'])
+        self.assertEqual(8, profiler.summary()['components']['likelihood']['calls'])
+        second.save_to_file.assert_called_once()
+
+    def test_no_save_without_sampling(self):
+        self.n_calls = [0]
+        with mock.patch('bilby.run_sampler', side_effect=self._run_sampler):
+            with profiling.profile():
+                result = self._fit()
+        self.assertNotIn('profile', result.meta_data)
+        result.save_to_file.assert_not_called()
@@ -1,5 +1,13 @@
+import os
+import shutil
 import unittest
+from unittest import mock
 
+import bilby
+import numpy as np
+import pandas as pd
+
+import redback
 from redback import result
 
 
@@ -49,3 +57,124 @@ class TestCalculateBF(unittest.TestCase):
 
     def tearDown(self) -> None:
         pass
+
+
+class TestCompactMetaData(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.outdir = 'compact_meta_data_test'
+        self.time = np.logspace(2, 5, 20)
+        self.transient = redback.transient.SGRB(
+            name='GRB050813', data_mode='flux', time=self.time, time_err=np.ones((2, 20)),
+            flux=self.time ** -1, flux_err=np.ones((2, 20)))
+        self.model = redback.model_library.all_models_dict['tophat']
+        self.priors = dict(a=bilby.core.prior.Uniform(0, 1, 'a'))
+        self.posterior = pd.DataFrame(dict(a=np.random.random(10)))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.outdir, ignore_errors=True)
+
+    def _save_and_read(self, meta_data):
+        res = result.RedbackResult(label='test', outdir=self.outdir, meta_data=meta_data, priors=self.priors,
+                                   posterior=self.posterior, search_parameter_keys=['a'])
+        res.save_to_file(extension='json', overwrite=True)
+        return result.read_in_result(filename=f'{self.outdir}/test_result.json')
+
+    def test_catalogue_not_stored(self):
+        meta_data = result.build_meta_data(transient=self.transient, model=self.model)
+        self.assertNotIn('meta_data', meta_data['transient_kwargs'])
+        self.assertNotIn('meta_data', meta_data)
+        self.assertEqual('sgrb', meta_data['transient_type'])
+
+    def test_inline_round_trip(self):
+        meta_data = result.build_meta_data(transient=self.transient, model=self.model)
+        transient = self._save_and_read(meta_data).transient
+        self.assertTrue(np.array_equal(self.time, transient.x))
+        self.assertEqual(self.transient.redshift, transient.redshift)
+
+    def test_sidecar_round_trip(self):
+        os.makedirs(self.outdir, exist_ok=True)
+        meta_data = result.build_meta_data(transient=self.transient, model=self.model,
+                                           data_file=f'{self.outdir}/test_transient_data.npz')
+        self.assertEqual('test_transient_data.npz', meta_data['transient_data'])
+        res = self._save_and_read(meta_data)
+        self.assertTrue(np.array_equal(self.transient.y_err, res.transient.y_err))
+        self.assertIs(res.transient, res.transient)
+
+
+def _line(time, a, **kwargs):
+    return a * time
+
+
+class TestUpdateWithData(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(42)
+        self.time = np.arange(1., 13.)
+        self.flux = 2 * self.time + rng.normal(0, 1, len(self.time))
+        self.old_transient = self._create_transient(self.time[:10], self.flux[:10])
+        self.new_transient = self._create_transient(self.time, self.flux)
+        old_mean, old_std = self._analytic_posterior(self.time[:10], self.flux[:10])
+        a = rng.normal(old_mean, old_std, 5000)
+        likelihood = redback.sampler._get_likelihood(transient=self.old_transient, model=_line)
+        log_likelihood = np.zeros(len(a))
+        for i, sample in enumerate(a):
+            likelihood.parameters['a'] = sample
+            log_likelihood[i] = likelihood.log_likelihood()
+        self.result = result.RedbackResult(
+            label='test', outdir='update_with_data_test', priors=dict(a=bilby.core.prior.Uniform(0, 4, 'a')),
+            posterior=pd.DataFrame(dict(a=a, log_likelihood=log_likelihood)), search_parameter_keys=['a'],
+            meta_data=result.build_meta_data(transient=self.old_transient, model=_line), log_evidence=0.)
+
+    @staticmethod
+    def _create_transient(time, flux):
+        return redback.transient.SGRB(name='GRB050813', data_mode='flux', time=time, flux=flux,
+                                      flux_err=np.ones(len(time)))
+
+    @staticmethod
+    def _analytic_posterior(time, flux):
+        return np.sum(time * flux) / np.sum(time ** 2), 1 / np.sqrt(np.sum(time ** 2))
+
+    def test_reweighted_posterior(self):
+        updated = self.result.update_with_data(self.new_transient, model=_line)
+        new_mean, new_std = self._analytic_posterior(self.time, self.flux)
+        self.assertAlmostEqual(new_mean, np.mean(updated.posterior['a']), delta=new_std / 5)
+        self.assertAlmostEqual(new_std, np.std(updated.posterior['a']), delta=new_std / 5)
+        self.assertGreater(updated.meta_data['effective_sample_size'], 500)
+        self.assertIs(self.new_transient, updated.transient)
+        self.assertEqual(12, len(updated.meta_data['transient_data']['time']))
+
+    def test_only_search_and_fixed_parameters_reach_the_model(self):
+        parameters = []
+
+        def line_with_offset(time, a, offset, **kwargs):
+            parameters.append(set(kwargs))
+            return a * time + offset
+
+        self.result.priors['offset'] = bilby.core.prior.DeltaFunction(0., 'offset')
+        self.result.posterior['log_prior'] = 0.
+        self.result.posterior['a_squared'] = self.result.posterior['a'] ** 2
+        updated = self.result.update_with_data(self.new_transient, model=line_with_offset)
+        self.assertGreater(updated.meta_data['effective_sample_size'], 500)
+        self.assertFalse(any({'log_likelihood', 'log_prior', 'a_squared'} & keys for keys in parameters))
+
+    def test_original_result_unchanged(self):
+        posterior = self.result.posterior.copy()
+        self.result.update_with_data(self.new_transient, model=_line)
+        self.assertTrue(posterior.equals(self.result.posterior))
+        self.assertNotIn('effective_sample_size', self.result.meta_data)
+
+    def test_rerun_if_effective_sample_size_too_small(self):
+        inconsistent_transient = self._create_transient(self.time, 3 * self.time)
+        with mock.patch('redback.sampler.fit_model') as fit_model:
+            self.result.update_with_data(inconsistent_transient, model=_line)
+        fit_model.assert_called_once()
+        self.assertIs(inconsistent_transient, fit_model.call_args.kwargs['transient'])
+        self.assertEqual(os.path.abspath('update_with_data_test/updated'), fit_model.call_args.kwargs['outdir'])
+
+    def test_no_rerun(self):
+        inconsistent_transient = self._create_transient(self.time, 3 * self.time)
+        with mock.patch('redback.sampler.fit_model') as fit_model:
+            updated = self.result.update_with_data(inconsistent_transient, model=_line, rerun=False)
+        fit_model.assert_not_called()
+        self.assertLess(updated.meta_data['effective_sample_size'], 500)
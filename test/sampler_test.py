@@ -1,5 +1,8 @@
 import unittest
 
+import numpy as np
+
+import redback
 from redback import sampler
 
 
@@ -22,3 +25,63 @@ class TestFitModel(unittest.TestCase):
 
     def tearDown(self) -> None:
         pass
+
+
+class TestTriageModel(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.model = 'two_component_powerlaw'
+        self.truth = dict(a_1=1e-7, alpha_1=-0.7, delta_time_one=2e3, alpha_2=-1.8)
+        time = np.logspace(1, 5, 40)
+        flux = redback.model_library.all_models_dict[self.model](time, **self.truth)
+        flux_err = 0.05 * flux
+        flux = flux + np.random.default_rng(1).normal(0, 1, len(time)) * flux_err
+        self.transient = redback.transient.SGRB(
+            name='GRB050813', data_mode='flux', time=time, flux=flux, flux_err=flux_err)
+
+    def tearDown(self) -> None:
+        pass
+
+    def test_best_fit(self):
+        triage = sampler.triage_model(transient=self.transient, model=self.model, seed=1)
+        errors = np.sqrt(np.diag(triage.covariance))
+        for key, error in zip(triage.parameter_keys, errors):
+            self.assertLess(abs(triage.parameters[key] - self.truth[key]), 5 * error)
+
+    def test_information_criteria(self):
+        triage = sampler.triage_model(transient=self.transient, model=self.model, seed=1)
+        self.assertEqual(40, triage.n_data)
+        self.assertAlmostEqual(4 * np.log(40) - 2 * triage.max_log_likelihood, triage.bic)
+        self.assertTrue(np.isfinite(triage.log_laplace_evidence))
+        self.assertLess(triage.log_laplace_evidence, triage.max_log_likelihood)
+
+    def test_fit_model_triage(self):
+        triage = sampler.fit_model(transient=self.transient, model=self.model, sampler='triage', seed=1)
+        self.assertIsInstance(triage, sampler.TriageResult)
+
+    def test_no_search_parameters(self):
+        with self.assertRaises(ValueError):
+            sampler.triage_model(transient=self.transient, model=self.model, prior=dict())
+
+    def test_inverse_hessian_at_bound(self):
+        function = lambda x: np.sum((x - 0.2) ** 2 / 2e-2) + x[0] * x[1]
+        x = np.array([sampler._UNIT_CUBE_EDGE, 0.5])
+        points = []
+        covariance = sampler._inverse_hessian(lambda point: points.append(point) or function(point), x)
+        self.assertTrue(np.all((np.array(points) >= 0) & (np.array(points) <= 1)))
+        expected = np.linalg.inv(np.array([[100., 1.], [1., 100.]]))
+        np.testing.assert_allclose(covariance, expected, rtol=1e-5)
+
+    def test_inverse_hessian_not_positive_definite(self):
+        covariance = sampler._inverse_hessian(lambda x: -np.sum(x ** 2), np.array([0.5, 0.5]))
+        self.assertTrue(np.all(np.isnan(covariance)))
+
+    def test_inverse_hessian_penalised(self):
+        function = lambda x: sampler._PENALTY if x[0] < 0.5 else np.sum(x ** 2)
+        covariance = sampler._inverse_hessian(function, np.array([0.5, 0.5]))
+        self.assertTrue(np.all(np.isnan(covariance)))
+
+    def test_rank_models(self):
+        ranking = sampler.rank_models(transient=self.transient, models=['exponential_powerlaw', self.model], seed=1,
+                                      priors=dict(exponential_powerlaw=dict()))
+        self.assertListEqual([self.model], list(ranking['model']))
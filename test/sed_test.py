@@ -0,0 +1,44 @@
+import unittest
+
+import astropy.units as uu
+import numpy as np
+
+import redback
+from redback.transient_models import kilonova_models, supernova_models, tde_models
+
+
+class TestSpectraOutputFormat(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.time = np.array([1., 5., 5., 20., 60.])
+        self.lambda_array = np.geomspace(2000, 20000, 50)
+        self.models = [
+            (supernova_models.arnett, dict(redshift=0.05, f_nickel=0.1, mej=2., kappa=0.1, kappa_gamma=10.,
+                                           vej=1e4, temperature_floor=3000.)),
+            (supernova_models.slsn, dict(redshift=0.1, p0=2., bp=1., mass_ns=1.4, theta_pb=0.5, mej=5., kappa=0.1,
+                                         kappa_gamma=10., vej=8000., temperature_floor=5000.)),
+            (tde_models.tde_analytical, dict(redshift=0.05, l0=1e51, t_0=20., kappa=0.1, kappa_gamma=10., mej=1.,
+                                             vej=1e4, temperature_floor=1e4)),
+            (kilonova_models.one_component_kilonova_model, dict(redshift=0.01, mej=0.05, vej=0.2, kappa=3.,
+                                                                temperature_floor=3000.))]
+
+    def tearDown(self) -> None:
+        del self.time
+        del self.lambda_array
+        del self.models
+
+    def test_spectra_match_flux_density(self):
+        time, wavelength = np.meshgrid(self.time, self.lambda_array, indexing='ij')
+        for model, kwargs in self.models:
+            spectra = model(self.time, output_format='spectra', lambda_array=self.lambda_array, **kwargs)
+            self.assertEqual((len(self.time), len(self.lambda_array)), spectra.shape)
+            flux_density = model(time.ravel(), output_format='flux_density',
+                                 frequency=redback.utils.lambda_to_nu(wavelength.ravel()), **kwargs)
+            flux_density = (flux_density.reshape(time.shape) * uu.mJy).to(
+                uu.erg / uu.s / uu.cm ** 2 / uu.Angstrom, equivalencies=uu.spectral_density(wavelength * uu.Angstrom))
+            self.assertTrue(np.allclose(flux_density.value, spectra, rtol=1e-10), model.__name__)
+
+    def test_default_wavelengths(self):
+        model, kwargs = self.models[0]
+        spectra = model(self.time, output_format='spectra', **kwargs)
+        self.assertEqual((len(self.time), len(redback.sed.DEFAULT_LAMBDA_ARRAY)), spectra.shape)
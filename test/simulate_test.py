@@ -0,0 +1,66 @@
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from redback.simulate import Survey, simulate_population
+
+
+class TestSurvey(unittest.TestCase):
+
+    def test_from_cadence(self):
+        survey = Survey.from_cadence(bands=['g', 'r'], cadence=dict(g=2, r=5), limiting_magnitude=dict(g=24, r=23),
+                                     duration=10)
+        self.assertEqual(7, len(survey))
+        self.assertTrue(np.all(np.diff(survey.times) >= 0))
+        self.assertTrue(np.all(survey.limiting_magnitudes[survey.bands == 'r'] == 23))
+        self.assertEqual(len(set(survey.frequencies[survey.bands == 'g'])), 1)
+
+    def test_limiting_magnitude_sets_flux_density_errors(self):
+        survey = Survey(times=[0., 1.], bands=['g', 'g'], limiting_magnitudes=[20., 22.5], detection_threshold=5)
+        self.assertAlmostEqual(10., survey.flux_density_errors[0] / survey.flux_density_errors[1])
+
+    def test_unknown_band(self):
+        with self.assertRaises(ValueError):
+            Survey(times=[0.], bands=['not_a_band'], limiting_magnitudes=24.)
+
+
+class TestSimulatePopulation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.survey = Survey.from_cadence(bands=['g', 'r', 'i'], cadence=2, limiting_magnitude=24.5, duration=60)
+        rng = np.random.default_rng(0)
+        n = 12
+        self.parameters = pd.DataFrame(dict(
+            redshift=rng.uniform(0.01, 0.1, n), mej=rng.uniform(0.01, 0.1, n), vej=rng.uniform(0.1, 0.3, n),
+            kappa=rng.uniform(1, 10, n), temperature_floor=3000., t0=rng.uniform(0, 50, n)))
+        self.filename = 'simulate_test.csv'
+
+    def tearDown(self) -> None:
+        if os.path.isfile(self.filename):
+            os.remove(self.filename)
+
+    def test_simulate_population(self):
+        population = simulate_population('one_component_kilonova_model', self.parameters, self.survey,
+                                         max_time=20, seed=1, chunk_size=5)
+        self.assertEqual(len(self.parameters), len(population.summary))
+        self.assertEqual(0, population.n_failed)
+        self.assertGreater(population.throughput, 0)
+        observations = population.observations
+        self.assertTrue(np.all(observations['time_since_explosion'] > 0))
+        self.assertTrue(np.all(observations['time_since_explosion'] <= 20))
+        self.assertTrue(np.all(np.isnan(observations['magnitude'][~observations['detected']])))
+        n_detections = observations.groupby('event_id')['detected'].sum()
+        self.assertTrue(np.array_equal(n_detections.values, population.summary['n_detections'].values))
+
+    def test_results_do_not_depend_on_pool_and_stream_to_disk(self):
+        population = simulate_population('one_component_kilonova_model', self.parameters, self.survey,
+                                         max_time=20, seed=1, chunk_size=5)
+        streamed = simulate_population('one_component_kilonova_model', self.parameters, self.survey,
+                                       max_time=20, seed=1, chunk_size=5, npool=2, filename=self.filename)
+        self.assertIsNone(streamed.observations)
+        observations = pd.read_csv(self.filename)
+        self.assertEqual(len(population.observations), len(observations))
+        self.assertTrue(np.allclose(population.observations['flux_density'], observations['flux_density']))
+        pd.testing.assert_frame_equal(population.summary, streamed.summary)
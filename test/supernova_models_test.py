@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+from redback.transient_models import supernova_models
+
+try:
+    import sncosmo
+    sncosmo_available = True
+except ImportError:
+    sncosmo_available = False
+
+
+@unittest.skipUnless(sncosmo_available, "sncosmo is not installed")
+class TestSncosmoModels(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.time = np.linspace(-10, 40, 20)
+        self.frequency = np.tile([6.3e14, 4.8e14], 10)
+        self.kwargs = dict(frequency=self.frequency, output_format='magnitude', sncosmo_model='salt2',
+                           peak_abs_mag=-19.2, ebv=0.05)
+
+    def tearDown(self) -> None:
+        del self.time
+        del self.frequency
+        del self.kwargs
+
+    def _uncached(self, model_kwargs):
+        model = sncosmo.Model(source='salt2')
+        model.set(z=0.05, t0=0)
+        model.update(model_kwargs)
+        model.add_effect(sncosmo.CCM89Dust(), 'host', 'rest')
+        model.set(hostebv=0.05)
+        model.add_effect(sncosmo.F99Dust(), 'mw', 'obs')
+        model.set_source_peakabsmag(-19.2, band='standard::b', magsys='ab', cosmo=supernova_models.cosmo)
+        wavelength = 1e10 * 2.99792458e8 / self.frequency
+        flux = np.array([model.flux(t, w) for t, w in zip(self.time, wavelength)])
+        return -2.5 * np.log10(flux * wavelength ** 2 / 2.99792458e18 / 3631e-23)
+
+    def test_matches_uncached_model(self):
+        for model_kwargs in [dict(x1=0.5, c=0.1), dict(x1=-1., c=0.), dict(x1=0.5, c=0.1)]:
+            magnitude = supernova_models.sncosmo_models(self.time, redshift=0.05, model_kwargs=model_kwargs,
+                                                        **self.kwargs)
+            self.assertTrue(np.allclose(self._uncached(model_kwargs), magnitude, atol=1e-6))
+
+    def test_parameters_do_not_leak_between_calls(self):
+        default = supernova_models.sncosmo_models(self.time, redshift=0.05, model_kwargs=dict(), **self.kwargs)
+        supernova_models.sncosmo_models(self.time, redshift=0.05, model_kwargs=dict(x1=2.), **self.kwargs)
+        again = supernova_models.sncosmo_models(self.time, redshift=0.05, model_kwargs=dict(), **self.kwargs)
+        self.assertTrue(np.array_equal(default, again))
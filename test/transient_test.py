@@ -1,4 +1,6 @@
+import copy
 import os
+import pickle
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock
@@ -513,14 +515,28 @@ class TestAfterglow(unittest.TestCase):
         expected = "/tables/SGRB_table.txt"
         self.assertIn(expected, self.sgrb.event_table)
 
-    def test_meta_data_from_csv(self):
-        with mock.patch("pandas.read_csv") as m:
-            field_name = 'BAT Photon Index (15-150 keV) (PL = simple power-law, CPL = cutoff power-law)'
-            data_frame = pd.DataFrame.from_dict({field_name: [0, 1, np.nan]})
-            m.return_value = data_frame
-            expected = np.array([0, 1, 0])
-            self.sgrb._set_data()
-            self.assertTrue(np.array_equal(expected, np.array(self.sgrb.meta_data[field_name])))
+    def test_meta_data_from_catalogue(self):
+        self.sgrb._set_data()
+        self.assertEqual("070809", self.sgrb.meta_data['GRB'])
+
+    def test_meta_data_independent_between_instances(self):
+        sgrb = redback.transient.afterglow.SGRB(
+            time=self.time, time_err=self.time_err, flux_density=self.y, flux_density_err=self.y_err,
+            data_mode=self.data_mode, name=self.name, bands=self.bands)
+        self.assertEqual(self.sgrb.meta_data, sgrb.meta_data)
+        sgrb.meta_data['Redshift'] = '1.0'
+        self.assertNotEqual('1.0', self.sgrb.meta_data['Redshift'])
+
+    def test_pickle_round_trip(self):
+        sgrb = redback.transient.afterglow.SGRB(
+            time=self.time, time_err=self.time_err, flux_density=self.y, flux_density_err=self.y_err,
+            data_mode=self.data_mode, name=self.name, bands=self.bands)
+        for copied in [pickle.loads(pickle.dumps(sgrb)), copy.deepcopy(sgrb)]:
+            self.assertTrue(pd.Series(sgrb.meta_data).equals(pd.Series(copied.meta_data)))
+            self.assertTrue(np.array_equal(sgrb.x, copied.x))
+
+    def test_meta_data_missing(self):
+        self.assertIsNone(self.sgrb_not_existing.meta_data)
 
     def test_photon_index(self):
         self.assertEqual(1.69, self.sgrb.photon_index)